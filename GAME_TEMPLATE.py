@@ -21,11 +21,16 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from omnigames.core.base_game import BaseGame
+from omnigames.core.text_cache import text_cache
 
 
 class MyAwesomeGame(BaseGame):
     """Your custom game implementation."""
 
+    # For turn-based games: set to True to draw only after input or self.invalidate(),
+    # and keep self.animating True while something moves on its own
+    render_on_demand = False
+
     def __init__(self, user_id: int, game_name: str):
         """
         Initialize your game.
@@ -36,7 +41,6 @@ class MyAwesomeGame(BaseGame):
         """
         super().__init__(user_id, game_name)
         self.screen = None
-        self.clock = None
         self.score = 0
         # Add your game-specific attributes here
 
@@ -48,14 +52,16 @@ class MyAwesomeGame(BaseGame):
         Return True if initialization successful, False otherwise.
         """
         try:
-            pygame.init()
-            self.screen = pygame.display.set_mode((800, 600))
-            pygame.display.set_caption("My Awesome Game")
-            self.clock = pygame.time.Clock()
-            self.font = pygame.font.Font(None, 36)
+            # Not pygame.init() and pygame.display.set_mode: the launcher keeps pygame
+            # running between games and may show the game inside its own window
+            self.create_screen((800, 600), "My Awesome Game")
+            # Draw text with text_cache.render(text, size, color): rendered text is kept between frames
+            self.text_size = 36
             
             # Initialize your game resources here
             # Load images, sounds, setup game state, etc.
+            # self.load_image("player.png") and self.load_sound("hit.wav") read from
+            # this game's assets/ folder and share what is loaded between sessions
             
             return True
         except Exception as e:
@@ -76,15 +82,15 @@ class MyAwesomeGame(BaseGame):
             # Handle other keys
         elif event.type == pygame.MOUSEBUTTONDOWN:
             # Handle mouse clicks
-            pos = pygame.mouse.get_pos()
+            pos = event.pos
             # Do something with the position
 
     def update(self, dt: float) -> None:
         """
         Update game logic.
         
-        Called every frame.
-        dt = time elapsed since last frame in seconds
+        Called at a fixed rate (see fixed_dt), independent of the frame rate.
+        dt = the fixed step in seconds; multiply speeds in units per second by it
         """
         if self.paused:
             return
@@ -108,20 +114,21 @@ class MyAwesomeGame(BaseGame):
         self.screen.fill((0, 0, 0))  # Black background
         
         # Draw game elements
-        score_text = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
+        score_text = text_cache.render(f"Score: {self.score}", self.text_size, (255, 255, 255))
         self.screen.blit(score_text, (10, 10))
         
-        # Update display
-        pygame.display.flip()
+        # Update display (instead of pygame.display.flip)
+        self.present()
 
     def cleanup(self) -> None:
         """
         Clean up resources.
         
         Called when the game exits.
-        Close files, release resources, quit pygame, etc.
+        Close files, release resources, etc. Do not quit pygame: the next
+        game reuses it.
         """
-        pygame.quit()
+        pass
 
     def get_score(self) -> int:
         """
@@ -149,36 +156,8 @@ class MyAwesomeGame(BaseGame):
         self.score = state.get("score", 0)
         # Load other state variables
 
-    def run(self) -> int:
-        """
-        Main game loop.
-        
-        This is called to run your game. Don't override unless needed.
-        Returns the final score.
-        """
-        self.running = True
-        if not self.initialize():
-            return 0
-
-        try:
-            while self.running:
-                # Calculate delta time for frame-rate independent movement
-                dt = self.clock.tick(60) / 1000.0  # 60 FPS
-
-                # Handle events
-                for event in pygame.event.get():
-                    self.handle_event(event)
-
-                # Update game logic
-                if not self.paused:
-                    self.update(dt)
-
-                # Render
-                self.render()
-        finally:
-            self.cleanup()
-
-        return self.get_score()
+    # run() comes from BaseGame: a fixed-timestep loop capped at target_fps.
+    # Override it only if your game needs a different kind of loop.
 
 
 def main(user_id: int) -> int:
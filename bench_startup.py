@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for omniGames.
+
+Measures the import cost of the launcher with `python -X importtime` and the
+wall-clock time from process start to the first drawn menu window, then fails
+(exit code 1) when either is over budget.
+
+Usage:
+    python bench_startup.py [--runs N] [--import-budget-ms MS] [--window-budget-ms MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent
+ENTRY_MODULE = "omnigames.ui.menu"
+
+FIRST_WINDOW_SCRIPT = f"""
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print("NODISPLAY", flush=True)
+    raise SystemExit(0)
+from {ENTRY_MODULE} import MainMenu
+MainMenu(root)
+root.update()
+print("READY", flush=True)
+root.destroy()
+"""
+
+
+def measure_imports():
+    """Run one import of the launcher under -X importtime. Returns (total_us, rows)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {ENTRY_MODULE}"],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # Header line
+        name = parts[2].strip()
+        rows.append((self_us, cumulative_us, name))
+        if name == ENTRY_MODULE:
+            total = cumulative_us
+    return total, rows
+
+
+def measure_first_window():
+    """Start the launcher in a fresh interpreter. Returns ms until the menu is drawn, or None without display."""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", FIRST_WINDOW_SCRIPT], cwd=APP_DIR, stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline().strip()
+    elapsed = (time.perf_counter() - start) * 1000
+    process.wait()
+    if line != "READY":
+        return None
+    return elapsed
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="omniGames startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement (median is reported)")
+    parser.add_argument("--import-budget-ms", type=float, default=120.0, help="Budget for importing the launcher")
+    parser.add_argument("--window-budget-ms", type=float, default=1500.0, help="Budget for boot to first window")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("omniGames startup benchmark")
+    print("=" * 60)
+
+    import_times = []
+    slowest = {}
+    for _ in range(args.runs):
+        total, rows = measure_imports()
+        import_times.append(total / 1000)
+        for self_us, _, name in rows:
+            slowest[name] = min(slowest.get(name, self_us), self_us)
+    import_ms = statistics.median(import_times)
+
+    print(f"\nImport of {ENTRY_MODULE}: {import_ms:.1f} ms (budget {args.import_budget_ms:.0f} ms)")
+    print("Slowest modules (self time):")
+    for name, self_us in sorted(slowest.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {self_us / 1000:7.2f} ms  {name}")
+
+    window_times = [measure_first_window() for _ in range(args.runs)]
+    window_ms = None
+    if None in window_times:
+        print("\nBoot to first window: skipped (no display available)")
+    else:
+        window_ms = statistics.median(window_times)
+        print(f"\nBoot to first window: {window_ms:.1f} ms (budget {args.window_budget_ms:.0f} ms)")
+
+    failed = import_ms > args.import_budget_ms or (window_ms is not None and window_ms > args.window_budget_ms)
+    print("\n" + "=" * 60)
+    print("✗ Startup over budget!" if failed else "✓ Startup within budget.")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,6 @@
 """Memory Game for omniGames."""
 
 import pygame
-import random
 from typing import Dict, Any, List, Tuple
 import sys
 from pathlib import Path
@@ -9,11 +8,18 @@ import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from omnigames.core.base_game import BaseGame
+from omnigames.core.text_cache import text_cache
+from omnigames.core.rendering import LayerStack, StaticLayer
 
 
 class MemoryGame(BaseGame):
     """Memory/Matching game implementation."""
 
+    # Nothing moves between clicks: draw only after input or when a pair turns back
+    render_on_demand = True
+    # Seconds a mismatched pair stays face up
+    mismatch_seconds = 1.0
+
     def __init__(self, user_id: int, game_name: str, language: str = "en"):
         """Initialize Memory game with pygame resources."""
         super().__init__(user_id, game_name)
@@ -21,8 +27,7 @@ class MemoryGame(BaseGame):
         self.locales = {}
         self._load_locales()
         
-        # Initialize pygame and resources (do not change on restart)
-        pygame.init()
+        # Initialize resources (do not change on restart); create_screen() starts pygame if needed
         self.grid_cols = 4
         self.grid_rows = 4
         self.card_width = 100
@@ -30,20 +35,21 @@ class MemoryGame(BaseGame):
         self.card_spacing = 10
         width = self.grid_cols * (self.card_width + self.card_spacing) + self.card_spacing
         height = self.grid_rows * (self.card_height + self.card_spacing) + 100
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption(self._get_text("game_title", "Memory Game"))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.card_font = pygame.font.Font(None, 72)
+        self.create_screen((width, height), self._get_text("game_title", "Memory Game"))
+        self.text_size = 36
+        self.card_text_size = 72
+        # Face-down cards and card borders are drawn once; per frame only turned cards are drawn
+        self.layers = LayerStack(StaticLayer(self._draw_table, opaque=True))
         self.highest_score = 0
-        self.wait = 0
+        # Pending timer turning a mismatched pair back, or None
+        self.hide_timer = None
         # Initialize game state
         self.initialize()
 
     def _initialize_cards(self) -> None:
         """Initialize card grid."""
         numbers = list(range(1, (self.grid_cols * self.grid_rows) // 2 + 1)) * 2
-        random.shuffle(numbers)
+        self.rng.shuffle(numbers)
         self.cards = numbers
         self.revealed = [False] * len(self.cards)
         self.matched = [False] * len(self.cards)
@@ -79,6 +85,8 @@ class MemoryGame(BaseGame):
             self.click_locked = False
             self.moves = 0
             self.matched_count = 0
+            self.scheduler.cancel_all()
+            self.hide_timer = None
             self._initialize_cards()
             return True
         except Exception as e:
@@ -89,8 +97,8 @@ class MemoryGame(BaseGame):
         """Handle pygame events."""
         if event.type == pygame.QUIT:
             self.running = False
-        if self.wait > 0: 
-            return # we skip events while waiting
+        if self.hide_timer is not None:
+            return  # Clicks are ignored while a mismatched pair is shown
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.running = False
@@ -98,7 +106,7 @@ class MemoryGame(BaseGame):
                 self.initialize()
         elif event.type == pygame.MOUSEBUTTONDOWN and not self.click_locked:
             if not self.paused:
-                pos = pygame.mouse.get_pos()
+                pos = event.pos
                 col = pos[0] // (self.card_width + self.card_spacing)
                 row = pos[1] // (self.card_height + self.card_spacing)
 
@@ -115,16 +123,7 @@ class MemoryGame(BaseGame):
 
     def update(self, dt: float) -> None:
         """Update game state."""
-        # Wait before erasing cards
-        if self.wait > 0:
-            self.wait -= dt*1000
-        
-        if self.wait <= 0 and self.wait != -1000:
-            self.revealed = [matched for matched in self.matched]
-            self.wait = -1000
-            return
-
-        if self.paused or not self.click_locked or self.wait > 0:
+        if self.paused or not self.click_locked:
             return
 
         if self.first_click is not None and self.second_click is not None:
@@ -134,80 +133,67 @@ class MemoryGame(BaseGame):
                 self.matched[self.second_click] = True
                 self.matched_count += 1
                 self.score += 10
+                self.highest_score = max(self.highest_score, self.score // max(self.moves, 1))
             else:
-                self.wait = 1000
+                self.hide_timer = self.scheduler.after(self.mismatch_seconds, self._hide_mismatch)
 
             self.first_click = None
             self.second_click = None
             self.click_locked = False
 
+    def _hide_mismatch(self) -> None:
+        """Turn the shown pair face down again."""
+        self.revealed = [matched for matched in self.matched]
+        self.hide_timer = None
+        self.invalidate()
+
+    def _card_position(self, index: int) -> Tuple[int, int]:
+        """Top-left corner of a card on screen."""
+        row = index // self.grid_cols
+        col = index % self.grid_cols
+        x = col * (self.card_width + self.card_spacing) + self.card_spacing
+        y = row * (self.card_height + self.card_spacing) + self.card_spacing
+        return x, y
+
+    def _draw_table(self, surface: pygame.Surface, theme=None) -> None:
+        """Draw the static layer: background and every card face down, with its border."""
+        surface.fill((50, 50, 50))
+        for i in range(self.grid_cols * self.grid_rows):
+            x, y = self._card_position(i)
+            pygame.draw.rect(surface, (100, 100, 150), (x, y, self.card_width, self.card_height))
+            pygame.draw.rect(surface, (200, 200, 200), (x, y, self.card_width, self.card_height), 2)
+
     def render(self) -> None:
         """Render the game."""
-        self.screen.fill((50, 50, 50))
+        self.screen.blit(self.layers.compose(self.screen.get_size()), (0, 0))
 
-        # Draw cards
+        # Draw turned cards inside their borders; face-down cards are part of the layer
         for i in range(len(self.cards)):
-            row = i // self.grid_cols
-            col = i % self.grid_cols
-            x = col * (self.card_width + self.card_spacing) + self.card_spacing
-            y = row * (self.card_height + self.card_spacing) + self.card_spacing
-
-            # Draw card background
-            if self.matched[i]:
-                color = (100, 200, 100)
-            elif self.revealed[i]:
-                color = (200, 200, 200)
-            else:
-                color = (100, 100, 150)
-
-            pygame.draw.rect(self.screen, color, (x, y, self.card_width, self.card_height))
-            pygame.draw.rect(self.screen, (200, 200, 200), (x, y, self.card_width, self.card_height), 2)
+            if not (self.revealed[i] or self.matched[i]):
+                continue
+            x, y = self._card_position(i)
+            color = (100, 200, 100) if self.matched[i] else (200, 200, 200)
+            pygame.draw.rect(self.screen, color, (x + 2, y + 2, self.card_width - 4, self.card_height - 4))
 
             # Draw card number
-            if self.revealed[i] or self.matched[i]:
-                text = self.card_font.render(str(self.cards[i]), True, (0, 0, 0))
-                text_rect = text.get_rect(center=(x + self.card_width // 2, y + self.card_height // 2))
-                self.screen.blit(text, text_rect)
+            text = text_cache.render(str(self.cards[i]), self.card_text_size, (0, 0, 0))
+            text_rect = text.get_rect(center=(x + self.card_width // 2, y + self.card_height // 2))
+            self.screen.blit(text, text_rect)
 
         # Draw UI
         ui_y = self.grid_rows * (self.card_height + self.card_spacing) + self.card_spacing
-        score_text = self.font.render(f"Score: {self.score} | Moves: {self.moves}", True, (255, 255, 255))
+        score_text = text_cache.render(f"Score: {self.score} | Moves: {self.moves}", self.text_size, (255, 255, 255))
         self.screen.blit(score_text, (10, ui_y + 10))
-        self.highest_score = max(self.highest_score, self.score//(self.moves if self.moves>0 else 1))
 
         if self.matched_count == len(self.cards) // 2:
-            game_over_text = self.font.render("YOU WON! Press SPACE to restart", True, (0, 255, 0))
+            game_over_text = text_cache.render("YOU WON! Press SPACE to restart", self.text_size, (0, 255, 0))
             self.screen.blit(game_over_text, (50, ui_y + 50))
 
-        pygame.display.flip()
+        self.present()
 
     def cleanup(self) -> None:
-        """Cleanup resources."""
-        pygame.quit()
-
-    def run(self) -> int:
-        """Main game loop."""
-        self.running = True
-        if not self.initialize():
-            return 0
-
-        try:
-            while self.running:
-                dt = self.clock.tick(60) / 1000.0
-
-                for event in pygame.event.get():
-                    self.handle_event(event)
-
-                if not self.paused:
-                    self.update(dt)
-
-                self.render()
-                if self.first_click is not None and self.second_click is not None:
-                    pygame.time.delay(1000)  # 1 second delay to show cards
-        finally:
-            self.cleanup()
-
-        return self.get_score()
+        """Cleanup resources. pygame stays initialized for the next game."""
+        pass
 
     def get_score(self) -> int:
         """Return highest score."""
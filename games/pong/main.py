@@ -9,6 +9,7 @@ import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from omnigames.core.base_game import BaseGame
+from omnigames.core.text_cache import text_cache
 
 
 class PongGame(BaseGame):
@@ -21,24 +22,23 @@ class PongGame(BaseGame):
         self.locales = {}
         self._load_locales()
         
-        # Initialize pygame and resources (do not change on restart)
-        pygame.init()
+        # Initialize resources (do not change on restart); create_screen() starts pygame if needed
         self.width = 800
         self.height = 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption(self._get_text("game_title", "Pong"))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 72)
-        self.small_font = pygame.font.Font(None, 36)
+        self.create_screen((self.width, self.height), self._get_text("game_title", "Pong"))
+        self.score_text_size = 72
+        self.text_size = 36
+        # Only the moving objects and changed scores are redrawn each frame
+        self.create_renderer(self._create_background())
         
-        # Paddle properties
+        # Paddle properties (speeds in pixels per second)
         self.paddle_width = 15
         self.paddle_height = 90
-        self.paddle_speed = 5
+        self.paddle_speed = 300
         
         # Ball properties
         self.ball_size = 10
-        self.ball_speed = 5
+        self.ball_speed = 300
         
         # Initialize game state
         self.initialize()
@@ -81,8 +81,10 @@ class PongGame(BaseGame):
             # Ball
             self.ball_x = self.width // 2
             self.ball_y = self.height // 2
-            self.ball_dx = 5
-            self.ball_dy = 5
+            self.ball_dx = self.ball_speed
+            self.ball_dy = self.ball_speed
+            # Positions before the last update, drawn blended with the current ones
+            self._store_previous_positions()
             
             self.game_over = False
             return True
@@ -107,26 +109,35 @@ class PongGame(BaseGame):
             if event.key in (pygame.K_UP, pygame.K_DOWN):
                 self.player_dy = 0
 
+    def _store_previous_positions(self) -> None:
+        """Remember where moving objects are before an update, for interpolated drawing."""
+        self.previous_positions = (self.player_y, self.enemy_y, self.ball_x, self.ball_y)
+
+    def _interpolated(self, previous: float, current: float) -> int:
+        """Position between the last two updates at the current render alpha."""
+        return int(previous + (current - previous) * self.alpha)
+
     def update(self, dt: float) -> None:
         """Update game state."""
         if self.paused:
             return
+        self._store_previous_positions()
 
         # Update player paddle
-        self.player_y += self.player_dy
+        self.player_y += self.player_dy * dt
         self.player_y = max(0, min(self.height - self.paddle_height, self.player_y))
 
         # AI enemy movement
         enemy_center = self.enemy_y + self.paddle_height // 2
         if enemy_center < self.ball_y - 20:
-            self.enemy_y += self.paddle_speed
+            self.enemy_y += self.paddle_speed * dt
         elif enemy_center > self.ball_y + 20:
-            self.enemy_y -= self.paddle_speed
+            self.enemy_y -= self.paddle_speed * dt
         self.enemy_y = max(0, min(self.height - self.paddle_height, self.enemy_y))
 
         # Update ball
-        self.ball_x += self.ball_dx
-        self.ball_y += self.ball_dy
+        self.ball_x += self.ball_dx * dt
+        self.ball_y += self.ball_dy * dt
 
         # Ball collision with top/bottom
         if self.ball_y <= 0 or self.ball_y >= self.height - self.ball_size:
@@ -153,11 +164,13 @@ class PongGame(BaseGame):
             self.enemy_score += 1
             self.ball_x = self.width // 2
             self.ball_y = self.height // 2
+            self._store_previous_positions()
 
         if self.ball_x > self.width:
             self.score += 1
             self.ball_x = self.width // 2
             self.ball_y = self.height // 2
+            self._store_previous_positions()
 
         # Check if game over (first to 5)
         if self.score >= 5:
@@ -165,65 +178,48 @@ class PongGame(BaseGame):
         elif self.enemy_score >= 5:
             self.game_over = True
 
-    def render(self) -> None:
-        """Render the game."""
-        self.screen.fill((0, 0, 0))
-
+    def _create_background(self) -> pygame.Surface:
+        """Draw the parts of the court that never change."""
+        background = pygame.Surface((self.width, self.height)).convert()
+        background.fill((0, 0, 0))
         # Draw center line
         for y in range(0, self.height, 10):
-            pygame.draw.line(self.screen, (255, 255, 255), (self.width // 2, y), (self.width // 2, y + 5), 2)
+            pygame.draw.line(background, (255, 255, 255), (self.width // 2, y), (self.width // 2, y + 5), 2)
+        return background
 
-        # Draw paddles
-        pygame.draw.rect(
-            self.screen, (255, 255, 255), (self.player_x, self.player_y, self.paddle_width, self.paddle_height)
-        )
-        pygame.draw.rect(
-            self.screen, (255, 255, 255), (self.enemy_x, self.enemy_y, self.paddle_width, self.paddle_height)
-        )
+    def render(self) -> None:
+        """Render the game."""
+        # Draw paddles and ball between their last two simulated positions
+        previous_player_y, previous_enemy_y, previous_ball_x, previous_ball_y = self.previous_positions
+        player_y = self._interpolated(previous_player_y, self.player_y)
+        enemy_y = self._interpolated(previous_enemy_y, self.enemy_y)
+        ball_x = self._interpolated(previous_ball_x, self.ball_x)
+        ball_y = self._interpolated(previous_ball_y, self.ball_y)
+        renderer = self.renderer
+        renderer.draw_rect("player", (255, 255, 255), (self.player_x, player_y, self.paddle_width, self.paddle_height))
+        renderer.draw_rect("enemy", (255, 255, 255), (self.enemy_x, enemy_y, self.paddle_width, self.paddle_height))
 
         # Draw ball
-        pygame.draw.rect(self.screen, (255, 255, 255), (self.ball_x, self.ball_y, self.ball_size, self.ball_size))
+        renderer.draw_rect("ball", (255, 255, 255), (ball_x, ball_y, self.ball_size, self.ball_size))
 
         # Draw scores
-        player_text = self.font.render(str(self.score), True, (255, 255, 255))
-        enemy_text = self.font.render(str(self.enemy_score), True, (255, 255, 255))
-        self.screen.blit(player_text, (self.width // 4, 20))
-        self.screen.blit(enemy_text, (3 * self.width // 4, 20))
+        player_text = text_cache.render(str(self.score), self.score_text_size, (255, 255, 255))
+        enemy_text = text_cache.render(str(self.enemy_score), self.score_text_size, (255, 255, 255))
+        renderer.blit("player_score", player_text, (self.width // 4, 20), token=self.score)
+        renderer.blit("enemy_score", enemy_text, (3 * self.width // 4, 20), token=self.enemy_score)
 
         if self.game_over:
             if self.score >= 5:
-                winner_text = self.small_font.render("YOU WON! Press SPACE to restart", True, (0, 255, 0))
+                winner_text = text_cache.render("YOU WON! Press SPACE to restart", self.text_size, (0, 255, 0))
             else:
-                winner_text = self.small_font.render("YOU LOST! Press SPACE to restart", True, (255, 0, 0))
-            self.screen.blit(winner_text, (150, self.height // 2))
+                winner_text = text_cache.render("YOU LOST! Press SPACE to restart", self.text_size, (255, 0, 0))
+            renderer.blit("winner", winner_text, (150, self.height // 2), token=self.score >= 5)
 
-        pygame.display.flip()
+        self.present()
 
     def cleanup(self) -> None:
-        """Cleanup resources."""
-        pygame.quit()
-
-    def run(self) -> int:
-        """Main game loop."""
-        self.running = True
-        if not self.initialize():
-            return 0
-
-        try:
-            while self.running:
-                dt = self.clock.tick(60) / 1000.0
-
-                for event in pygame.event.get():
-                    self.handle_event(event)
-
-                if not self.paused:
-                    self.update(dt)
-
-                self.render()
-        finally:
-            self.cleanup()
-
-        return self.get_score()
+        """Cleanup resources. pygame stays initialized for the next game."""
+        pass
 
     def get_score(self) -> int:
         """Return current score."""
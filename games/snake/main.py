@@ -1,7 +1,6 @@
 """Snake Game for omniGames."""
 
 import pygame
-import random
 from typing import Dict, Any, List, Tuple
 import sys
 from pathlib import Path
@@ -9,11 +8,17 @@ import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from omnigames.core.base_game import BaseGame
+from omnigames.core.text_cache import text_cache
+from omnigames.core.rendering import LayerStack, StaticLayer
 
 
 class SnakeGame(BaseGame):
     """Classic Snake game implementation."""
 
+    # One cell per step, one step per frame
+    target_fps = 10
+    fixed_dt = 1.0 / 10
+
     def __init__(self, user_id: int, game_name: str, language: str = "en"):
         """Initialize Snake game with pygame resources."""
         super().__init__(user_id, game_name)
@@ -22,17 +27,18 @@ class SnakeGame(BaseGame):
         self.locales = {}
         self._load_locales()
         
-        # Initialize pygame and resources (do not change on restart)
-        pygame.init()
+        # Initialize resources (do not change on restart); create_screen() starts pygame if needed
         self.grid_size = 20
         self.grid_width = 40
         self.grid_height = 30
         width = self.grid_width * self.grid_size
         height = self.grid_height * self.grid_size + 50
-        self.screen = pygame.display.set_mode((width, height))
-        pygame.display.set_caption(self._get_text("game_title", "Snake Game"))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
+        self.create_screen((width, height), self._get_text("game_title", "Snake Game"))
+        self.text_size = 36
+        # The grid and HUD frame are drawn once; per frame only the cells that
+        # changed are redrawn, usually the head, the tail and the food
+        self.layers = LayerStack(StaticLayer(self._draw_grid, opaque=True), StaticLayer(self._draw_hud_frame))
+        self.create_renderer(self.layers.compose(self.screen.get_size()))
         
         # Initialize game state
         self.initialize()
@@ -59,7 +65,7 @@ class SnakeGame(BaseGame):
     def _spawn_food(self) -> Tuple[int, int]:
         """Spawn food at random location not occupied by snake."""
         while True:
-            food = (random.randint(0, self.grid_width - 1), random.randint(0, self.grid_height - 1))
+            food = (self.rng.randint(0, self.grid_width - 1), self.rng.randint(0, self.grid_height - 1))
             if food not in self.snake:
                 return food
 
@@ -128,75 +134,55 @@ class SnakeGame(BaseGame):
         else:
             self.snake.pop()
 
-    def render(self) -> None:
-        """Render the game."""
-        self.screen.fill((0, 0, 0))
-
-        # Draw grid
+    def _draw_grid(self, surface: pygame.Surface, theme=None) -> None:
+        """Draw the background grid layer."""
+        surface.fill((0, 0, 0))
         for x in range(self.grid_width):
             for y in range(self.grid_height):
                 rect = pygame.Rect(x * self.grid_size, y * self.grid_size, self.grid_size, self.grid_size)
-                pygame.draw.rect(self.screen, (30, 30, 30), rect, 1)
+                pygame.draw.rect(surface, (30, 30, 30), rect, 1)
 
-        # Draw snake
-        for segment in self.snake:
-            rect = pygame.Rect(
-                segment[0] * self.grid_size + 1,
-                segment[1] * self.grid_size + 1,
-                self.grid_size - 2,
-                self.grid_size - 2,
-            )
-            pygame.draw.rect(self.screen, (0, 255, 0), rect)
+    def _draw_hud_frame(self, surface: pygame.Surface, theme=None) -> None:
+        """Draw the line separating the board from the score area."""
+        ui_y = self.grid_height * self.grid_size
+        pygame.draw.line(surface, (100, 100, 100), (0, ui_y), (self.grid_width * self.grid_size, ui_y))
 
-        # Draw food
-        food_rect = pygame.Rect(
-            self.food[0] * self.grid_size + 1,
-            self.food[1] * self.grid_size + 1,
+    def _cell_rect(self, cell: Tuple[int, int]) -> pygame.Rect:
+        """Screen rectangle of a snake segment or food in a grid cell."""
+        return pygame.Rect(
+            cell[0] * self.grid_size + 1,
+            cell[1] * self.grid_size + 1,
             self.grid_size - 2,
             self.grid_size - 2,
         )
-        pygame.draw.rect(self.screen, (255, 0, 0), food_rect)
+
+    def render(self) -> None:
+        """Render the game."""
+        renderer = self.renderer
+
+        # Draw snake; segments are keyed by cell, so only the head and tail change between frames
+        for segment in self.snake:
+            renderer.draw_rect(("segment", segment), (0, 255, 0), self._cell_rect(segment))
+
+        # Draw food
+        renderer.draw_rect("food", (255, 0, 0), self._cell_rect(self.food))
 
         # Draw UI
         ui_y = self.grid_height * self.grid_size
-        pygame.draw.line(self.screen, (100, 100, 100), (0, ui_y), (self.grid_width * self.grid_size, ui_y))
-
         score_label = self._get_text("score", "Score")
-        score_text = self.font.render(f"{score_label}: {self.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, ui_y + 10))
+        score_text = text_cache.render(f"{score_label}: {self.score}", self.text_size, (255, 255, 255))
+        renderer.blit("score", score_text, (10, ui_y + 10), token=self.score)
 
         if self.game_over:
             game_over_msg = self._get_text("game_over", "GAME OVER!") + " " + self._get_text("restart", "Press SPACE to restart")
-            game_over_text = self.font.render(game_over_msg, True, (255, 0, 0))
-            self.screen.blit(game_over_text, (50, ui_y + 10))
+            game_over_text = text_cache.render(game_over_msg, self.text_size, (255, 0, 0))
+            renderer.blit("game_over", game_over_text, (50, ui_y + 10), token=game_over_msg)
 
-        pygame.display.flip()
+        self.present()
 
     def cleanup(self) -> None:
-        """Cleanup resources."""
-        pygame.quit()
-
-    def run(self) -> int:
-        """Main game loop."""
-        self.running = True
-        if not self.initialize():
-            return 0
-
-        try:
-            while self.running:
-                dt = self.clock.tick(10) / 1000.0  # 10 FPS for snake
-
-                for event in pygame.event.get():
-                    self.handle_event(event)
-
-                if not self.paused:
-                    self.update(dt)
-
-                self.render()
-        finally:
-            self.cleanup()
-
-        return self.get_score()
+        """Cleanup resources. pygame stays initialized for the next game."""
+        pass
 
     def get_score(self) -> int:
         """Return current score."""
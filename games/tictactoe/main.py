@@ -8,11 +8,16 @@ import json
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from omnigames.core.base_game import BaseGame
+from omnigames.core.text_cache import text_cache
+from omnigames.core.rendering import LayerStack, StaticLayer
 
 
 class TicTacToeGame(BaseGame):
     """Tic Tac Toe game implementation with AI opponent."""
 
+    # Nothing moves between turns: draw only after input, sleep otherwise
+    render_on_demand = True
+
     def __init__(self, user_id: int, game_name: str, language: str = "en"):
         """Initialize Tic Tac Toe game with pygame resources."""
         super().__init__(user_id, game_name)
@@ -20,14 +25,13 @@ class TicTacToeGame(BaseGame):
         self.locales = {}
         self._load_locales()
         
-        # Initialize pygame and resources (do not change on restart)
-        pygame.init()
+        # Initialize resources (do not change on restart); create_screen() starts pygame if needed
         self.cell_size = 150
-        self.screen = pygame.display.set_mode((600, 700))
-        pygame.display.set_caption(self._get_text("game_title", "Tic Tac Toe"))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 72)
+        self.create_screen((600, 700), self._get_text("game_title", "Tic Tac Toe"))
+        self.text_size = 36
+        self.mark_text_size = 72
+        # Title and board lines are drawn once, then shown with a single blit per frame
+        self.layers = LayerStack(StaticLayer(self._draw_board, opaque=True))
         self.game_wons = 0
         
         # Initialize game state
@@ -77,7 +81,7 @@ class TicTacToeGame(BaseGame):
                 self.initialize()
         elif event.type == pygame.MOUSEBUTTONDOWN and not self.game_over:
             if not self.paused:
-                pos = pygame.mouse.get_pos()
+                pos = event.pos
                 col = pos[0] // self.cell_size
                 row = (pos[1] - 50) // self.cell_size
                 if 0 <= row < 3 and 0 <= col < 3 and self.board[row][col] == 0:
@@ -185,59 +189,46 @@ class TicTacToeGame(BaseGame):
         """Update game state."""
         pass
 
-    def render(self) -> None:
-        """Render the game."""
-        self.screen.fill((240, 240, 240))
+    def _draw_board(self, surface: pygame.Surface, theme=None) -> None:
+        """Draw the static layer: background, title and board lines."""
+        surface.fill((240, 240, 240))
 
         # Draw title
-        title = self.font.render("Tic Tac Toe", True, (0, 0, 0))
-        self.screen.blit(title, (200, 10))
+        title = text_cache.render("Tic Tac Toe", self.text_size, (0, 0, 0))
+        surface.blit(title, (200, 10))
 
         # Draw board
+        for i in range(3):
+            for j in range(3):
+                rect = pygame.Rect(j * self.cell_size, 50 + i * self.cell_size, self.cell_size, self.cell_size)
+                pygame.draw.rect(surface, (200, 200, 200), rect, 2)
+
+    def render(self) -> None:
+        """Render the game."""
+        self.screen.blit(self.layers.compose(self.screen.get_size()), (0, 0))
+
+        # Draw marks
         for i in range(3):
             for j in range(3):
                 x = j * self.cell_size
                 y = 50 + i * self.cell_size
-                rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                pygame.draw.rect(self.screen, (200, 200, 200), rect, 2)
-
                 cell_value = self.board[i][j]
                 if cell_value == 1:
-                    text = self.large_font.render("X", True, (0, 0, 255))
+                    text = text_cache.render("X", self.mark_text_size, (0, 0, 255))
                     self.screen.blit(text, (x + 40, y + 30))
                 elif cell_value == -1:
-                    text = self.large_font.render("O", True, (255, 0, 0))
+                    text = text_cache.render("O", self.mark_text_size, (255, 0, 0))
                     self.screen.blit(text, (x + 40, y + 30))
 
         # Draw message
-        message_text = self.font.render(self.message, True, (0, 0, 0))
+        message_text = text_cache.render(self.message, self.text_size, (0, 0, 0))
         self.screen.blit(message_text, (50, 600))
 
-        pygame.display.flip()
+        self.present()
 
     def cleanup(self) -> None:
-        """Cleanup resources."""
-        pygame.quit()
-
-    def run(self) -> int:
-        """Main game loop."""
-        self.running = True
-        if not self.initialize():
-            return 0
-
-        try:
-            while self.running:
-                dt = self.clock.tick(60) / 1000.0
-
-                for event in pygame.event.get():
-                    self.handle_event(event)
-
-                self.update(dt)
-                self.render()
-        finally:
-            self.cleanup()
-
-        return self.get_score()
+        """Cleanup resources. pygame stays initialized for the next game."""
+        pass
 
     def get_score(self) -> int:
         """Return current score."""
@@ -1,6 +1,5 @@
 """Wordle-style Game for omniGames (console-friendly)."""
 
-import random
 import sys
 from pathlib import Path
 from typing import List, Dict, Any
@@ -70,7 +69,7 @@ class WordleGame(BaseGame):
         if not self.words:
             return False
 
-        self.secret = random.choice(self.words)
+        self.secret = self.rng.choice(self.words)
         self.attempts = []
         self.score_value = 0
         return True
@@ -1,6 +1,14 @@
 """omniGames - A multi-user game launcher platform."""
 
-from omnigames.ui.menu import main
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Command-line mode, no display needed
+        from omnigames.cli import main as cli_main
+
+        sys.exit(cli_main())
+
+    from omnigames.ui.menu import main
+
     main()
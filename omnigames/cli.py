@@ -0,0 +1,213 @@
+"""Command-line interface for omniGames, usable without a display server."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from omnigames.core import launcher
+from omnigames.core.profiler import PHASES
+
+
+def _select_user(username: str) -> bool:
+    """Select the user a command runs as."""
+    if launcher.select_user(username) is None:
+        print(f"✗ Unknown user '{username}' (create it with: add-user {username})")
+        return False
+    return True
+
+
+def cmd_users(args) -> int:
+    """List user profiles."""
+    for user in launcher.get_users():
+        print(user["username"])
+    return 0
+
+
+def cmd_add_user(args) -> int:
+    """Create a user profile."""
+    success, message = launcher.create_user(args.username)
+    print(("✓ " if success else "✗ ") + message)
+    return 0 if success else 1
+
+
+def cmd_list(args) -> int:
+    """List installed games."""
+    for game in launcher.get_games(args.search or ""):
+        status = "  [damaged]" if game.get("problems") else ""
+        print(f"{game['name']:<16} {game.get('version', ''):<8} {game.get('title', '')}{status}")
+    return 0
+
+
+def cmd_install(args) -> int:
+    """Install games from ZIP files."""
+    failed = 0
+    for zip_path in args.zip:
+        success, message = launcher.install_game(zip_path)
+        print(("✓ " if success else "✗ ") + message)
+        failed += not success
+    return 1 if failed else 0
+
+
+def cmd_sync(args) -> int:
+    """Install or update games from a package repository."""
+    results = launcher.sync_games(args.source, args.games or None)
+    for game_name, success, message in results:
+        print(("✓ " if success else "✗ ") + f"{game_name}: {message}")
+    return 0 if all(success for _, success, _ in results) else 1
+
+
+def cmd_rollback(args) -> int:
+    """Switch a game back to its previous version."""
+    success, message = launcher.rollback_game(args.game)
+    print(("✓ " if success else "✗ ") + message)
+    return 0 if success else 1
+
+
+def cmd_launch(args) -> int:
+    """Run a game one or more times and print each session's result."""
+    if not _select_user(args.user):
+        return 1
+    if args.lang:
+        launcher.set_language(args.lang)
+
+    failed = 0
+    for run in range(1, args.repeat + 1):
+        result = launcher.run_game(args.game, trace_memory=args.trace_memory, profile_frames=args.profile_frames)
+        if result.get("error"):
+            failed += 1
+            print(f"✗ Run {run}: {result['error'].strip()}")
+            continue
+        summary = result.get("telemetry") or {}
+        print(
+            f"✓ Run {run}: score {result['score']}, {result['playtime']:.1f}s, "
+            f"first frame {summary.get('first_frame_ms')} ms, p95 {summary.get('p95_ms')} ms"
+        )
+        profile = result.get("profile")
+        if profile and profile["fps"]:
+            phases = ", ".join(f"{phase} {profile[phase]['mean_ms']:.2f} ms" for phase in PHASES)
+            print(f"  Frame phases: {phases} (frame p99 {profile['frame_p99_ms']:.1f} ms)")
+            text = profile["text_cache"]
+            print(f"  Text cache: {text['hit_rate']:.0%} hits, {text['entries']} surfaces")
+            for path in profile["captures"]:
+                print(f"  Profile written to {path}")
+        memory = result.get("memory")
+        if memory:
+            print(f"  Retained after unload: {memory['retained_kb']} KiB")
+            for entry in memory["top"][:3]:
+                print(f"    {entry['kb']:>8} KiB  {entry['where']}")
+    return 1 if failed else 0
+
+
+def cmd_simulate(args) -> int:
+    """Run a game headless as fast as possible and print its result."""
+    from omnigames.core.headless import load_script
+
+    inputs = load_script(Path(args.script)) if args.script else []
+    started = time.perf_counter()
+    result = launcher.simulate_game(args.game, args.duration, args.seed, inputs, args.render_every)
+    elapsed = time.perf_counter() - started
+    if result.get("error"):
+        print(f"✗ {result['error'].strip()}")
+        return 1
+    print(
+        f"✓ Score {result['score']} after {result['game_seconds']:.1f} game-seconds "
+        f"({result['steps']} steps) in {elapsed:.2f}s, {result['game_seconds'] / max(elapsed, 1e-9):.0f}x real time"
+    )
+    return 0
+
+
+def cmd_report(args) -> int:
+    """Print a user's statistics or export recorded sessions as CSV."""
+    user_id = None
+    if args.user:
+        if not _select_user(args.user):
+            return 1
+        user_id = launcher.current_user["id"]
+
+    if args.csv:
+        count = launcher.export_report(Path(args.csv), user_id)
+        print(f"✓ {count} sessions written to {args.csv}")
+        return 0
+    if user_id is None:
+        print("✗ --user is required unless --csv is given")
+        return 1
+
+    for stat in launcher.get_report(user_id):
+        print(f"{stat['game_name'].upper()}")
+        print(f"  High score: {stat['high_score']}  Times played: {stat['times_played']}")
+        sessions = stat["sessions"]
+        if sessions and sessions["avg_first_frame_ms"] is not None:
+            print(
+                f"  Load: {sessions['avg_first_frame_ms']:.0f} ms  FPS: {sessions['avg_fps']:.0f}  "
+                f"p95: {sessions['avg_p95_ms']:.1f} ms  Dropped: {sessions['dropped_frames']}"
+            )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="omnigames", description="omniGames launcher")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("users", help="list user profiles").set_defaults(func=cmd_users)
+
+    add_user = commands.add_parser("add-user", help="create a user profile")
+    add_user.add_argument("username")
+    add_user.set_defaults(func=cmd_add_user)
+
+    list_games = commands.add_parser("list", help="list installed games")
+    list_games.add_argument("--search", help="catalog search query, e.g. 'lang:es puzzle'")
+    list_games.set_defaults(func=cmd_list)
+
+    install = commands.add_parser("install", help="install games from ZIP files")
+    install.add_argument("zip", nargs="+")
+    install.set_defaults(func=cmd_install)
+
+    sync = commands.add_parser("sync", help="install or update games from a repository URL or directory")
+    sync.add_argument("source")
+    sync.add_argument("games", nargs="*", help="only these games (default: all)")
+    sync.set_defaults(func=cmd_sync)
+
+    rollback = commands.add_parser("rollback", help="switch a game back to its previous version")
+    rollback.add_argument("game")
+    rollback.set_defaults(func=cmd_rollback)
+
+    launch = commands.add_parser("launch", help="run a game")
+    launch.add_argument("game")
+    launch.add_argument("--user", required=True, help="user profile to play as")
+    launch.add_argument("--lang", help="language code, e.g. en or es")
+    launch.add_argument("--repeat", type=int, default=1, help="number of sessions to run back to back")
+    launch.add_argument(
+        "--trace-memory", action="store_true", help="report memory each session leaves behind (slower)"
+    )
+    launch.add_argument(
+        "--profile-frames", type=int, default=0, metavar="N", help="record the first N frames with cProfile (.pstats)"
+    )
+    launch.set_defaults(func=cmd_launch)
+
+    simulate = commands.add_parser("simulate", help="run a game headless and unthrottled, e.g. for benchmarks")
+    simulate.add_argument("game")
+    simulate.add_argument("--duration", type=float, default=60.0, help="game-seconds to simulate (default: 60)")
+    simulate.add_argument("--seed", type=int, default=0, help="random seed; equal seeds replay identically")
+    simulate.add_argument("--script", help='JSON input script, e.g. [{"t": 0.5, "kind": "key_down", "key": "up"}]')
+    simulate.add_argument("--render-every", type=int, default=0, help="render every Nth step offscreen (default: never)")
+    simulate.set_defaults(func=cmd_simulate)
+
+    report = commands.add_parser("report", help="show statistics or export sessions")
+    report.add_argument("--user", help="user profile (default with --csv: everyone)")
+    report.add_argument("--csv", help="write recorded sessions to this CSV file")
+    report.set_defaults(func=cmd_report)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,11 @@
 """Core module for omniGames."""
 from .database import db, Database
-from .config import localization, LocalizationManager, GAMES_PATH, ASSETS_PATH
+from .config import localization, LocalizationManager, GAMES_PATH, ASSETS_PATH, CACHE_PATH
+from .thumbnails import thumbnail_cache, ThumbnailCache, THUMBNAIL_SIZES
 from .game_manager import game_manager, GameManager
+from .integrity import integrity_verifier, IntegrityVerifier
+from .launcher import launcher, LauncherService
+from .preloader import game_preloader, GamePreloader
 
 __all__ = [
     "db",
@@ -10,6 +14,16 @@ __all__ = [
     "LocalizationManager",
     "game_manager",
     "GameManager",
+    "thumbnail_cache",
+    "ThumbnailCache",
+    "THUMBNAIL_SIZES",
+    "integrity_verifier",
+    "IntegrityVerifier",
+    "launcher",
+    "LauncherService",
+    "game_preloader",
+    "GamePreloader",
     "GAMES_PATH",
     "ASSETS_PATH",
+    "CACHE_PATH",
 ]
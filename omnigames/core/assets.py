@@ -0,0 +1,239 @@
+"""Shared, reference-counted game assets: fonts, display-format images and sounds."""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+# Games keep their assets in this folder of their package
+ASSET_DIR_NAME = "assets"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp")
+SOUND_EXTENSIONS = (".wav", ".ogg", ".mp3", ".flac")
+# Files in a game's assets folder that are for the launcher, not the game
+PRELOAD_SKIP = ("thumbnail.png",)
+# Unreferenced assets are evicted, least recently used first, above this size
+MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+class Asset:
+    """One loaded asset and the sessions using it."""
+
+    def __init__(self, kind: str, value: Any, size_bytes: int):
+        """Initialize asset."""
+        self.kind = kind
+        self.value = value
+        self.size_bytes = size_bytes
+        self.owners: Set[Hashable] = set()
+
+
+def _image_size(surface: Any) -> int:
+    """Bytes of pixel data held by a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+def _sound_size(sound: Any) -> int:
+    """Bytes of decoded samples held by a sound."""
+    import pygame
+
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+
+class AssetManager:
+    """
+    Load game assets once and share them between sessions.
+
+    Assets are keyed by file, so games and sessions asking for the same file
+    get the same object. Each session that asks for an asset holds a
+    reference until release(); assets nobody references stay cached for the
+    next session and are evicted least recently used first once the cache
+    outgrows its memory budget. preload() decodes files on a worker thread;
+    images are converted to the display format on first use.
+    """
+
+    def __init__(self, budget_bytes: int = MEMORY_BUDGET_BYTES, max_workers: int = 1):
+        """Initialize empty asset manager."""
+        self.budget_bytes = budget_bytes
+        self.max_workers = max_workers
+        self._assets: "OrderedDict[Tuple[Hashable, ...], Asset]" = OrderedDict()
+        self._decoding: Dict[Tuple[str, str], "Future"] = {}
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._lock = threading.Lock()
+        self.loaded_bytes = 0
+
+    # Lookup
+    def font(self, size: int, name: Optional[str] = None, owner: Hashable = None) -> Any:
+        """Get a font by size; name is a font file, None for pygame's default font."""
+        import pygame
+
+        key = ("font", name, size)
+        asset = self._lookup(key, owner)
+        if asset is None:
+            font = pygame.font.Font(name, size)
+            asset = self._add(key, Asset("font", font, os.path.getsize(name) if name else 0), owner)
+        return asset.value
+
+    def image(self, path: Path, owner: Hashable = None, alpha: bool = True) -> Any:
+        """
+        Get an image converted to the display's pixel format (with per-pixel
+        alpha unless alpha=False). Before the display exists it is returned as decoded.
+        """
+        import pygame
+
+        path = os.path.realpath(path)
+        converted = pygame.display.get_surface() is not None
+        key = ("image", path, alpha, converted)
+        asset = self._lookup(key, owner)
+        if asset is None:
+            surface = self._decoded("image", path)
+            if converted:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            asset = self._add(key, Asset("image", surface, _image_size(surface)), owner)
+        return asset.value
+
+    def sound(self, path: Path, owner: Hashable = None) -> Any:
+        """Get a sound; the mixer must be initialized."""
+        path = os.path.realpath(path)
+        key = ("sound", path)
+        asset = self._lookup(key, owner)
+        if asset is None:
+            sound = self._decoded("sound", path)
+            asset = self._add(key, Asset("sound", sound, _sound_size(sound)), owner)
+        return asset.value
+
+    # Background decoding
+    def preload(self, directory: Path) -> int:
+        """
+        Start decoding every image and sound in a directory on a worker thread,
+        except files already loaded. Decodes the game has not asked for by the
+        end of its session are dropped by release().
+        Returns the number of files queued; missing directories queue nothing.
+        """
+        cached = {key[:2] for key in self._assets}
+        queued = 0
+        for root, dirs, names in os.walk(directory):
+            dirs.sort()
+            for name in sorted(names):
+                if name in PRELOAD_SKIP:
+                    continue
+                extension = os.path.splitext(name)[1].lower()
+                if extension in IMAGE_EXTENSIONS:
+                    kind = "image"
+                elif extension in SOUND_EXTENSIONS:
+                    kind = "sound"
+                else:
+                    continue
+                path = os.path.realpath(os.path.join(root, name))
+                if (kind, path) in cached:
+                    continue
+                self._decode_async(kind, path)
+                queued += 1
+        return queued
+
+    def _decode_async(self, kind: str, path: str) -> "Future":
+        """Queue one file for decoding, unless it is already queued."""
+        with self._lock:
+            future = self._decoding.get((kind, path))
+            if future is None:
+                if self._executor is None:
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="assets")
+                future = self._executor.submit(_decode, kind, path)
+                self._decoding[(kind, path)] = future
+        return future
+
+    def _decoded(self, kind: str, path: str) -> Any:
+        """Get a decoded file, waiting for a preload of it or decoding it right away."""
+        with self._lock:
+            future = self._decoding.pop((kind, path), None)
+        if future is None:
+            return _decode(kind, path)
+        return future.result()
+
+    # Reference counting
+    def _lookup(self, key: Tuple[Hashable, ...], owner: Hashable) -> Optional[Asset]:
+        """Get a cached asset, adding owner's reference and marking it recently used."""
+        asset = self._assets.get(key)
+        if asset is not None:
+            self._assets.move_to_end(key)
+            if owner is not None:
+                asset.owners.add(owner)
+        return asset
+
+    def _add(self, key: Tuple[Hashable, ...], asset: Asset, owner: Hashable) -> Asset:
+        """Cache a newly loaded asset, then evict unreferenced assets if over budget."""
+        if owner is not None:
+            asset.owners.add(owner)
+        self._assets[key] = asset
+        self.loaded_bytes += asset.size_bytes
+        self._evict()
+        return asset
+
+    def release(self, owner: Hashable) -> None:
+        """
+        Drop every reference an owner (usually a game session) holds, and
+        pending decodes nobody asked for; those are not counted in the budget.
+        """
+        for asset in self._assets.values():
+            asset.owners.discard(owner)
+        self.discard_pending()
+        self._evict()
+
+    def discard_pending(self) -> None:
+        """Forget preloaded decodes that were never used, cancelling those not started yet."""
+        with self._lock:
+            pending, self._decoding = self._decoding, {}
+        for future in pending.values():
+            future.cancel()
+
+    def _evict(self) -> None:
+        """Evict unreferenced assets, least recently used first, until within budget."""
+        for key in list(self._assets):
+            if self.loaded_bytes <= self.budget_bytes:
+                return
+            if not self._assets[key].owners:
+                self.loaded_bytes -= self._assets.pop(key).size_bytes
+
+    def drop(self, kinds: Iterable[str]) -> None:
+        """
+        Forget all assets of some kinds, e.g. fonts and sounds before pygame
+        shuts down the modules they belong to.
+        """
+        kinds = set(kinds)
+        for key in [key for key, asset in self._assets.items() if asset.kind in kinds]:
+            self.loaded_bytes -= self._assets.pop(key).size_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of cached assets per kind and their memory use."""
+        counts: Dict[str, int] = {}
+        referenced = 0
+        for asset in self._assets.values():
+            counts[asset.kind] = counts.get(asset.kind, 0) + 1
+            if asset.owners:
+                referenced += 1
+        return {"assets": counts, "referenced": referenced, "bytes": self.loaded_bytes, "budget": self.budget_bytes}
+
+    def shutdown(self) -> None:
+        """Stop the decoding thread and forget pending decodes."""
+        self.discard_pending()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _decode(kind: str, path: str) -> Any:
+    """Decode an image or sound file; safe to call off the main thread."""
+    import pygame
+
+    if kind == "image":
+        return pygame.image.load(path)
+    return pygame.mixer.Sound(path)
+
+
+# Global asset manager instance
+asset_manager = AssetManager()
@@ -1,11 +1,40 @@
 """Base class for all omniGames games."""
+import random
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from . import headless, profiler, telemetry
+from .assets import ASSET_DIR_NAME, asset_manager
+from .framebuffer import embedded_display
+from .pygame_runtime import pygame_runtime
+from .rendering import DirtyRenderer
+from .scheduler import Scheduler
+from .text_cache import text_cache
+
+# Waits shorter than this are spun instead of slept; OS sleep overshoots by up to a few ms
+SPIN_THRESHOLD = 0.002
+# Longest an idle render_on_demand game sleeps in pygame.event.wait before checking again
+IDLE_WAIT_MS = 1000
 
 
 class BaseGame(ABC):
     """Abstract base class for all games."""
 
+    # Most recently created game, read by the launcher to collect the saved state
+    active_game: Optional["BaseGame"] = None
+    # Frame rate the game aims for; frames much slower than this count as dropped
+    target_fps = 60
+    # Simulation step of run(), in seconds: update() always receives exactly this dt
+    fixed_dt = 1.0 / 60
+    # Most simulation steps run() catches up on per frame. On a machine too slow to
+    # keep up, the game slows down rather than spending ever longer catching up
+    max_steps_per_frame = 5
+    # Turn-based games set this: run() then sleeps until input arrives and renders
+    # only frames marked with invalidate(), or every frame while self.animating
+    render_on_demand = False
+
     def __init__(self, user_id: int, game_name: str):
         """
         Initialize the game.
@@ -18,6 +47,25 @@ class BaseGame(ABC):
         self.game_name = game_name
         self.running = False
         self.paused = False
+        # How far run() is between the last simulation step and the next (0..1), for render()
+        self.alpha = 0.0
+        # Set when the game runs without a display, e.g. for benchmarks, bots and tests
+        self.headless = headless.get_run()
+        # Use for all game randomness, so a headless run with a given seed is reproducible
+        self.rng = random.Random(self.headless.seed if self.headless else None)
+        BaseGame.active_game = self
+        self.telemetry = telemetry.get_session()
+        self.telemetry.set_target_fps(self.target_fps)
+        # Set by create_renderer() for games that redraw only what changed
+        self.renderer: Optional[DirtyRenderer] = None
+        # Time spent per frame phase; F3 shows it on screen, F4 records a cProfile capture
+        self.profiler = profiler.FrameProfiler(game_name)
+        text_cache.reset_stats()
+        # For render_on_demand: the next frame must be drawn / frames are drawn until this is cleared
+        self.needs_render = True
+        self.animating = False
+        # Timers and tweens on game time: use instead of pygame.time.delay or countdown fields
+        self.scheduler = Scheduler()
 
     @abstractmethod
     def initialize(self) -> bool:
@@ -71,25 +119,224 @@ class BaseGame(ABC):
         """Check if game is paused."""
         return self.paused
 
+    def create_screen(self, size: Tuple[int, int], caption: Optional[str] = None) -> Any:
+        """
+        Create the pygame surface the game draws on. Use instead of pygame.init() and
+        pygame.display.set_mode: pygame stays initialized between games, and when the
+        launcher embeds the game, the surface is offscreen and shown in its window.
+        """
+        self.screen = embedded_display.create_screen(size, caption)
+        return self.screen
+
+    def create_renderer(self, background: Any) -> DirtyRenderer:
+        """
+        Draw through a DirtyRenderer from now on: render() declares its items on
+        self.renderer and calls present(), which then pushes only what changed.
+        """
+        self.renderer = DirtyRenderer(self.screen, background)
+        return self.renderer
+
+    @property
+    def asset_dir(self) -> Path:
+        """Folder of the game's assets, next to its entry point."""
+        return Path(sys.modules[type(self).__module__].__file__).parent / ASSET_DIR_NAME
+
+    def load_image(self, name: str, alpha: bool = True) -> Any:
+        """
+        Get an image from the game's assets folder, converted to the display's
+        pixel format. Call after create_screen(). Shared with other sessions;
+        copy it before drawing onto it.
+        """
+        return asset_manager.image(self.asset_dir / name, owner=self, alpha=alpha)
+
+    def load_sound(self, name: str) -> Any:
+        """Get a pygame Sound from the game's assets folder."""
+        return asset_manager.sound(self.asset_dir / name, owner=self)
+
+    def load_font(self, size: int, name: Optional[str] = None) -> Any:
+        """Get a font from the game's assets folder by size; name None is pygame's default font."""
+        return asset_manager.font(size, str(self.asset_dir / name) if name else None, owner=self)
+
+    def present(self, rects: Optional[List[Any]] = None) -> None:
+        """
+        Show the frame drawn on self.screen. Use instead of pygame.display.flip.
+        rects limits the update to those screen areas; a game using
+        create_renderer() gets them from its renderer.
+        """
+        if self.renderer is not None:
+            rects = self.renderer.flush()
+        if self.profiler.overlay_enabled:
+            overlay = self.profiler.draw_overlay(self.screen)
+            if rects is not None:
+                rects.append(overlay)
+            if self.renderer is not None:
+                # Restore what the overlay covers, so it never stays behind once hidden
+                self.renderer.invalidate(overlay)
+        # A frame the launcher had no room for is drawn again, or an idle game would never show it
+        self.needs_render = not embedded_display.present(self.screen, rects)
+
+    def invalidate(self) -> None:
+        """Mark the screen as out of date, so a render_on_demand game draws the next frame."""
+        self.needs_render = True
+
+    def record_frame(self) -> None:
+        """Report a finished frame to session telemetry. Call once per frame, after render()."""
+        self.telemetry.frame()
+
+    def process_events(self) -> None:
+        """Pass pending input events to handle_event(). Called by run() once per frame."""
+        import pygame
+
+        for event in pygame.event.get():
+            self.dispatch_event(event)
+
+    def dispatch_event(self, event: Any) -> None:
+        """Pass one input event to the profiler hotkeys or handle_event(); input invalidates the screen."""
+        self.needs_render = True
+        if not self.profiler.handle_event(event):
+            self.handle_event(event)
+
+    def is_idle(self) -> bool:
+        """Check if a render_on_demand game can sleep until the next input event."""
+        return not (self.needs_render or self.animating or self.scheduler.animating or self.profiler.overlay_enabled)
+
+    def step(self, dt: float) -> None:
+        """Advance the simulation by one fixed step: update(), then the scheduler's timers and tweens."""
+        self.update(dt)
+        self.scheduler.advance(dt)
+
     def run(self) -> int:
         """
         Main game loop. Returns final score.
         Should be called by the game launcher.
+
+        The simulation advances in fixed steps of fixed_dt, however fast
+        frames are drawn; render() can use self.alpha to interpolate between
+        the last two steps. Frames are capped at target_fps by sleeping, with
+        a short spin for precision, so the loop does not occupy a whole core.
+        A render_on_demand game skips frames nothing changed in and, when
+        idle, blocks in pygame.event.wait instead of stepping.
         """
         self.running = True
         if not self.initialize():
             return 0
+        if self.headless is not None:
+            return self._run_headless()
 
+        frame_interval = 1.0 / self.target_fps
         try:
-            # This is a placeholder loop structure
-            # Each game implementation should override this
-            # or implement their own main loop
+            previous = time.perf_counter()
+            next_frame = previous + frame_interval
+            accumulator = 0.0
             while self.running:
-                self.update(0.016)  # Assume 60 FPS
-                self.render()
-                if not self.running:
+                now = time.perf_counter()
+                accumulator += min(now - previous, self.fixed_dt * self.max_steps_per_frame)
+                previous = now
+
+                started_ns = time.perf_counter_ns()
+                self.process_events()
+                if self.render_on_demand and self.needs_render:
+                    # Input gets a simulation step before the frame showing its result
+                    accumulator = max(accumulator, self.fixed_dt)
+                events_done_ns = time.perf_counter_ns()
+                while accumulator >= self.fixed_dt and self.running:
+                    if not self.paused:
+                        self.step(self.fixed_dt)
+                    accumulator -= self.fixed_dt
+                self.alpha = accumulator / self.fixed_dt
+                update_done_ns = time.perf_counter_ns()
+
+                if not self.render_on_demand or not self.is_idle():
+                    self.render()
+                    self.profiler.record(
+                        events_done_ns - started_ns,
+                        update_done_ns - events_done_ns,
+                        time.perf_counter_ns() - update_done_ns,
+                    )
+                    self.record_frame()
+
+                _wait_until(next_frame)
+                # After a slow frame, start pacing again from now instead of rushing to catch up
+                next_frame = max(next_frame + frame_interval, time.perf_counter())
+                if self.render_on_demand and self.running and self.is_idle():
+                    self._wait_for_input()
+                    # update() is not stepped through idle time; the scheduler's clock was advanced
+                    previous = next_frame = time.perf_counter()
+                    accumulator = 0.0
+        finally:
+            self.profiler.stop_capture()
+            self._release_resources()
+
+        return self.get_score()
+
+    def _wait_for_input(self) -> None:
+        """
+        Sleep until an input event arrives or the next timer is due, handle
+        the event, then advance the scheduler by the time slept.
+        """
+        import pygame
+
+        self.telemetry.idle()
+        self.profiler.idle()
+        started = time.perf_counter()
+        while self.running and self.is_idle():
+            timeout_ms = IDLE_WAIT_MS
+            due = None if self.paused else self.scheduler.time_until_next()
+            if due is not None:
+                remaining = due - (time.perf_counter() - started)
+                if remaining <= 0:
                     break
+                timeout_ms = min(timeout_ms, int(remaining * 1000) + 1)
+            event = pygame.event.wait(timeout_ms)
+            if event.type != pygame.NOEVENT:
+                self.dispatch_event(event)
+        if not self.paused:
+            self.scheduler.advance(time.perf_counter() - started)
+
+    def _run_headless(self) -> int:
+        """
+        Simulate as fast as possible: scripted input, fixed steps, no pacing and
+        no rendering except every render_every steps. Ends after the run's duration.
+        """
+        run = self.headless
+        try:
+            while self.running and run.game_seconds < run.duration:
+                for event in run.events_until(run.game_seconds):
+                    self.handle_event(event)
+                if not self.paused:
+                    self.step(self.fixed_dt)
+                run.steps += 1
+                run.game_seconds = run.steps * self.fixed_dt
+                if run.render_every and run.steps % run.render_every == 0:
+                    self.render()
+                    self.record_frame()
         finally:
-            self.cleanup()
+            self._release_resources()
 
         return self.get_score()
+
+    def _release_resources(self) -> None:
+        """End the session: telemetry, the game's cleanup(), then hand pygame back to the runtime."""
+        self.telemetry.finish()
+        asset_manager.release(self)
+        self.cleanup()
+        if pygame_runtime.initialized:
+            pygame_runtime.reset()
+        else:
+            # The game quit pygame itself, and with it every font, sound and rendered text
+            text_cache.clear()
+            asset_manager.drop(("font", "sound"))
+
+    def capture(self) -> Any:
+        """Render the current state and get the screen surface, e.g. to inspect a headless game."""
+        self.render()
+        return self.screen
+
+
+def _wait_until(deadline: float) -> None:
+    """Sleep until shortly before a perf_counter() deadline, then spin until it."""
+    remaining = deadline - time.perf_counter()
+    if remaining > SPIN_THRESHOLD:
+        time.sleep(remaining - SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
@@ -0,0 +1,158 @@
+"""Full-text search index over the installed game catalog."""
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+# Manifest fields that are searchable, also usable as "field:value" qualifiers
+INDEXED_FIELDS = ("name", "title", "description", "author", "version")
+# Locale keys indexed for every language a game ships
+INDEXED_LOCALE_KEYS = ("game_title", "game_description")
+# Longest prefix indexed for instant (per-keystroke) matching
+MAX_PREFIX_LENGTH = 16
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9.]*(?::[a-z0-9.]+)?")
+
+
+def normalize(text: str) -> str:
+    """Lowercase text and strip accents so "Séptimo" matches "septimo"."""
+    decomposed = unicodedata.normalize("NFKD", str(text).lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into search terms."""
+    return [term for term in (match.rstrip(".") for match in _TOKEN_RE.findall(normalize(text))) if term]
+
+
+class CatalogIndex:
+    """
+    In-memory inverted index of games.
+
+    Every term is stored under all of its prefixes, so a query made of
+    partially typed words is answered with dictionary lookups and set
+    intersections only, without scanning the catalog.
+    """
+
+    def __init__(self):
+        """Initialize empty index."""
+        self._postings: Dict[str, Set[str]] = {}
+        self._doc_keys: Dict[str, Set[str]] = {}
+        self._titles: Dict[str, str] = {}
+        self._ordered: Optional[List[str]] = None
+        self._rank: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed games."""
+        return len(self._doc_keys)
+
+    def __contains__(self, game_name: str) -> bool:
+        """Check if a game is indexed."""
+        return game_name in self._doc_keys
+
+    def add(self, game_data: Dict, locales: Optional[Dict[str, Dict]] = None) -> None:
+        """Index (or re-index) a game from its manifest and per-language locales."""
+        game_name = game_data["name"]
+        self.remove(game_name)
+
+        terms: Set[str] = set()
+        for field in INDEXED_FIELDS:
+            value = game_data.get(field)
+            if not value:
+                continue
+            for term in tokenize(value):
+                terms.add(term)
+                terms.add(f"{field}:{term}")
+
+        for language, strings in (locales or {}).items():
+            terms.add(f"lang:{normalize(language)}")
+            for key in INDEXED_LOCALE_KEYS:
+                value = strings.get(key)
+                if value:
+                    terms.update(tokenize(value))
+
+        keys: Set[str] = set()
+        for term in terms:
+            for length in range(1, min(len(term), MAX_PREFIX_LENGTH) + 1):
+                keys.add(term[:length])
+            if len(term) > MAX_PREFIX_LENGTH:
+                keys.add(term)
+        for key in keys:
+            self._postings.setdefault(key, set()).add(game_name)
+
+        self._doc_keys[game_name] = keys
+        self._titles[game_name] = normalize(game_data.get("title", game_name))
+        self._ordered = None
+
+    def remove(self, game_name: str) -> None:
+        """Remove a game from the index."""
+        keys = self._doc_keys.pop(game_name, None)
+        if keys is None:
+            return
+        for key in keys:
+            posting = self._postings.get(key)
+            if posting is not None:
+                posting.discard(game_name)
+                if not posting:
+                    del self._postings[key]
+        self._titles.pop(game_name, None)
+        self._ordered = None
+
+    def clear(self) -> None:
+        """Remove every game from the index."""
+        self.__init__()
+
+    def games(self) -> Iterable[str]:
+        """Get names of all indexed games."""
+        return self._doc_keys.keys()
+
+    def _ensure_order(self) -> List[str]:
+        """Get all games sorted by title, rebuilt only after the index changed."""
+        if self._ordered is None:
+            self._ordered = sorted(self._titles, key=lambda name: (self._titles[name], name))
+            self._rank = {name: position for position, name in enumerate(self._ordered)}
+        return self._ordered
+
+    def search(self, query: str) -> List[str]:
+        """
+        Get names of games matching every word of the query, sorted by title.
+
+        Words match as prefixes. "field:value" restricts a word to one manifest
+        field (e.g. "author:omni"), and "lang:es" keeps games shipping that locale.
+        """
+        ordered = self._ensure_order()
+        terms = tokenize(query)
+        if not terms:
+            return list(ordered)
+
+        postings = []
+        for term in terms:
+            key = term if len(term) <= MAX_PREFIX_LENGTH else term[:MAX_PREFIX_LENGTH]
+            posting = self._postings.get(key)
+            if not posting:
+                return []
+            # Words matching every game (e.g. a single typed letter) filter nothing
+            if len(posting) < len(ordered) or len(term) > MAX_PREFIX_LENGTH:
+                postings.append(posting)
+        if not postings:
+            return list(ordered)
+
+        postings.sort(key=len)
+        matches = postings[0]
+        for posting in postings[1:]:
+            matches = matches & posting
+            if not matches:
+                return []
+
+        # Long terms were looked up by prefix only; confirm the full term
+        long_terms = [term for term in terms if len(term) > MAX_PREFIX_LENGTH]
+        if long_terms:
+            matches = {
+                name
+                for name in matches
+                if all(any(key.startswith(term) for key in self._doc_keys[name]) for term in long_terms)
+            }
+
+        # Small result sets are cheaper to sort, large ones cheaper to filter
+        if len(matches) * 8 < len(ordered):
+            return sorted(matches, key=self._rank.__getitem__)
+        return [name for name in ordered if name in matches]
@@ -2,10 +2,12 @@
 import json
 from pathlib import Path
 from typing import Dict, Any
+from .lazy import LazyProxy
 
 LOCALES_PATH = Path(__file__).parent.parent / "locales"
 GAMES_PATH = Path(__file__).parent.parent.parent / "games"  # games/ folder at same level as omnigames/
 ASSETS_PATH = Path(__file__).parent.parent / "assets"
+CACHE_PATH = Path(__file__).parent.parent.parent / "cache"  # Generated data (thumbnails, indexes...)
 
 
 class LocalizationManager:
@@ -67,6 +69,20 @@ class LocalizationManager:
             "enter_username": "Enter username",
             "select_zip": "Select ZIP file to install",
             "installing": "Installing game...",
+            "search": "Search",
+            "game_damaged": "Some files of this game are damaged. Reinstall it to fix them.",
+            "game_running": "A game is already running",
+            "load_time": "Load time",
+            "frame_time": "Frame time",
+            "dropped_frames": "dropped frames",
+            "export_report": "Export report",
+            "report_exported": "Sessions exported",
+            "install_extracting": "Extracting",
+            "install_verifying": "Verifying files",
+            "install_activating": "Activating",
+            "install_thumbnails": "Preparing thumbnails",
+            "install_cancelled": "Installation cancelled",
+            "quit_game": "Quit game",
         }
 
         es_translations = {
@@ -103,6 +119,20 @@ class LocalizationManager:
             "enter_username": "Ingresa nombre de usuario",
             "select_zip": "Selecciona archivo ZIP para instalar",
             "installing": "Instalando juego...",
+            "search": "Buscar",
+            "game_damaged": "Algunos archivos de este juego están dañados. Reinstálalo para repararlo.",
+            "game_running": "Ya hay un juego en ejecución",
+            "load_time": "Tiempo de carga",
+            "frame_time": "Tiempo por fotograma",
+            "dropped_frames": "fotogramas perdidos",
+            "export_report": "Exportar informe",
+            "report_exported": "Sesiones exportadas",
+            "install_extracting": "Extrayendo",
+            "install_verifying": "Verificando archivos",
+            "install_activating": "Activando",
+            "install_thumbnails": "Preparando miniaturas",
+            "install_cancelled": "Instalación cancelada",
+            "quit_game": "Salir del juego",
         }
 
         for lang, translations in [("en", en_translations), ("es", es_translations)]:
@@ -125,5 +155,5 @@ class LocalizationManager:
         return ["en", "es"]
 
 
-# Global localization instance
-localization = LocalizationManager("en")
+# Global localization instance, loaded on first use
+localization = LazyProxy(lambda: LocalizationManager("en"))
@@ -3,6 +3,7 @@ import sqlite3
 import os
 from pathlib import Path
 from typing import Optional, Dict, List, Any
+from .lazy import LazyProxy
 
 DB_PATH = Path(__file__).parent.parent.parent / "omnigames.db"
 
@@ -74,6 +75,27 @@ class Database:
         """
         )
 
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS game_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                game_name TEXT NOT NULL,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                machine TEXT,
+                duration_s REAL,
+                first_frame_ms REAL,
+                frames INTEGER,
+                avg_fps REAL,
+                p50_ms REAL,
+                p95_ms REAL,
+                p99_ms REAL,
+                dropped_frames INTEGER,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+        """
+        )
+
         self.conn.commit()
         self.disconnect()
 
@@ -184,6 +206,65 @@ class Database:
         )
         return self.fetchall()
 
+    # Session telemetry
+    def record_session(self, user_id: int, game_name: str, summary: Dict[str, Any]) -> None:
+        """Store the telemetry summary of one game session."""
+        self.execute(
+            """
+            INSERT INTO game_sessions (
+                user_id, game_name, machine, duration_s, first_frame_ms, frames,
+                avg_fps, p50_ms, p95_ms, p99_ms, dropped_frames
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                user_id,
+                game_name,
+                summary.get("machine"),
+                summary.get("duration_s"),
+                summary.get("first_frame_ms"),
+                summary.get("frames"),
+                summary.get("avg_fps"),
+                summary.get("p50_ms"),
+                summary.get("p95_ms"),
+                summary.get("p99_ms"),
+                summary.get("dropped_frames"),
+            ),
+        )
+        self.commit()
+
+    def get_session_summary(self, user_id: int) -> List[sqlite3.Row]:
+        """Get per-game session averages for a user."""
+        self.execute(
+            """
+            SELECT game_name,
+                   COUNT(*) AS sessions,
+                   AVG(first_frame_ms) AS avg_first_frame_ms,
+                   AVG(avg_fps) AS avg_fps,
+                   AVG(p95_ms) AS avg_p95_ms,
+                   MAX(p99_ms) AS max_p99_ms,
+                   SUM(dropped_frames) AS dropped_frames,
+                   SUM(frames) AS frames
+            FROM game_sessions WHERE user_id = ?
+            GROUP BY game_name ORDER BY game_name
+        """,
+            (user_id,),
+        )
+        return self.fetchall()
+
+    def get_sessions(self, user_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """Get every recorded session, optionally for one user, newest first."""
+        query = """
+            SELECT game_sessions.*, users.username FROM game_sessions
+            JOIN users ON users.id = game_sessions.user_id
+        """
+        params: tuple = ()
+        if user_id is not None:
+            query += " WHERE game_sessions.user_id = ?"
+            params = (user_id,)
+        self.execute(query + " ORDER BY game_sessions.started_at DESC", params)
+        return self.fetchall()
+
 
-# Global database instance
-db = Database()
+# Global database instance, connected on first use
+db = LazyProxy(Database)
@@ -0,0 +1,237 @@
+"""Shared-memory framebuffer for showing pygame games inside the launcher window."""
+import os
+import struct
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from .pygame_runtime import pygame_runtime
+
+# Header: frames published, frames shown by the reader, width, height
+HEADER = struct.Struct("<QQII")
+HEADER_SIZE = 64
+BYTES_PER_PIXEL = 3  # RGB, the layout Tk photo images are filled from
+# Beyond this many changed areas queued for a buffer, copy the whole frame instead
+MAX_PENDING_RECTS = 64
+
+
+class SharedFramebuffer:
+    """
+    Two RGB frame buffers in shared memory plus a small header.
+
+    The game writes frame n into buffer n % 2 while the launcher shows the
+    other one. A frame is only written once the reader has shown the
+    previous one, so the reader never sees a half-written frame and the
+    game presents at most one frame ahead of the screen.
+    """
+
+    def __init__(self, width: int, height: int, name: Optional[str] = None):
+        """Initialize: create the buffers, or attach to existing ones by name."""
+        self.width = width
+        self.height = height
+        self.frame_size = width * height * BYTES_PER_PIXEL
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + 2 * self.frame_size)
+            HEADER.pack_into(self.shm.buf, 0, 0, 0, width, height)
+        else:
+            # Only the creating process unlinks the segment
+            self.shm = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self) -> str:
+        """Name other processes attach with."""
+        return self.shm.name
+
+    def _header(self) -> Tuple[int, int, int, int]:
+        """Read (published, shown, width, height)."""
+        return HEADER.unpack_from(self.shm.buf, 0)
+
+    def buffer(self, index: int) -> memoryview:
+        """Get buffer 0 or 1 as a writable view of the shared memory."""
+        start = HEADER_SIZE + index * self.frame_size
+        return self.shm.buf[start:start + self.frame_size]
+
+    # Writer side
+    def next_frame(self) -> Optional[int]:
+        """Get the number of the frame to write next, or None while the reader still shows an older one."""
+        published, shown, _, _ = self._header()
+        if published and shown < published:
+            return None
+        return published + 1
+
+    def publish(self, frame: int) -> None:
+        """Hand a fully written frame (from next_frame) over to the reader."""
+        struct.pack_into("<Q", self.shm.buf, 0, frame)
+
+    # Reader side
+    def read(self) -> Optional[Tuple[int, memoryview]]:
+        """Get (frame number, pixels) of a frame not shown yet, or None. Call shown() when done with it."""
+        published, shown, _, _ = self._header()
+        if published <= shown:
+            return None
+        return published, self.buffer(published % 2)
+
+    def shown(self, frame: int) -> None:
+        """Tell the writer a frame is on screen, releasing the other buffer."""
+        struct.pack_into("<Q", self.shm.buf, 8, frame)
+
+    def close(self) -> None:
+        """Detach; the creating process also removes the shared memory."""
+        try:
+            self.shm.close()
+        except BufferError:
+            return  # A view is still in use; released when the process exits
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def to_pygame_event(event: Dict[str, Any]):
+    """Convert an input event dict (as forwarded by the launcher or scripted) to a pygame event, or None."""
+    import pygame
+
+    kind = event.get("kind")
+    if kind == "quit":
+        return pygame.event.Event(pygame.QUIT)
+    if kind in ("key_down", "key_up"):
+        try:
+            key = pygame.key.key_code(event["key"])
+        except (ValueError, KeyError):
+            return None
+        event_type = pygame.KEYDOWN if kind == "key_down" else pygame.KEYUP
+        return pygame.event.Event(event_type, key=key, unicode=event.get("unicode", ""), mod=0, scancode=0)
+    if kind in ("mouse_down", "mouse_up"):
+        event_type = pygame.MOUSEBUTTONDOWN if kind == "mouse_down" else pygame.MOUSEBUTTONUP
+        return pygame.event.Event(event_type, pos=tuple(event["pos"]), button=event.get("button", 1))
+    if kind == "mouse_motion":
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=tuple(event["pos"]), rel=(0, 0), buttons=(0, 0, 0))
+    return None
+
+
+class EmbeddedDisplay:
+    """
+    The game process's side of an embedded session.
+    When enabled, the game's screen is an offscreen surface, presented frames
+    go to a SharedFramebuffer and input arrives from the launcher as pygame
+    events. When not enabled, games get a normal window.
+    """
+
+    def __init__(self):
+        """Initialize embedded display, disabled."""
+        self.conn = None
+        self.framebuffer: Optional[SharedFramebuffer] = None
+        # Surfaces drawn straight into the two shared buffers
+        self._targets: List[Any] = []
+        # Per buffer: screen areas changed since it was last written, or None for everything
+        self._pending: List[Optional[List[Any]]] = [None, None]
+        self._input_thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        """Check if this process renders for the launcher window."""
+        return self.conn is not None
+
+    def enable(self, conn) -> None:
+        """
+        Render offscreen for the launcher connected through conn.
+        Call before the game creates its screen; conn also receives the input events.
+        """
+        import pygame
+
+        # No window is ever created: the dummy driver keeps the display surface in memory
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.quit()
+        pygame.display.init()
+        self.conn = conn
+        self._input_thread = threading.Thread(
+            target=self._receive_input, args=(conn,), name="embedded-input", daemon=True
+        )
+        self._input_thread.start()
+
+    def _receive_input(self, conn) -> None:
+        """Post the launcher's input events to the pygame event queue. Runs on the input thread."""
+        import pygame
+
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                return
+            if not isinstance(message, dict) or message.get("type") != "input":
+                continue
+            event = to_pygame_event(message["event"])
+            if event is not None:
+                try:
+                    pygame.event.post(event)
+                except pygame.error:
+                    pass  # Display not initialized yet or already shut down
+
+    def create_screen(self, size: Tuple[int, int], caption: Optional[str] = None):
+        """Create the surface a game draws on: a window, or the embedded framebuffer's source."""
+        import pygame
+
+        screen = pygame_runtime.display(size, caption)
+        if self.active:
+            self._release_framebuffer()
+            self.framebuffer = SharedFramebuffer(size[0], size[1])
+            self._targets = [pygame.image.frombuffer(self.framebuffer.buffer(i), size, "RGB") for i in (0, 1)]
+            self._pending = [None, None]
+            self.conn.send(
+                {"type": "framebuffer", "name": self.framebuffer.name, "width": size[0], "height": size[1]}
+            )
+        return screen
+
+    def present(self, surface, rects: Optional[List[Any]] = None) -> bool:
+        """
+        Show a finished frame: update the window, or hand the frame to the launcher
+        if it is ready for one. rects limits the update to the areas that changed.
+        Returns False if the frame was dropped; its changes go out with the next one.
+        """
+        import pygame
+
+        if self.framebuffer is None:
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+            return True
+
+        # Each shared buffer still holds an older frame, so it needs every change since then
+        for index, pending in enumerate(self._pending):
+            if pending is not None:
+                if rects is None or len(pending) + len(rects) > MAX_PENDING_RECTS:
+                    self._pending[index] = None
+                else:
+                    pending.extend(rects)
+        frame = self.framebuffer.next_frame()
+        if frame is None:
+            return False  # The launcher has not shown the previous frame yet; drop this one
+        target = self._targets[frame % 2]
+        pending = self._pending[frame % 2]
+        if pending is None:
+            target.blit(surface, (0, 0))
+        else:
+            for rect in pending:
+                target.blit(surface, rect, rect)
+        self._pending[frame % 2] = []
+        self.framebuffer.publish(frame)
+        return True
+
+    def _release_framebuffer(self) -> None:
+        """Drop the surfaces over the shared buffers and remove them."""
+        self._targets = []
+        if self.framebuffer is not None:
+            self.framebuffer.close()
+            self.framebuffer = None
+
+    def close(self) -> None:
+        """End embedded rendering after the session."""
+        self._release_framebuffer()
+        self.conn = None
+
+
+# Global embedded display instance
+embedded_display = EmbeddedDisplay()
@@ -2,12 +2,23 @@
 import os
 import json
 import shutil
-import zipfile
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from .config import GAMES_PATH
+from .catalog import CatalogIndex
+from .integrity import write_integrity_manifest
+from .lazy import LazyProxy
+from .thumbnails import thumbnail_cache
 
 GAME_MANIFEST = "game.json"
+DEFAULT_ICON = "assets/thumbnail.png"
+VERSIONS_DIR = ".versions"  # games/.versions/<name>/<stamp>/ holds every installed copy
+VERSION_MARKER = ".version"  # Written inside each version directory, contains its stamp
+KEEP_PREVIOUS_VERSIONS = 1  # Old versions kept around for instant rollback
+EXTRACT_CHUNK_SIZE = 256 * 1024
+PROGRESS_INTERVAL_BYTES = 1024 * 1024  # Report extraction progress at most once per MiB
 
 
 class GameManager:
@@ -17,18 +28,103 @@ class GameManager:
         """Initialize game manager."""
         self.games_path = GAMES_PATH
         self.games_path.mkdir(parents=True, exist_ok=True)
+        self.catalog = CatalogIndex()
+        self._catalog_games: Dict[str, Dict] = {}
+        self._catalog_stamps: Dict[str, tuple] = {}
+        self._version_refs: Dict[tuple, int] = {}
+        self._version_lock = threading.RLock()
+        self._game_problems: Dict[str, List[str]] = {}
+        self._revision = 0
+        self._locale_cache: Dict[str, tuple] = {}
 
     def get_installed_games(self) -> List[Dict[str, any]]:
         """Get list of installed games."""
         games = []
         for game_dir in self.games_path.iterdir():
-            if game_dir.is_dir():
+            if game_dir.is_dir() and not game_dir.name.startswith("."):
                 game_data = self._load_game_manifest(game_dir)
                 if game_data:
                     game_data["path"] = str(game_dir)
+                    if game_data.get("name") in self._game_problems:
+                        game_data["problems"] = self._game_problems[game_data["name"]]
                     games.append(game_data)
+        self._sync_catalog(games)
         return sorted(games, key=lambda x: x.get("title", ""))
 
+    def get_game(self, game_name: str) -> Optional[Dict[str, any]]:
+        """Get the manifest of one installed game, or None if it is not installed."""
+        game_dir = self.games_path / game_name
+        game_data = self._load_game_manifest(game_dir)
+        if not game_data:
+            return None
+        game_data["path"] = str(game_dir)
+        if game_name in self._game_problems:
+            game_data["problems"] = self._game_problems[game_name]
+        return game_data
+
+    def get_game_locales(self, game_dir: Path) -> Dict[str, Dict]:
+        """Load every locale file shipped with a game, keyed by language. Cached until they change."""
+        game_dir = Path(game_dir)
+        stamp = self._catalog_stamp(game_dir)
+        cached = self._locale_cache.get(str(game_dir))
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        locales = {}
+        locales_path = game_dir / "locales"
+        if locales_path.exists():
+            for lang_file in locales_path.glob("*.json"):
+                try:
+                    with open(lang_file, "r", encoding="utf-8") as f:
+                        locales[lang_file.stem] = json.load(f)
+                except Exception:
+                    pass
+        self._locale_cache[str(game_dir)] = (stamp, locales)
+        return locales
+
+    def _catalog_stamp(self, game_dir: Path) -> tuple:
+        """Get a cheap change marker for a game's manifest and locales."""
+        stamp = []
+        # Each locale file is stat'ed: editing one in place leaves the directory's mtime alone
+        locale_files = sorted((game_dir / "locales").glob("*.json"))
+        for path in [game_dir / GAME_MANIFEST, game_dir / "locales"] + locale_files:
+            try:
+                stat = path.stat()
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _sync_catalog(self, games: List[Dict]) -> None:
+        """Re-index games whose manifest or locales changed and drop removed ones."""
+        seen = set()
+        for game_data in games:
+            game_name = game_data.get("name")
+            if not game_name:
+                continue
+            seen.add(game_name)
+            game_dir = Path(game_data["path"])
+            stamp = (str(game_dir),) + self._catalog_stamp(game_dir)
+            if self._catalog_stamps.get(game_name) != stamp:
+                self.catalog.add(game_data, self.get_game_locales(game_dir))
+                self._catalog_stamps[game_name] = stamp
+            self._catalog_games[game_name] = game_data
+
+        for game_name in list(self._catalog_games):
+            if game_name not in seen:
+                self.catalog.remove(game_name)
+                self._catalog_games.pop(game_name, None)
+                self._catalog_stamps.pop(game_name, None)
+
+    def search_games(self, query: str) -> List[Dict[str, any]]:
+        """
+        Search installed games by title, description, author, version and
+        per-language descriptions. Uses the catalog built by get_installed_games.
+        """
+        if not self._catalog_games:
+            self.get_installed_games()
+        return [self._catalog_games[name] for name in self.catalog.search(query) if name in self._catalog_games]
+
     def _load_game_manifest(self, game_dir: Path) -> Optional[Dict]:
         """Load game manifest from directory."""
         manifest_path = game_dir / GAME_MANIFEST
@@ -40,11 +136,37 @@ class GameManager:
                 print(f"Error loading manifest for {game_dir.name}: {e}")
         return None
 
-    def install_game_from_zip(self, zip_path: str, extract_to: Optional[Path] = None) -> tuple[bool, str]:
+    def install_game_from_zip(
+        self,
+        zip_path: str,
+        extract_to: Optional[Path] = None,
+        progress: Optional[Callable[[Dict], None]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> tuple[bool, str]:
         """
         Install a game from ZIP file.
+        progress receives {"phase", "bytes_done", "bytes_total", "files_done", "files_total"}
+        events; setting cancel aborts the install until the new version is activated.
         Returns (success: bool, message: str)
         """
+        import tempfile
+        import zipfile
+
+        from .repository import is_plain_file_name
+
+        def report(phase: str, bytes_done: int = 0, bytes_total: int = 0, files_done: int = 0, files_total: int = 0):
+            if progress:
+                progress(
+                    {
+                        "phase": phase,
+                        "bytes_done": bytes_done,
+                        "bytes_total": bytes_total,
+                        "files_done": files_done,
+                        "files_total": files_total,
+                    }
+                )
+
+        temp_extract = None
         try:
             zip_path = Path(zip_path)
             if not zip_path.exists():
@@ -64,41 +186,284 @@ class GameManager:
                 if not game_manifest_found:
                     return False, f"No {GAME_MANIFEST} found in ZIP"
 
-                # Extract to temp location first
-                temp_extract = self.games_path / ".temp_extract"
-                if temp_extract.exists():
-                    shutil.rmtree(temp_extract)
-                temp_extract.mkdir(parents=True, exist_ok=True)
+                # Extract to a private temp location first
+                temp_extract = Path(tempfile.mkdtemp(prefix=".temp_extract-", dir=self.games_path))
+                if not self._extract_zip(zip_ref, temp_extract, report, cancel):
+                    return False, "Installation cancelled"
 
-                zip_ref.extractall(temp_extract)
+            # Find the game directory (may be nested)
+            game_dir = self._find_game_directory(temp_extract)
+            if not game_dir:
+                return False, "Could not find game directory in ZIP"
 
-                # Find the game directory (may be nested)
-                game_dir = self._find_game_directory(temp_extract)
-                if not game_dir:
-                    shutil.rmtree(temp_extract)
-                    return False, "Could not find game directory in ZIP"
+            # Load manifest to get game name
+            manifest = self._load_game_manifest(game_dir)
+            if not manifest or "name" not in manifest:
+                return False, "Invalid game manifest"
 
-                # Load manifest to get game name
-                manifest = self._load_game_manifest(game_dir)
-                if not manifest or "name" not in manifest:
-                    shutil.rmtree(temp_extract)
-                    return False, "Invalid game manifest"
+            game_name = manifest["name"]
+            # The name becomes a folder under games/, so it must not be a path
+            if not is_plain_file_name(game_name):
+                return False, f"Invalid game name in manifest: {game_name!r}"
+            final_path = self.games_path / game_name
 
-                game_name = manifest["name"]
-                final_path = self.games_path / game_name
+            # Stage as a new version, then switch to it atomically. The previous
+            # version stays on disk, so running sessions and rollback are unaffected.
+            report("verifying")
+            version_dir = self._new_version_dir(game_name, manifest.get("version", "0"))
+            shutil.move(str(game_dir), str(version_dir))
+            write_integrity_manifest(version_dir)
+            if cancel is not None and cancel.is_set():
+                shutil.rmtree(version_dir, ignore_errors=True)
+                return False, "Installation cancelled"
 
-                # Remove existing game if it exists
-                if final_path.exists():
-                    shutil.rmtree(final_path)
+            report("activating")
+            self._activate_version(game_name, version_dir)
+            self.set_game_problems(game_name, [])
+            self.schedule_version_cleanup(game_name)
 
-                # Move from temp to final location
-                shutil.move(str(game_dir), str(final_path))
-                shutil.rmtree(temp_extract)
+            # Pre-render menu thumbnails so the menu never decodes full-size icons
+            report("thumbnails")
+            thumbnail_cache.generate(game_name, final_path / manifest.get("icon", DEFAULT_ICON))
 
-                return True, f"Game '{game_name}' installed successfully"
+            return True, f"Game '{game_name}' installed successfully"
 
         except Exception as e:
             return False, f"Installation error: {str(e)}"
+        finally:
+            if temp_extract is not None:
+                shutil.rmtree(temp_extract, ignore_errors=True)
+
+    def _extract_zip(self, zip_ref, target: Path, report: Callable, cancel: Optional[threading.Event]) -> bool:
+        """
+        Extract a ZIP in chunks, reporting progress and checking for cancellation.
+        Returns False if cancelled.
+        """
+        members = zip_ref.infolist()
+        bytes_total = sum(info.file_size for info in members)
+        bytes_done = 0
+        target_root = os.path.realpath(target)
+        last_report = 0
+
+        report("extracting", 0, bytes_total, 0, len(members))
+        for files_done, info in enumerate(members, 1):
+            destination = os.path.realpath(os.path.join(target_root, info.filename))
+            if not destination.startswith(target_root + os.sep):
+                raise ValueError(f"Unsafe path in ZIP: {info.filename}")
+
+            if info.is_dir():
+                os.makedirs(destination, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                with zip_ref.open(info) as source, open(destination, "wb") as f:
+                    for chunk in iter(lambda: source.read(EXTRACT_CHUNK_SIZE), b""):
+                        if cancel is not None and cancel.is_set():
+                            return False
+                        f.write(chunk)
+                        bytes_done += len(chunk)
+                        if bytes_done - last_report >= PROGRESS_INTERVAL_BYTES:
+                            last_report = bytes_done
+                            report("extracting", bytes_done, bytes_total, files_done - 1, len(members))
+            report("extracting", bytes_done, bytes_total, files_done, len(members))
+        return True
+
+    def get_revision(self) -> tuple:
+        """
+        Get a marker that changes whenever the installed games or their status change.
+        Costs a single stat call, so views can poll it before re-querying.
+        """
+        try:
+            mtime = self.games_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        return self._revision, mtime
+
+    def set_game_problems(self, game_name: str, problems: List[str]) -> None:
+        """Record integrity problems found for a game (empty list when intact)."""
+        if list(problems) != self._game_problems.get(game_name, []):
+            self._revision += 1
+        if problems:
+            self._game_problems[game_name] = list(problems)
+        else:
+            self._game_problems.pop(game_name, None)
+        if game_name in self._catalog_games:
+            if problems:
+                self._catalog_games[game_name]["problems"] = list(problems)
+            else:
+                self._catalog_games[game_name].pop("problems", None)
+
+    def get_game_problems(self, game_name: str) -> List[str]:
+        """Get integrity problems found for a game."""
+        return self._game_problems.get(game_name, [])
+
+    # Versioned installs
+    def _versions_path(self, game_name: str) -> Path:
+        """Get the folder holding every installed version of a game."""
+        return self.games_path / VERSIONS_DIR / game_name
+
+    def _new_version_dir(self, game_name: str, version: str) -> Path:
+        """Reserve a version directory name; stamps sort by install time."""
+        stamp = f"{time.time_ns() // 1000:016d}-{str(version).replace(os.sep, '_')}"
+        version_dir = self._versions_path(game_name) / stamp
+        version_dir.parent.mkdir(parents=True, exist_ok=True)
+        return version_dir
+
+    def _read_version_stamp(self, version_dir: Path) -> Optional[str]:
+        """Get the stamp of a version directory from its marker file."""
+        try:
+            return (version_dir / VERSION_MARKER).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+    def get_current_version(self, game_name: str) -> Optional[str]:
+        """Get the stamp of the active version, or None for a legacy in-place install."""
+        final_path = self.games_path / game_name
+        if final_path.is_symlink():
+            return Path(os.readlink(final_path)).name
+        if final_path.is_dir():
+            return self._read_version_stamp(final_path)
+        return None
+
+    def get_game_versions(self, game_name: str) -> List[str]:
+        """Get stamps of every installed version of a game, oldest first."""
+        versions_path = self._versions_path(game_name)
+        stamps = []
+        if versions_path.exists():
+            stamps = [p.name for p in versions_path.iterdir() if p.is_dir() and not p.name.startswith(".")]
+        current = self.get_current_version(game_name)
+        if current and current not in stamps:
+            stamps.append(current)
+        return sorted(stamps)
+
+    def _activate_version(self, game_name: str, version_dir: Path) -> None:
+        """
+        Point games/<name> at a version directory.
+        Uses an atomic symlink replace. Where symlinks are unavailable (e.g.
+        Windows without developer mode) it falls back to two renames, which is
+        not atomic: games/<name> is briefly missing between them, and the
+        version a running session was started from is moved into .versions
+        under it (see acquire_game).
+        """
+        with self._version_lock:
+            final_path = self.games_path / game_name
+            (version_dir / VERSION_MARKER).write_text(version_dir.name, encoding="utf-8")
+
+            if final_path.exists() and not final_path.is_symlink():
+                # Adopt a legacy or rename-mode install as a version of its own
+                stamp = self._read_version_stamp(final_path)
+                if not stamp:
+                    stamp = f"{final_path.stat().st_mtime_ns // 1000:016d}-legacy"
+                    (final_path / VERSION_MARKER).write_text(stamp, encoding="utf-8")
+                self._versions_path(game_name).mkdir(parents=True, exist_ok=True)
+                os.rename(final_path, self._versions_path(game_name) / stamp)
+
+            swap_link = self.games_path / f".{game_name}.swap"
+            try:
+                if swap_link.is_symlink():
+                    swap_link.unlink()
+                os.symlink(os.path.relpath(version_dir, self.games_path), swap_link, target_is_directory=True)
+                os.replace(swap_link, final_path)
+            except (OSError, NotImplementedError):
+                if final_path.is_symlink():
+                    final_path.unlink()
+                os.rename(version_dir, final_path)
+            self._revision += 1
+
+    def rollback_game(self, game_name: str) -> tuple[bool, str]:
+        """
+        Switch a game back to the version installed before the current one.
+        Returns (success: bool, message: str)
+        """
+        current = self.get_current_version(game_name)
+        older = [stamp for stamp in self.get_game_versions(game_name) if current is None or stamp < current]
+        if not older:
+            return False, f"No previous version of '{game_name}' to roll back to"
+
+        try:
+            self._activate_version(game_name, self._versions_path(game_name) / older[-1])
+        except Exception as e:
+            return False, f"Rollback error: {str(e)}"
+        return True, f"Game '{game_name}' rolled back to {older[-1].split('-', 1)[-1]}"
+
+    def acquire_game(self, game_name: str) -> Path:
+        """
+        Pin the active version of a game for a session.
+        Returns the resolved version directory, which stays valid until
+        release_game is called even if the game is updated meanwhile.
+        In rename mode (no symlinks) games/<name> is the version itself, so
+        nothing is pinned: an update during the session moves it away.
+        """
+        with self._version_lock:
+            game_dir = Path(os.path.realpath(self.games_path / game_name))
+            key = (game_name, self._read_version_stamp(game_dir) or game_dir.name)
+            self._version_refs[key] = self._version_refs.get(key, 0) + 1
+            return game_dir
+
+    def release_game(self, game_name: str, game_dir: Path) -> None:
+        """Release a version pinned by acquire_game."""
+        with self._version_lock:
+            key = (game_name, self._read_version_stamp(game_dir) or Path(game_dir).name)
+            count = self._version_refs.get(key, 0) - 1
+            if count > 0:
+                self._version_refs[key] = count
+            else:
+                self._version_refs.pop(key, None)
+        self.schedule_version_cleanup(game_name)
+
+    def cleanup_versions(self, game_name: str, keep: int = KEEP_PREVIOUS_VERSIONS) -> None:
+        """Delete old versions that are neither current, kept for rollback, nor in use."""
+        with self._version_lock:
+            versions_path = self._versions_path(game_name)
+            if not versions_path.exists():
+                return
+            current = self.get_current_version(game_name)
+            parked = sorted((stamp for stamp in self.get_game_versions(game_name) if stamp != current), reverse=True)
+            doomed = [stamp for stamp in parked[keep:] if self._version_refs.get((game_name, stamp), 0) == 0]
+            # Rename first so a half-deleted tree is never visible under its stamp
+            trash = [p for p in versions_path.iterdir() if p.name.startswith(".trash-")]
+            for stamp in doomed:
+                target = versions_path / f".trash-{stamp}"
+                os.rename(versions_path / stamp, target)
+                trash.append(target)
+
+        for target in trash:
+            shutil.rmtree(target, ignore_errors=True)
+
+    def schedule_version_cleanup(self, game_name: str) -> None:
+        """Run cleanup_versions in a background thread."""
+        threading.Thread(target=self.cleanup_versions, args=(game_name,), daemon=True).start()
+
+    def sync_from_repository(
+        self, source: str, names: Optional[List[str]] = None, max_workers: int = 4
+    ) -> List[tuple[str, bool, str]]:
+        """
+        Install or update games from a package repository.
+
+        source is the repository base URL, or a local directory of game ZIPs,
+        which is served through a temporary local repository server.
+        Returns a list of (game_name, success, message).
+        """
+        from .repository import (
+            REPOSITORY_INDEX,
+            PackageRepository,
+            RepositoryServer,
+            build_repository_index,
+            repository_cache_path,
+        )
+
+        source_dir = Path(source)
+        if not source_dir.is_dir():
+            return PackageRepository(source, max_workers=max_workers).sync(self, names)
+
+        # Cache by directory rather than by the server's ephemeral port
+        cache_path = repository_cache_path(str(source_dir.resolve()))
+        # Rebuilt every sync so added and replaced ZIPs are seen; unchanged ZIPs are not re-hashed.
+        # Kept in the cache, never written into the user's directory
+        index_path = cache_path / REPOSITORY_INDEX
+        build_repository_index(source_dir, index_path)
+        with RepositoryServer(source_dir, index_path=index_path) as server:
+            repository = PackageRepository(server.url, cache_path=cache_path, max_workers=max_workers)
+            return repository.sync(self, names)
 
     def _find_game_directory(self, search_path: Path) -> Optional[Path]:
         """Find directory containing game.json."""
@@ -107,13 +472,23 @@ class GameManager:
                 return Path(root)
         return None
 
-    def get_game_thumbnail(self, game_name: str) -> Optional[Path]:
-        """Get path to game thumbnail."""
+    def get_game_thumbnail(self, game_name: str, size: Optional[int] = None) -> Optional[Path]:
+        """
+        Get path to game thumbnail.
+        With a size, returns the cached downscaled thumbnail instead of the original.
+        """
         game_dir = self.games_path / game_name
-        thumbnail_path = game_dir / "assets" / "thumbnail.png"
-        if thumbnail_path.exists():
+        manifest = self._load_game_manifest(game_dir) or {}
+        thumbnail_path = game_dir / manifest.get("icon", DEFAULT_ICON)
+        if not thumbnail_path.exists():
+            return None
+        if size is None:
             return thumbnail_path
-        return None
+
+        if thumbnail_cache.is_stale(game_name, thumbnail_path):
+            thumbnail_cache.generate(game_name, thumbnail_path)
+        cached_path = thumbnail_cache.thumbnail_path(game_name, thumbnail_cache.best_size(size))
+        return cached_path if cached_path.exists() else None
 
     def get_game_main_module(self, game_name: str) -> Optional[str]:
         """Get the main module name for a game."""
@@ -128,5 +503,5 @@ class GameManager:
         return (game_dir / GAME_MANIFEST).exists()
 
 
-# Global game manager instance
-game_manager = GameManager()
+# Global game manager instance, created on first use
+game_manager = LazyProxy(GameManager)
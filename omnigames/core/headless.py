@@ -0,0 +1,94 @@
+"""Headless mode: run games without a display, unthrottled, from a seed and an input script."""
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .framebuffer import to_pygame_event
+
+
+class HeadlessRun:
+    """
+    Settings and scripted input for one headless session.
+
+    inputs are (game_time_seconds, event) pairs; event is a pygame event or an
+    input dict such as {"kind": "key_down", "key": "up"} or
+    {"kind": "mouse_down", "pos": (120, 80)}. Each event is delivered before
+    the first simulation step at or after its time.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        duration: float = 60.0,
+        inputs: Iterable[Tuple[float, Any]] = (),
+        render_every: int = 0,
+    ):
+        """Initialize run. render_every=N renders every Nth step offscreen; 0 never renders."""
+        self.seed = seed
+        self.duration = duration
+        self.inputs = sorted(inputs, key=lambda item: item[0])
+        self.render_every = render_every
+        # Progress, updated by the game as it runs
+        self.steps = 0
+        self.game_seconds = 0.0
+        self._next_input = 0
+
+    def events_until(self, game_time: float) -> List[Any]:
+        """Get the scripted events due at or before a game time, as pygame events."""
+        events = []
+        while self._next_input < len(self.inputs) and self.inputs[self._next_input][0] <= game_time:
+            event = self.inputs[self._next_input][1]
+            self._next_input += 1
+            if isinstance(event, dict):
+                event = to_pygame_event(event)
+            if event is not None:
+                events.append(event)
+        return events
+
+
+def load_script(path: Path) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Load an input script: a JSON list of events with their game time, e.g.
+    [{"t": 0.5, "kind": "key_down", "key": "up"}, {"t": 2, "kind": "quit"}].
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    script = []
+    for entry in entries:
+        event = dict(entry)
+        script.append((float(event.pop("t")), event))
+    return script
+
+
+_current_run: Optional[HeadlessRun] = None
+
+
+def begin(run: HeadlessRun) -> HeadlessRun:
+    """Make games created from now on run headless with these settings."""
+    global _current_run
+    # Must be set before pygame opens its display, which happens when the game creates its screen
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        import pygame
+
+        if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+            pygame.display.quit()
+    except ImportError:
+        pass
+    _current_run = run
+    return run
+
+
+def get_run() -> Optional[HeadlessRun]:
+    """Get the headless run in effect, or None for normal play."""
+    return _current_run
+
+
+def end() -> Optional[HeadlessRun]:
+    """Stop running new games headless and get the finished run. The display driver stays dummy."""
+    global _current_run
+    run, _current_run = _current_run, None
+    return run
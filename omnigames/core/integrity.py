@@ -0,0 +1,199 @@
+"""Integrity manifests and background verification of installed games."""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import CACHE_PATH
+
+INTEGRITY_MANIFEST = ".integrity.json"
+INTEGRITY_STATE_PATH = CACHE_PATH / "integrity.json"
+# Files that legitimately change after install and are never hashed
+IGNORED_FILES = {INTEGRITY_MANIFEST, ".version"}
+CHUNK_SIZE = 64 * 1024
+LOW_PRIORITY_NICE = 19
+
+
+def _hash_file(path: Path) -> str:
+    """Hash a file with SHA-256."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _game_files(game_dir: Path) -> List[Path]:
+    """List the files of a game that are covered by its manifest."""
+    files = []
+    for root, dirs, names in os.walk(game_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for name in names:
+            if name not in IGNORED_FILES and not name.endswith((".pyc", ".pyo")):
+                files.append(Path(root) / name)
+    return sorted(files)
+
+
+def write_integrity_manifest(game_dir: Path) -> Dict:
+    """Hash every file of a freshly installed game into .integrity.json."""
+    game_dir = Path(game_dir)
+    files = {}
+    for path in _game_files(game_dir):
+        files[path.relative_to(game_dir).as_posix()] = {"size": path.stat().st_size, "sha256": _hash_file(path)}
+    manifest = {"files": files}
+    with open(game_dir / INTEGRITY_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def _lower_thread_priority() -> None:
+    """
+    Run the calling worker thread at the lowest CPU priority.
+    On Linux the nice value applies per thread and also sets the default I/O
+    priority, so verification only uses otherwise idle disk and CPU time.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), LOW_PRIORITY_NICE)
+    except (AttributeError, OSError):
+        pass
+
+
+class IntegrityVerifier:
+    """Re-hash installed games in the background and report damaged ones."""
+
+    def __init__(self, state_path: Path = INTEGRITY_STATE_PATH, max_workers: int = 2):
+        """Initialize verifier."""
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, list]] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _load_state(self) -> Dict[str, list]:
+        """Load the (size, mtime) of every file last verified as intact."""
+        if self._state is None:
+            self._state = {}
+            if self.state_path.exists():
+                try:
+                    with open(self.state_path, "r", encoding="utf-8") as f:
+                        self._state = json.load(f)
+                except Exception as e:
+                    print(f"Error loading integrity state: {e}")
+        return self._state
+
+    def _save_state(self) -> None:
+        """Persist verification state atomically."""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.state_path.with_suffix(".tmp")
+        with self._lock:
+            data = json.dumps(self._state)
+        temp.write_text(data, encoding="utf-8")
+        os.replace(temp, self.state_path)
+
+    def _unchanged(self, path: Path, stat: os.stat_result) -> bool:
+        """Check if a file is still exactly as it was when last found intact."""
+        with self._lock:
+            return self._load_state().get(str(path)) == [stat.st_size, stat.st_mtime_ns]
+
+    def _mark_intact(self, path: Path, stat: os.stat_result) -> None:
+        """Remember a file as intact until its size or mtime changes."""
+        with self._lock:
+            self._load_state()[str(path)] = [stat.st_size, stat.st_mtime_ns]
+
+    def _check_structure(self, path: Path) -> Optional[str]:
+        """Check files of games installed without a manifest (e.g. bundled games)."""
+        try:
+            if path.suffix == ".py":
+                compile(path.read_bytes(), str(path), "exec")
+            elif path.suffix == ".json":
+                with open(path, "r", encoding="utf-8") as f:
+                    json.load(f)
+        except Exception as e:
+            return f"{path.name}: {e.__class__.__name__}"
+        return None
+
+    def verify_game(self, game_dir: Path) -> List[str]:
+        """
+        Verify one installed game. Returns a list of problems, empty if intact.
+        Files unchanged since their last successful check are not re-read.
+        """
+        game_dir = Path(os.path.realpath(game_dir))
+        manifest_path = game_dir / INTEGRITY_MANIFEST
+        problems = []
+
+        if not manifest_path.exists():
+            for path in _game_files(game_dir):
+                stat = path.stat()
+                if self._unchanged(path, stat):
+                    continue
+                problem = self._check_structure(path)
+                if problem:
+                    problems.append(problem)
+                else:
+                    self._mark_intact(path, stat)
+            return problems
+
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                expected = json.load(f)["files"]
+        except Exception as e:
+            return [f"{INTEGRITY_MANIFEST}: {e.__class__.__name__}"]
+
+        for relative, info in expected.items():
+            path = game_dir / relative
+            try:
+                stat = path.stat()
+            except OSError:
+                problems.append(f"{relative}: missing")
+                continue
+            if stat.st_size != info["size"]:
+                problems.append(f"{relative}: size changed")
+                continue
+            if self._unchanged(path, stat):
+                continue
+            if _hash_file(path) != info["sha256"]:
+                problems.append(f"{relative}: checksum mismatch")
+            else:
+                self._mark_intact(path, stat)
+        return problems
+
+    def verify_all(self, game_manager) -> Dict[str, List[str]]:
+        """Verify every installed game in a low-priority worker pool and mark broken ones."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        games = game_manager.get_installed_games()
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="integrity", initializer=_lower_thread_priority
+        ) as executor:
+            futures = {game["name"]: executor.submit(self.verify_game, Path(game["path"])) for game in games}
+            for game_name, future in futures.items():
+                try:
+                    results[game_name] = future.result()
+                except Exception as e:
+                    results[game_name] = [f"verification error: {e}"]
+                game_manager.set_game_problems(game_name, results[game_name])
+        self._save_state()
+        return results
+
+    def start(self, game_manager, delay: float = 2.0) -> None:
+        """Verify all games in the background once startup has settled."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        def run():
+            try:
+                self.verify_all(game_manager)
+            except Exception as e:
+                print(f"Integrity verification failed: {e}")
+
+        self._thread = threading.Timer(delay, run)
+        self._thread.daemon = True
+        self._thread.start()
+
+
+# Global integrity verifier instance
+integrity_verifier = IntegrityVerifier()
@@ -0,0 +1,339 @@
+"""UI-independent launcher service: users, games, sessions and reports."""
+import json
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import localization
+from .database import db
+from .game_manager import game_manager
+from .integrity import integrity_verifier
+from . import telemetry
+
+
+class LaunchedGame:
+    """Handle to a game session started by the launcher service."""
+
+    def __init__(self, service: "LauncherService", game_name: str, game_path: Optional[Path], user_id: int):
+        """Initialize handle."""
+        self.service = service
+        self.game_name = game_name
+        self.game_path = game_path
+        self.user_id = user_id
+        self.session = None
+        self.result: Optional[Dict[str, Any]] = None
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Get the session result without blocking, or None while the game runs."""
+        if self.result is None and self.session is not None:
+            result = self.session.poll()
+            if result is not None:
+                self.complete(result)
+        return self.result
+
+    def wait(self, poll_interval: float = 0.05) -> Dict[str, Any]:
+        """Block until the session ends and get its result."""
+        while self.poll() is None:
+            time.sleep(poll_interval)
+        return self.result
+
+    @property
+    def framebuffer(self):
+        """Frames of an embedded game (a SharedFramebuffer), or None until its screen exists."""
+        return self.session.framebuffer if self.session is not None else None
+
+    def send_input(self, event: Dict[str, Any]) -> None:
+        """Forward an input event to an embedded game."""
+        if self.session is not None:
+            self.session.send_input(event)
+
+    def complete(self, result: Dict[str, Any]) -> None:
+        """Release the pinned game version and record the result once."""
+        if self.result is not None:
+            return
+        self.result = result
+        if self.game_path is not None:
+            game_manager.release_game(self.game_name, self.game_path)
+        if not result.get("error"):
+            self.service.record_result(self.user_id, self.game_name, result)
+        if self.session is not None:
+            # Top up the pool if the session's worker could not be reused
+            self.service.preload_next_game()
+
+
+class InstallTask:
+    """A game install running on a background thread, with progress and cancellation."""
+
+    def __init__(self, zip_path: str):
+        """Initialize and start the install."""
+        self.zip_path = zip_path
+        self.events: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.progress: Optional[Dict[str, Any]] = None
+        self.result: Optional[tuple[bool, str]] = None
+        self._thread = threading.Thread(target=self._run, name="game-install", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Install the game. Runs on the worker thread."""
+        try:
+            self.result = game_manager.install_game_from_zip(
+                self.zip_path, progress=self.events.put, cancel=self.cancel_event
+            )
+        except Exception as e:
+            self.result = (False, f"Installation error: {str(e)}")
+
+    def cancel(self) -> None:
+        """Ask the install to stop; it aborts before the new version is activated."""
+        self.cancel_event.set()
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Get the most recent progress event without blocking (None before the first)."""
+        while True:
+            try:
+                self.progress = self.events.get_nowait()
+            except queue.Empty:
+                return self.progress
+
+    def is_done(self) -> bool:
+        """Check if the install finished, failed or was cancelled; see result."""
+        return not self._thread.is_alive()
+
+    def wait(self) -> tuple[bool, str]:
+        """Block until the install ends and get its result."""
+        self._thread.join()
+        return self.result
+
+
+class LauncherService:
+    """
+    Every launcher operation, free of any UI toolkit.
+    The Tk menu and the command line are both thin clients of this class.
+    """
+
+    def __init__(self):
+        """Initialize launcher service."""
+        self.current_user: Optional[Dict[str, Any]] = None
+        self._revisions = {"users": 0, "stats": 0}
+
+    def get_revision(self, kind: str) -> Any:
+        """
+        Get a marker that changes when "users", "games" or "stats" data changes.
+        Lets clients skip re-querying data they already show.
+        """
+        if kind == "games":
+            return game_manager.get_revision()
+        return self._revisions[kind]
+
+    # Users
+    def get_users(self) -> List[Dict[str, Any]]:
+        """Get all users."""
+        return [{"id": user["id"], "username": user["username"]} for user in db.get_all_users()]
+
+    def create_user(self, username: str) -> tuple[bool, str]:
+        """
+        Create a user profile.
+        Returns (success: bool, message: str)
+        """
+        username = username.strip()
+        if not username:
+            return False, localization.translate("enter_username")
+        if db.user_exists(username):
+            return False, f"User '{username}' already exists"
+        db.create_user(username)
+        self._revisions["users"] += 1
+        return True, f"{localization.translate('user_created')}: {username}"
+
+    def select_user(self, username: str) -> Optional[Dict[str, Any]]:
+        """Make a user current by name. Returns the user, or None if unknown."""
+        user = db.get_user(username)
+        self.current_user = {"id": user["id"], "username": user["username"]} if user else None
+        return self.current_user
+
+    def set_language(self, language: str) -> None:
+        """Set the language of the launcher and of launched games."""
+        localization.set_language(language)
+
+    # Games
+    def get_games(self, query: str = "") -> List[Dict[str, Any]]:
+        """Get installed games, optionally filtered by a catalog search query."""
+        if query.strip():
+            return game_manager.search_games(query)
+        return game_manager.get_installed_games()
+
+    def install_game(self, zip_path: str) -> tuple[bool, str]:
+        """
+        Install a game from a ZIP file.
+        Returns (success: bool, message: str)
+        """
+        return game_manager.install_game_from_zip(zip_path)
+
+    def start_install(self, zip_path: str) -> InstallTask:
+        """Install a game from a ZIP file on a background thread."""
+        return InstallTask(zip_path)
+
+    def sync_games(self, source: str, names: Optional[List[str]] = None) -> List[tuple[str, bool, str]]:
+        """Install or update games from a package repository URL or directory."""
+        return game_manager.sync_from_repository(source, names)
+
+    def rollback_game(self, game_name: str) -> tuple[bool, str]:
+        """
+        Switch a game back to its previous version.
+        Returns (success: bool, message: str)
+        """
+        return game_manager.rollback_game(game_name)
+
+    def start_background_services(self) -> None:
+        """Start work kept off the startup path: integrity checks and game process warm-up."""
+        from .runner import game_runner
+
+        integrity_verifier.start(game_manager)
+        game_runner.prewarm(background=True)
+
+    def preload_next_game(self) -> None:
+        """
+        Warm the game the current user most likely starts next, and top up
+        the pool of game worker processes. Returns immediately.
+        """
+        from .preloader import game_preloader
+        from .runner import game_runner
+
+        if self.current_user is not None:
+            game_preloader.schedule(self.current_user["id"])
+        game_runner.prewarm(background=True)
+
+    # Sessions
+    def start_game(
+        self,
+        game_name: str,
+        launched_at: Optional[float] = None,
+        trace_memory: bool = False,
+        embed: bool = False,
+        profile_frames: int = 0,
+    ) -> LaunchedGame:
+        """
+        Start a game for the current user and return immediately.
+        Games flagged "runner": "inprocess" run to completion before this returns.
+        Failures are reported through the handle's result["error"]; with
+        trace_memory, result["memory"] reports what the session left allocated.
+        With embed, pygame games open no window of their own: poll the
+        handle's framebuffer and forward input with send_input().
+        result["profile"] has per-phase frame times; with profile_frames the
+        first frames are also recorded with cProfile (paths in its "captures").
+        """
+        from .runner import game_runner
+
+        if self.current_user is None:
+            raise RuntimeError("No user selected")
+        launched_at = launched_at if launched_at is not None else time.time()
+        user_id = self.current_user["id"]
+
+        game_data = game_manager.get_game(game_name)
+        if game_data is None:
+            launched = LaunchedGame(self, game_name, None, user_id)
+            launched.complete(_error_result(f"Game '{game_name}' is not installed"))
+            return launched
+
+        # Pin the active version so an update during the session cannot swap files under it
+        game_path = game_manager.acquire_game(game_name)
+        launched = LaunchedGame(self, game_name, game_path, user_id)
+        if not (game_path / "main.py").exists():
+            launched.complete(_error_result(f"Game entry point not found: {game_path / 'main.py'}"))
+            return launched
+
+        try:
+            if game_data.get("runner") == "inprocess":
+                launched.complete(
+                    game_runner.run_in_process(
+                        game_path, game_name, user_id, localization.language, launched_at, trace_memory, profile_frames
+                    )
+                )
+            else:
+                launched.session = game_runner.launch(
+                    game_path,
+                    game_name,
+                    user_id,
+                    localization.language,
+                    launched_at,
+                    trace_memory,
+                    embed,
+                    profile_frames,
+                )
+        except Exception as e:
+            launched.complete(_error_result(str(e)))
+        return launched
+
+    def run_game(self, game_name: str, trace_memory: bool = False, profile_frames: int = 0) -> Dict[str, Any]:
+        """Run a game for the current user to completion and get its result."""
+        return self.start_game(game_name, trace_memory=trace_memory, profile_frames=profile_frames).wait()
+
+    def simulate_game(
+        self,
+        game_name: str,
+        duration: float = 60.0,
+        seed: int = 0,
+        inputs: Iterable[Tuple[float, Any]] = (),
+        render_every: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Run a pygame game headless in this process, as fast as it can simulate,
+        and get its result plus "steps" and "game_seconds". The same seed and
+        inputs give the same result. Nothing is recorded in user statistics.
+        """
+        from . import headless
+        from .runner import game_runner
+
+        game_data = game_manager.get_game(game_name)
+        if game_data is None:
+            return _error_result(f"Game '{game_name}' is not installed")
+        if game_data.get("runner") == "inprocess":
+            return _error_result(f"Game '{game_name}' cannot run headless")
+
+        game_path = game_manager.acquire_game(game_name)
+        run = headless.begin(headless.HeadlessRun(seed, duration, inputs, render_every))
+        try:
+            result = game_runner.run_in_process(game_path, game_name, 0, localization.language)
+        finally:
+            headless.end()
+            game_manager.release_game(game_name, game_path)
+        result["steps"] = run.steps
+        result["game_seconds"] = run.game_seconds
+        return result
+
+    def record_result(self, user_id: int, game_name: str, result: Dict[str, Any]) -> None:
+        """Store the statistics, telemetry and saved state of a finished session."""
+        summary = result.get("telemetry")
+        playtime = summary["duration_s"] if summary else result.get("playtime", 0)
+        db.update_game_stats(user_id, game_name, result.get("score"), int(round(playtime)))
+        if summary is not None:
+            db.record_session(user_id, game_name, summary)
+        if result.get("state") is not None:
+            db.save_game_data(user_id, game_name, json.dumps(result["state"], default=str))
+        self._revisions["stats"] += 1
+
+    # Reports
+    def get_report(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get per-game statistics and session averages for a user (default: current user)."""
+        user_id = user_id if user_id is not None else self.current_user["id"]
+        sessions = {row["game_name"]: dict(row) for row in db.get_session_summary(user_id)}
+        report = []
+        for stat in db.get_user_game_stats(user_id):
+            entry = dict(stat)
+            entry["sessions"] = sessions.get(stat["game_name"])
+            report.append(entry)
+        return report
+
+    def export_report(self, path: Path, user_id: Optional[int] = None) -> int:
+        """Write recorded sessions (of one user, or everyone) as CSV. Returns the row count."""
+        return telemetry.export_report(Path(path), db.get_sessions(user_id))
+
+
+def _error_result(message: str) -> Dict[str, Any]:
+    """Build the result of a session that could not start."""
+    return {"score": 0, "playtime": 0.0, "state": None, "telemetry": None, "memory": None, "profile": None, "error": message}
+
+
+# Global launcher service instance
+launcher = LauncherService()
@@ -0,0 +1,108 @@
+"""Lazily constructed global instances."""
+import threading
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """
+    Stand-in for a global instance that is only built on first use.
+
+    Lets modules expose singletons such as `db` without paying for their
+    construction (database connection, file checks...) at import time.
+
+    Attribute access, isinstance() and the common protocols (bool, len,
+    iteration, membership, indexing, calls, equality, str) are forwarded.
+    Other special methods are not; type(proxy) is still LazyProxy.
+    """
+
+    __slots__ = ("_factory", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        """Initialize proxy with the callable that builds the real instance."""
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_instance(self) -> Any:
+        """Build the instance on first call, then return it."""
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    instance = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def is_initialized(self) -> bool:
+        """Check if the real instance has been built."""
+        return object.__getattribute__(self, "_instance") is not None
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward attribute reads to the real instance."""
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Forward attribute writes to the real instance."""
+        setattr(self._get_instance(), name, value)
+
+    @property
+    def __class__(self):
+        """Report the real instance's class, so isinstance() checks see through the proxy."""
+        return type(self._get_instance())
+
+    def __dir__(self):
+        """List the real instance's attributes."""
+        return dir(self._get_instance())
+
+    def __bool__(self) -> bool:
+        """Truth value of the real instance."""
+        return bool(self._get_instance())
+
+    def __len__(self) -> int:
+        """Length of the real instance."""
+        return len(self._get_instance())
+
+    def __iter__(self):
+        """Iterate over the real instance."""
+        return iter(self._get_instance())
+
+    def __contains__(self, item: Any) -> bool:
+        """Membership test on the real instance."""
+        return item in self._get_instance()
+
+    def __getitem__(self, key: Any) -> Any:
+        """Index the real instance."""
+        return self._get_instance()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Assign an item on the real instance."""
+        self._get_instance()[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete an item from the real instance."""
+        del self._get_instance()[key]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the real instance."""
+        return self._get_instance()(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the real instance, also with another proxy of it."""
+        if type(other) is LazyProxy:
+            other = other._get_instance()
+        return self._get_instance() == other
+
+    def __hash__(self) -> int:
+        """Hash of the real instance, consistent with __eq__."""
+        return hash(self._get_instance())
+
+    def __str__(self) -> str:
+        """str() of the real instance."""
+        return str(self._get_instance())
+
+    def __repr__(self) -> str:
+        """Describe the proxy without forcing construction."""
+        if self.is_initialized():
+            return repr(self._get_instance())
+        return f"<LazyProxy of {object.__getattribute__(self, '_factory')!r}>"
@@ -0,0 +1,127 @@
+"""Load game entry points in isolation and unload everything they imported."""
+import gc
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Game entry points are imported as omnigames_games.<name>, never as a bare top-level name
+GAME_NAMESPACE = "omnigames_games"
+MEMORY_REPORT_TOP = 10
+
+
+class LoadedGame:
+    """A game's entry point module plus what is needed to undo its import."""
+
+    def __init__(self, game_path: Path, game_name: str, trace_memory: bool = False):
+        """Initialize and take the baseline: sys.path, sys.modules and a memory snapshot."""
+        self.game_path = Path(os.path.realpath(game_path))
+        self.game_name = game_name
+        self.module_name = f"{GAME_NAMESPACE}.{game_name}"
+        self.module: Optional[types.ModuleType] = None
+        self.path_before: List[str] = list(sys.path)
+        self.modules_before: Set[str] = set(sys.modules)
+        self.snapshot = None
+        self.started_tracing = False
+        if trace_memory:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.started_tracing = True
+            gc.collect()
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def owns(self, name: str, module: Any) -> bool:
+        """Check if a module was imported from this game (its entry point or a helper file)."""
+        if name == self.module_name:
+            return True
+        filename = getattr(module, "__file__", None)
+        if not filename:
+            return False
+        return os.path.realpath(filename).startswith(str(self.game_path) + os.sep)
+
+
+class GameModuleManager:
+    """
+    Import game entry points under a private namespace and unload them after
+    the session, so long-running launchers do not accumulate modules, game
+    objects or duplicate sys.path entries.
+    """
+
+    def _ensure_namespace(self) -> None:
+        """Register the parent package games are imported under."""
+        if GAME_NAMESPACE not in sys.modules:
+            namespace = types.ModuleType(GAME_NAMESPACE)
+            namespace.__path__ = []
+            sys.modules[GAME_NAMESPACE] = namespace
+
+    def load(self, game_path: Path, game_name: str, trace_memory: bool = False) -> LoadedGame:
+        """Import a game's main.py. The returned handle must be passed to unload()."""
+        loaded = LoadedGame(game_path, game_name, trace_memory)
+        self._ensure_namespace()
+        spec = importlib.util.spec_from_file_location(loaded.module_name, Path(game_path) / "main.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[loaded.module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            self.unload(loaded)
+            raise
+        loaded.module = module
+        return loaded
+
+    def unload(self, loaded: LoadedGame) -> Optional[Dict[str, Any]]:
+        """
+        Remove the game's modules and sys.path entries added since load().
+        Returns a memory report if the game was loaded with trace_memory.
+        """
+        from .base_game import BaseGame
+
+        for name in [name for name in sys.modules if name not in loaded.modules_before]:
+            if loaded.owns(name, sys.modules[name]):
+                del sys.modules[name]
+        # Games insert the launcher root into sys.path on every import
+        sys.path[:] = loaded.path_before
+        # The finished game object holds its surfaces; its state was already collected
+        BaseGame.active_game = None
+        loaded.module = None
+        gc.collect()
+
+        if loaded.snapshot is None:
+            return None
+        return self._memory_report(loaded)
+
+    def _memory_report(self, loaded: LoadedGame) -> Dict[str, Any]:
+        """Compare memory with the snapshot taken before load."""
+        import tracemalloc
+
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ]
+        after = tracemalloc.take_snapshot().filter_traces(filters)
+        before = loaded.snapshot.filter_traces(filters)
+        loaded.snapshot = None
+        if loaded.started_tracing:
+            tracemalloc.stop()
+
+        differences = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0]
+        return {
+            "retained_kb": round(sum(stat.size_diff for stat in differences) / 1024, 1),
+            "top": [
+                {
+                    "where": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "kb": round(stat.size_diff / 1024, 1),
+                    "blocks": stat.count_diff,
+                }
+                for stat in differences[:MEMORY_REPORT_TOP]
+            ],
+        }
+
+
+# Global game module manager instance
+game_modules = GameModuleManager()
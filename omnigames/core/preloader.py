@@ -0,0 +1,141 @@
+"""Predict the game a user will start next and warm it up in the background."""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .database import db
+from .game_manager import game_manager
+
+# A play counts half as much after this many days
+RECENCY_HALF_LIFE_DAYS = 7.0
+# Extra weight for the most recently played game, which users tend to resume
+LAST_PLAYED_BONUS = 2.0
+PAGE_CACHE_CHUNK_SIZE = 1024 * 1024
+
+
+def _parse_timestamp(value) -> Optional[float]:
+    """Parse an SQLite CURRENT_TIMESTAMP value (UTC) to epoch seconds."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def rank_games(stats: Iterable, now: Optional[float] = None) -> List[str]:
+    """
+    Rank games by how likely the user is to start them next.
+    Each play is weighted by how long ago the game was last played; the most
+    recently played game gets a bonus. Games never played are left out.
+    """
+    now = now if now is not None else time.time()
+    scores: Dict[str, float] = {}
+    last_played: Dict[str, float] = {}
+    for stat in stats:
+        game_name = stat["game_name"]
+        if not stat["times_played"]:
+            continue
+        played_at = _parse_timestamp(stat["last_played"]) or 0.0
+        age_days = max(0.0, now - played_at) / 86400.0
+        scores[game_name] = stat["times_played"] * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+        last_played[game_name] = played_at
+
+    if last_played:
+        scores[max(last_played, key=last_played.get)] += LAST_PLAYED_BONUS
+    return sorted(scores, key=lambda name: (-scores[name], name))
+
+
+def _warm_page_cache(game_dir: Path) -> int:
+    """Pull a game's files into the OS page cache. Returns the bytes touched."""
+    total = 0
+    for root, dirs, names in os.walk(game_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                with open(path, "rb") as f:
+                    if hasattr(os, "posix_fadvise"):
+                        size = os.fstat(f.fileno()).st_size
+                        os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+                        total += size
+                    else:
+                        while True:
+                            chunk = f.read(PAGE_CACHE_CHUNK_SIZE)
+                            if not chunk:
+                                break
+                            total += len(chunk)
+            except OSError:
+                pass
+    return total
+
+
+def _compile_bytecode(game_dir: Path) -> None:
+    """Write __pycache__ bytecode for a game so its first import skips compilation."""
+    import compileall
+
+    try:
+        compileall.compile_dir(str(game_dir), quiet=2)
+    except OSError:
+        pass  # Read-only install
+
+
+class GamePreloader:
+    """Warm the game a user is most likely to launch while they browse the menu."""
+
+    def __init__(self):
+        """Initialize preloader."""
+        self._thread: Optional[threading.Thread] = None
+
+    def predict(self, user_id: int) -> List[str]:
+        """
+        Get the user's installed games, most likely next launch first.
+        Queries the database, so call it from the thread that owns the connection.
+        """
+        ranked = rank_games(db.get_user_game_stats(user_id))
+        return [game_name for game_name in ranked if game_manager.is_game_installed(game_name)]
+
+    def warm(self, game_name: str, use_runner: bool = True) -> bool:
+        """
+        Warm one game: page cache, bytecode, locales and, for out-of-process
+        games, a worker process with the game already imported.
+        Returns False if the game is not installed.
+        """
+        game_data = game_manager.get_game(game_name)
+        if game_data is None:
+            return False
+        # Warm the pinned version directory the next launch will use
+        game_dir = Path(os.path.realpath(game_data["path"]))
+        _warm_page_cache(game_dir)
+        _compile_bytecode(game_dir)
+        game_manager.get_game_locales(Path(game_data["path"]))
+
+        if use_runner and game_data.get("runner") != "inprocess":
+            from .runner import game_runner
+
+            game_runner.preload(game_dir, game_name)
+        return True
+
+    def schedule(self, user_id: int, use_runner: bool = True) -> None:
+        """Predict the user's most likely next game, then warm it on a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        candidates = self.predict(user_id)
+        if not candidates:
+            return
+
+        def run():
+            try:
+                self.warm(candidates[0], use_runner)
+            except Exception as e:
+                print(f"Preloading failed: {e}")
+
+        self._thread = threading.Thread(target=run, name="game-preloader", daemon=True)
+        self._thread.start()
+
+
+# Global game preloader instance
+game_preloader = GamePreloader()
@@ -0,0 +1,195 @@
+"""Per-phase frame timing, an on-screen overlay and cProfile captures for games."""
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import CACHE_PATH
+from .telemetry import BUCKET_COUNT, BUCKET_MS
+from .text_cache import text_cache
+
+PHASES = ("events", "update", "render")
+# Frames the rolling statistics cover: a few seconds at 60 fps
+WINDOW_FRAMES = 240
+OVERLAY_REFRESH_S = 0.25
+PROFILES_PATH = CACHE_PATH / "profiles"
+DEFAULT_CAPTURE_FRAMES = 300
+# Hotkeys handled for every game, by pygame key name
+OVERLAY_KEY = "f3"
+CAPTURE_KEY = "f4"
+
+_BUCKET_NS = int(BUCKET_MS * 1_000_000)
+
+
+class RollingHistogram:
+    """Frame-time histogram over the last WINDOW_FRAMES samples; adding a sample is O(1)."""
+
+    def __init__(self, window: int = WINDOW_FRAMES):
+        """Initialize empty histogram."""
+        self.window = window
+        self.buckets = [0] * (BUCKET_COUNT + 1)
+        self._samples = array("q", [0] * window)
+        self._next = 0
+        self.count = 0
+        self.total_ns = 0
+
+    def add(self, duration_ns: int) -> None:
+        """Record one sample, forgetting the oldest once the window is full."""
+        if self.count == self.window:
+            old = self._samples[self._next]
+            self.total_ns -= old
+            self.buckets[min(old // _BUCKET_NS, BUCKET_COUNT)] -= 1
+        else:
+            self.count += 1
+        self._samples[self._next] = duration_ns
+        self._next = (self._next + 1) % self.window
+        self.total_ns += duration_ns
+        self.buckets[min(duration_ns // _BUCKET_NS, BUCKET_COUNT)] += 1
+
+    def mean_ms(self) -> float:
+        """Average sample in ms."""
+        return self.total_ns / self.count / 1_000_000 if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Get a percentile in ms (upper edge of its bucket)."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return (index + 1) * BUCKET_MS
+        return (BUCKET_COUNT + 1) * BUCKET_MS
+
+
+class FrameProfiler:
+    """
+    Time the events, update and render phases of every frame.
+    Costs a few perf_counter_ns() calls per frame, so it is always on; the
+    overlay (F3) and cProfile captures (F4) only cost anything when used.
+    """
+
+    def __init__(self, game_name: str):
+        """Initialize profiler for one game session."""
+        self.game_name = game_name
+        self.phases: Dict[str, RollingHistogram] = {phase: RollingHistogram() for phase in PHASES}
+        self.frames = RollingHistogram()
+        self.overlay_enabled = False
+        self.captures: List[Path] = []
+        self._last_frame_ns: Optional[int] = None
+        self._overlay = None
+        self._overlay_font = None
+        self._overlay_updated = 0.0
+        self._capture = None
+        self._capture_frames_left = 0
+        if _requested_capture_frames:
+            self.start_capture(_requested_capture_frames)
+            request_capture(0)
+
+    def record(self, events_ns: int, update_ns: int, render_ns: int) -> None:
+        """Record the phase durations of one frame."""
+        self.phases["events"].add(events_ns)
+        self.phases["update"].add(update_ns)
+        self.phases["render"].add(render_ns)
+        now = time.perf_counter_ns()
+        if self._last_frame_ns is not None:
+            self.frames.add(now - self._last_frame_ns)
+        self._last_frame_ns = now
+        if self._capture is not None:
+            self._capture_frames_left -= 1
+            if self._capture_frames_left <= 0:
+                self.stop_capture()
+
+    def idle(self) -> None:
+        """Mark a pause in rendering; the time until the next frame is not counted as a frame."""
+        self._last_frame_ns = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Get mean and p99 ms per phase and the frame rate over the recent window, and text cache hits."""
+        summary: Dict[str, Any] = {
+            phase: {"mean_ms": round(stats.mean_ms(), 3), "p99_ms": stats.percentile(0.99)}
+            for phase, stats in self.phases.items()
+        }
+        mean_frame_ms = self.frames.mean_ms()
+        summary["fps"] = round(1000.0 / mean_frame_ms, 1) if mean_frame_ms else 0.0
+        summary["frame_p99_ms"] = self.frames.percentile(0.99)
+        summary["captures"] = [str(path) for path in self.captures]
+        summary["text_cache"] = text_cache.stats()
+        return summary
+
+    # Hotkeys
+    def handle_event(self, event: Any) -> bool:
+        """Handle the profiler hotkeys. Returns True if the event was used."""
+        import pygame
+
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.key.key_code(OVERLAY_KEY):
+            self.overlay_enabled = not self.overlay_enabled
+            return True
+        if event.key == pygame.key.key_code(CAPTURE_KEY):
+            if self._capture is None:
+                self.start_capture()
+            return True
+        return False
+
+    # Overlay
+    def draw_overlay(self, surface: Any) -> Any:
+        """
+        Draw the statistics in the top-left corner and get the rect drawn over.
+        The text is re-rendered a few times per second.
+        """
+        import pygame
+
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_updated >= OVERLAY_REFRESH_S:
+            if self._overlay_font is None:
+                self._overlay_font = pygame.font.Font(None, 20)
+            summary = self.summary()
+            lines = [f"{summary['fps']:.0f} fps  p99 {summary['frame_p99_ms']:.1f} ms"]
+            for phase in PHASES:
+                lines.append(f"{phase:<7} {summary[phase]['mean_ms']:.2f} ms  p99 {summary[phase]['p99_ms']:.1f}")
+            if self._capture is not None:
+                lines.append(f"profiling... {self._capture_frames_left} frames")
+            rendered = [self._overlay_font.render(line, True, (255, 255, 0)) for line in lines]
+            self._overlay = pygame.Surface(
+                (max(line.get_width() for line in rendered) + 8, sum(line.get_height() for line in rendered) + 8)
+            )
+            self._overlay.set_alpha(200)
+            y = 4
+            for line in rendered:
+                self._overlay.blit(line, (4, y))
+                y += line.get_height()
+            self._overlay_updated = now
+        return surface.blit(self._overlay, (0, 0))
+
+    # cProfile captures
+    def start_capture(self, frames: int = DEFAULT_CAPTURE_FRAMES) -> None:
+        """Profile the next frames with cProfile; the .pstats file is written when they are done."""
+        import cProfile
+
+        self._capture = cProfile.Profile()
+        self._capture_frames_left = frames
+        self._capture.enable()
+
+    def stop_capture(self) -> Optional[Path]:
+        """End a capture early or on schedule and write it out. Returns the .pstats path."""
+        if self._capture is None:
+            return None
+        capture, self._capture = self._capture, None
+        capture.disable()
+        PROFILES_PATH.mkdir(parents=True, exist_ok=True)
+        path = PROFILES_PATH / f"{self.game_name}-{time.strftime('%Y%m%d-%H%M%S')}-{len(self.captures)}.pstats"
+        capture.dump_stats(str(path))
+        self.captures.append(path)
+        return path
+
+
+_requested_capture_frames = 0
+
+
+def request_capture(frames: int) -> None:
+    """Make the next game started in this process profile its first frames (0 cancels)."""
+    global _requested_capture_frames
+    _requested_capture_frames = frames
@@ -0,0 +1,91 @@
+"""Process-wide pygame runtime: initialized once, then lent to one game session at a time."""
+from typing import Any, Optional, Tuple
+
+# Window title while no game holds the display
+DEFAULT_CAPTION = "omniGames"
+
+
+class PygameRuntime:
+    """
+    Keep pygame initialized for the whole process.
+
+    Games get their display surface from display() instead of set_mode() and
+    leave pygame running in cleanup(). Between sessions reset() puts back the
+    settings a game may have changed and hides the window, so the next game
+    starts with a clean state but skips SDL's init and window creation.
+    A game that still calls pygame.quit() only costs the next session a re-init.
+    """
+
+    def __init__(self):
+        """Initialize runtime; pygame itself is initialized on first use."""
+        # How often pygame had to be initialized; stays at 1 while games share the runtime
+        self.init_count = 0
+        self._hidden = False
+
+    @property
+    def initialized(self) -> bool:
+        """Check if pygame and its display are initialized."""
+        import pygame
+
+        return pygame.get_init() and pygame.display.get_init()
+
+    def start(self) -> bool:
+        """Initialize pygame unless it already is. Returns True if it was initialized now."""
+        import pygame
+
+        if self.initialized:
+            return False
+        pygame.init()
+        self.init_count += 1
+        self._hidden = False
+        return True
+
+    def display(self, size: Tuple[int, int], caption: Optional[str] = None) -> Any:
+        """
+        Lend the display surface to a game at the given size. The window is
+        reused, and only resized or shown again if needed.
+        """
+        import pygame
+
+        self.start()
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != tuple(size) or self._hidden:
+            screen = pygame.display.set_mode(size, pygame.SHOWN if self._hidden else 0)
+            self._hidden = False
+        else:
+            screen.fill((0, 0, 0))
+        pygame.display.set_caption(caption or DEFAULT_CAPTION)
+        return screen
+
+    def reset(self) -> None:
+        """
+        Undo per-game settings after a session: caption, key repeat, event
+        filters, input grab, cursor, playing sounds and queued events. A real
+        window is hidden until the next game asks for the display.
+        """
+        import pygame
+
+        if not self.initialized:
+            return  # The game shut pygame down itself
+        pygame.display.set_caption(DEFAULT_CAPTION)
+        pygame.key.set_repeat()
+        pygame.event.set_allowed(None)
+        pygame.event.set_grab(False)
+        pygame.mouse.set_visible(True)
+        if pygame.mixer.get_init():
+            pygame.mixer.stop()
+        pygame.event.clear()
+        if pygame.display.get_surface() is not None and pygame.display.get_driver() != "dummy" and not self._hidden:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self._hidden = True
+
+    def shutdown(self) -> None:
+        """Quit pygame for good, e.g. when the process exits."""
+        import pygame
+
+        pygame.quit()
+        self._hidden = False
+
+
+# Global pygame runtime instance
+pygame_runtime = PygameRuntime()
@@ -0,0 +1,188 @@
+"""Rendering helpers: cached static layers and dirty-rectangle redraws."""
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Above this share of the screen, one full redraw and flip is cheaper than many rectangles
+FULL_UPDATE_RATIO = 0.5
+
+
+class StaticLayer:
+    """
+    Part of a screen that does not change during play, such as a grid, a
+    board or a HUD frame, drawn once into its own converted surface.
+    It is drawn again only when requested with a different size or theme.
+    """
+
+    def __init__(self, draw: Callable[[Any, Hashable], None], opaque: bool = False):
+        """
+        Initialize layer. draw(surface, theme) paints the layer; an opaque layer
+        must cover its whole surface, other layers start out transparent.
+        """
+        self.draw = draw
+        self.opaque = opaque
+        self.surface = None
+        # Changes every time the layer is drawn again
+        self.version = 0
+        self._key: Optional[Tuple[Tuple[int, int], Hashable]] = None
+
+    def get(self, size: Tuple[int, int], theme: Hashable = None) -> Any:
+        """Get the layer's surface, drawing it first if the size or theme changed."""
+        import pygame
+
+        if self.surface is None or self._key != (tuple(size), theme):
+            if self.opaque:
+                surface = pygame.Surface(size).convert()
+            else:
+                surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            self.draw(surface, theme)
+            self.surface = surface
+            self._key = (tuple(size), theme)
+            self.version += 1
+        return self.surface
+
+
+class LayerStack:
+    """Static layers flattened into one surface, so each frame starts with a single blit."""
+
+    def __init__(self, *layers: StaticLayer):
+        """Initialize stack, bottom layer first; the bottom layer should be opaque."""
+        self.layers = list(layers)
+        self.surface = None
+        self._versions: Optional[List[int]] = None
+
+    def compose(self, size: Tuple[int, int], theme: Hashable = None) -> Any:
+        """Get the flattened layers, rebuilding only if a layer was drawn again."""
+        import pygame
+
+        surfaces = [layer.get(size, theme) for layer in self.layers]
+        versions = [layer.version for layer in self.layers]
+        if self.surface is None or versions != self._versions:
+            self.surface = pygame.Surface(size).convert()
+            for surface in surfaces:
+                self.surface.blit(surface, (0, 0))
+            self._versions = versions
+        return self.surface
+
+
+class DirtyRenderer:
+    """
+    Retained drawing list for a game's screen.
+
+    Each frame the game declares what it shows as keyed items (rectangles,
+    blits); items it stops declaring disappear. flush() compares the frame
+    with the previous one, restores the background under the rectangles that
+    changed, redraws the items overlapping them and returns those rectangles
+    for BaseGame.present(). Large changes fall back to a full redraw.
+    """
+
+    def __init__(self, screen: Any, background: Any, full_update_ratio: float = FULL_UPDATE_RATIO):
+        """Initialize renderer. background is a surface the size of the screen, or a fill color."""
+        self.screen = screen
+        self.full_update_ratio = full_update_ratio
+        self.background = None
+        # key -> (content, rect, surface or None), in drawing order
+        self._items: Dict[Hashable, Tuple[Any, Any, Any]] = {}
+        self._frame: Dict[Hashable, Tuple[Any, Any, Any]] = {}
+        self._dirty: List[Any] = []
+        self._full = True
+        self.set_background(background)
+
+    def set_background(self, background: Any) -> None:
+        """Replace the background; the next flush redraws the whole screen."""
+        import pygame
+
+        if not isinstance(background, pygame.Surface):
+            color = background
+            background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            background.fill(color)
+        self.background = background
+        self._full = True
+
+    def invalidate(self, rect: Optional[Any] = None) -> None:
+        """Force a region (default: the whole screen) to be redrawn at the next flush."""
+        import pygame
+
+        if rect is None:
+            self._full = True
+        else:
+            self._dirty.append(pygame.Rect(rect))
+
+    # Declaring a frame
+    def draw_rect(self, key: Hashable, color: Any, rect: Any, width: int = 0) -> None:
+        """Show a filled (or, with width, outlined) rectangle."""
+        import pygame
+
+        self._frame[key] = (("rect", tuple(color), width), pygame.Rect(rect), None)
+
+    def blit(self, key: Hashable, surface: Any, position: Tuple[int, int], token: Hashable = None) -> None:
+        """
+        Show a surface. The item counts as changed when it moves or gets a new
+        surface; pass a token (e.g. the rendered text) to compare that instead.
+        """
+        content = ("blit", token if token is not None else id(surface))
+        self._frame[key] = (content, surface.get_rect(topleft=position), surface)
+
+    # Pushing a frame
+    def flush(self) -> Optional[List[Any]]:
+        """
+        Draw the declared frame onto the screen.
+        Returns the rectangles that changed, or None if the whole screen was redrawn.
+        """
+        previous, current = self._items, self._frame
+        dirty = self._dirty
+        for key, (content, rect, _) in current.items():
+            old = previous.get(key)
+            if old is None:
+                dirty.append(rect)
+            elif old[0] != content or old[1] != rect:
+                dirty.append(old[1])
+                dirty.append(rect)
+        for key, (_, rect, _) in previous.items():
+            if key not in current:
+                dirty.append(rect)
+        self._items, self._frame, self._dirty = current, {}, []
+
+        screen_rect = self.screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+        if self._full or sum(rect.width * rect.height for rect in dirty) > self.full_update_ratio * (
+            screen_rect.width * screen_rect.height
+        ):
+            self._full = False
+            self.screen.blit(self.background, (0, 0))
+            for item in current.values():
+                self._draw(item)
+            return None
+
+        dirty = _merge_overlapping(dirty)
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.screen.blit(self.background, rect, rect)
+            for item in current.values():
+                if item[1].colliderect(rect):
+                    self._draw(item)
+        self.screen.set_clip(None)
+        return dirty
+
+    def _draw(self, item: Tuple[Any, Any, Any]) -> None:
+        """Draw one item."""
+        import pygame
+
+        content, rect, surface = item
+        if surface is not None:
+            self.screen.blit(surface, rect)
+        else:
+            _, color, width = content
+            pygame.draw.rect(self.screen, color, rect, width)
+
+
+def _merge_overlapping(rects: List[Any]) -> List[Any]:
+    """Union rectangles that overlap, so no region is redrawn twice."""
+    merged: List[Any] = []
+    for rect in rects:
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
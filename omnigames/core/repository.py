@@ -0,0 +1,398 @@
+"""Package repository client and local stand-in server for game sync."""
+import email.utils
+import hashlib
+import json
+import os
+import re
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .config import CACHE_PATH
+
+REPOSITORY_INDEX = "index.json"
+REPOSITORY_CACHE_PATH = CACHE_PATH / "repository"
+CHUNK_SIZE = 64 * 1024
+DEFAULT_TIMEOUT = 30
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file with SHA-256."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def repository_cache_path(source: str) -> Path:
+    """Get the cache folder for a repository URL or directory."""
+    return REPOSITORY_CACHE_PATH / hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+
+def build_repository_index(directory: Path, index_path: Optional[Path] = None) -> Dict:
+    """
+    Write index.json for a directory of game ZIPs, by default into that directory.
+    Each ZIP must contain a game.json; its name and version are published.
+    ZIPs whose size and mtime match the previous index at index_path are not read again.
+    """
+    directory = Path(directory)
+    index_path = Path(index_path or directory / REPOSITORY_INDEX)
+    previous = {}
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            previous = {package["file"]: package for package in json.load(f).get("packages", [])}
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    packages = []
+    for zip_path in sorted(directory.glob("*.zip")):
+        stat = zip_path.stat()
+        known = previous.get(zip_path.name)
+        if known and known.get("size") == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns:
+            packages.append(known)
+            continue
+        try:
+            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                manifest_name = next(n for n in zip_ref.namelist() if n.endswith("game.json"))
+                manifest = json.loads(zip_ref.read(manifest_name).decode("utf-8"))
+        except Exception as e:
+            print(f"Skipping {zip_path.name}: {e}")
+            continue
+        packages.append(
+            {
+                "name": manifest["name"],
+                "title": manifest.get("title", manifest["name"]),
+                "version": manifest.get("version", "0"),
+                "file": zip_path.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(zip_path),
+            }
+        )
+
+    index = {"packages": packages}
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temp = index_path.with_name(index_path.name + ".tmp")
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp, index_path)
+    return index
+
+
+def is_plain_file_name(name: str) -> bool:
+    """
+    Check that a file or game name from an index is a single plain path
+    component, so joining it to a folder cannot point outside that folder.
+    """
+    if not isinstance(name, str) or name in ("", ".", ".."):
+        return False
+    return Path(name).name == name and "/" not in name and os.sep not in name
+
+
+class RepositoryRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with ETag, conditional GET and single Range support."""
+
+    # Served as /index.json instead of a file of that name in the directory, if set
+    index_path: Optional[Path] = None
+
+    def translate_path(self, path: str) -> str:
+        """Map the index URL to index_path when the index is kept outside the directory."""
+        if self.index_path is not None and urllib.parse.urlsplit(path).path == "/" + REPOSITORY_INDEX:
+            return str(self.index_path)
+        return super().translate_path(path)
+
+    def log_message(self, format, *args):
+        """Keep the launcher console quiet."""
+        pass
+
+    def _etag(self, stat: os.stat_result) -> str:
+        """Build a strong validator from size and mtime."""
+        return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+    def send_head(self):
+        """Serve a file honoring If-None-Match, If-Modified-Since, Range and If-Range."""
+        path = Path(self.translate_path(self.path))
+        if not path.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        stat = path.stat()
+        etag = self._etag(stat)
+        last_modified = self.date_time_string(int(stat.st_mtime))
+
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        not_modified = False
+        if if_none_match:
+            not_modified = etag in [tag.strip() for tag in if_none_match.split(",")]
+        elif if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+                not_modified = int(stat.st_mtime) <= since
+            except (TypeError, ValueError):
+                pass
+        if not_modified:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            return None
+
+        start, end = 0, stat.st_size - 1
+        partial = False
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (not if_range or if_range == etag):
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header.strip())
+            if match:
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), end)
+                if start > end:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{stat.st_size}")
+                    self.end_headers()
+                    return None
+                partial = True
+
+        f = open(path, "rb")
+        f.seek(start)
+        self._remaining = end - start + 1
+        self.send_response(HTTPStatus.PARTIAL_CONTENT if partial else HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(self._remaining))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{stat.st_size}")
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile):
+        """Copy only the requested byte range."""
+        remaining = self._remaining
+        while remaining > 0:
+            chunk = source.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+
+
+class RepositoryServer:
+    """Local stand-in for a package repository, serving a directory over HTTP."""
+
+    def __init__(self, directory: Path, host: str = "127.0.0.1", port: int = 0, index_path: Optional[Path] = None):
+        """Initialize server. Port 0 picks a free port; index_path serves an index kept elsewhere."""
+        self.directory = Path(directory)
+        handler_class = type("IndexedRequestHandler", (RepositoryRequestHandler,), {"index_path": index_path})
+        handler = lambda *args, **kwargs: handler_class(*args, directory=str(self.directory), **kwargs)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the served repository."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "RepositoryServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="repository-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "RepositoryServer":
+        """Start serving for the duration of a with block."""
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        """Stop serving at the end of a with block."""
+        self.stop()
+
+
+class PackageRepository:
+    """Client for a game package repository served over HTTP."""
+
+    def __init__(self, base_url: str, cache_path: Optional[Path] = None, max_workers: int = 4):
+        """Initialize repository client."""
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.cache_path = Path(cache_path or repository_cache_path(self.base_url))
+        self.downloads_path = self.cache_path / "downloads"
+        self.state_path = self.cache_path / "state.json"
+        self.max_workers = max_workers
+        self._install_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Load cached catalog, validators and installed package hashes."""
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"Error loading repository state: {e}")
+        return {"catalog": None, "etag": None, "last_modified": None, "installed": {}}
+
+    def _save_state(self) -> None:
+        """Persist state atomically."""
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        temp = self.state_path.with_suffix(".tmp")
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(temp, self.state_path)
+
+    def fetch_catalog(self) -> Tuple[Dict, bool]:
+        """
+        Fetch the repository index, revalidating the cached copy.
+        Returns (catalog, changed).
+        """
+        request = urllib.request.Request(urllib.parse.urljoin(self.base_url, REPOSITORY_INDEX))
+        if self.state.get("catalog") is not None:
+            if self.state.get("etag"):
+                request.add_header("If-None-Match", self.state["etag"])
+            if self.state.get("last_modified"):
+                request.add_header("If-Modified-Since", self.state["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=DEFAULT_TIMEOUT) as response:
+                catalog = json.loads(response.read().decode("utf-8"))
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as e:
+            if e.code == HTTPStatus.NOT_MODIFIED:
+                return self.state["catalog"], False
+            raise
+
+        with self._state_lock:
+            self.state.update({"catalog": catalog, "etag": etag, "last_modified": last_modified})
+            self._save_state()
+        return catalog, True
+
+    def download(self, package: Dict) -> Tuple[bool, str]:
+        """
+        Download a package, resuming a previous partial transfer with HTTP Range.
+        Returns (success, path or error message). The file is hash-checked.
+        """
+        if not is_plain_file_name(package.get("file", "")):
+            return False, f"Invalid package file name for {package.get('name')}: {package.get('file')!r}"
+        self.downloads_path.mkdir(parents=True, exist_ok=True)
+        target = self.downloads_path / package["file"]
+        part = target.with_name(target.name + ".part")
+        validator_path = target.with_name(target.name + ".etag")
+        expected = package.get("sha256")
+
+        if target.exists() and (not expected or file_sha256(target) == expected):
+            return True, str(target)
+
+        url = urllib.parse.urljoin(self.base_url, urllib.parse.quote(package["file"]))
+        request = urllib.request.Request(url)
+        offset = part.stat().st_size if part.exists() else 0
+        if offset:
+            request.add_header("Range", f"bytes={offset}-")
+            # Only resume if the remote file is still the one we started with
+            if validator_path.exists():
+                request.add_header("If-Range", validator_path.read_text(encoding="utf-8"))
+
+        try:
+            with urllib.request.urlopen(request, timeout=DEFAULT_TIMEOUT) as response:
+                if response.status != HTTPStatus.PARTIAL_CONTENT:
+                    offset = 0
+                etag = response.headers.get("ETag")
+                if etag:
+                    validator_path.write_text(etag, encoding="utf-8")
+                with open(part, "ab" if offset else "wb") as f:
+                    for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                        f.write(chunk)
+        except urllib.error.HTTPError as e:
+            if e.code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # Stale partial file larger than the package; restart next time
+                part.unlink(missing_ok=True)
+            return False, f"Download error for {package['name']}: {e}"
+        except (urllib.error.URLError, OSError) as e:
+            # Keep the partial file so the next sync resumes from here
+            return False, f"Download interrupted for {package['name']}: {e}"
+
+        if expected and file_sha256(part) != expected:
+            part.unlink(missing_ok=True)
+            validator_path.unlink(missing_ok=True)
+            return False, f"Checksum mismatch for {package['name']}"
+
+        os.replace(part, target)
+        validator_path.unlink(missing_ok=True)
+        return True, str(target)
+
+    def outdated_packages(self, catalog: Dict, game_manager, names: Optional[List[str]] = None) -> List[Dict]:
+        """Get catalog packages that are not installed or differ from the installed copy."""
+        installed = self.state.get("installed", {})
+        packages = []
+        for package in catalog.get("packages", []):
+            if names is not None and package["name"] not in names:
+                continue
+            if installed.get(package["name"]) == package.get("sha256") and game_manager.is_game_installed(package["name"]):
+                continue
+            packages.append(package)
+        return packages
+
+    def _download_and_install(self, package: Dict, game_manager) -> Tuple[bool, str]:
+        """Download one package and hand it to the installer."""
+        success, result = self.download(package)
+        if not success:
+            return False, result
+
+        # The installer extracts through a shared temp folder; run one at a time
+        with self._install_lock:
+            success, message = game_manager.install_game_from_zip(result)
+        if success:
+            with self._state_lock:
+                self.state.setdefault("installed", {})[package["name"]] = package.get("sha256")
+                self._save_state()
+            Path(result).unlink(missing_ok=True)
+        return success, message
+
+    def sync(self, game_manager, names: Optional[List[str]] = None) -> List[Tuple[str, bool, str]]:
+        """
+        Bring installed games up to date with the repository.
+        Only changed packages are downloaded, concurrently through a bounded pool.
+        Returns a list of (game_name, success, message).
+        """
+        catalog, _ = self.fetch_catalog()
+        packages = self.outdated_packages(catalog, game_manager, names)
+        if not packages:
+            return []
+
+        # Game names become folder names under games/; never let an index pick a path
+        results = [
+            (package["name"], False, f"Invalid game name in index: {package['name']!r}")
+            for package in packages
+            if not is_plain_file_name(package["name"])
+        ]
+        packages = [package for package in packages if is_plain_file_name(package["name"])]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="repository") as executor:
+            futures = [(package, executor.submit(self._download_and_install, package, game_manager)) for package in packages]
+            for package, future in futures:
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, f"Sync error for {package['name']}: {e}"
+                results.append((package["name"], success, message))
+        return results
@@ -0,0 +1,444 @@
+"""Out-of-process game runner with a pool of pre-warmed worker processes."""
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Modules every worker needs, imported once in the fork server where available
+PRELOAD_MODULES = ["pygame", "omnigames.core.base_game"]
+DEFAULT_POOL_SIZE = 1
+
+
+def _get_context():
+    """
+    Get the multiprocessing context for workers.
+    On POSIX a fork server acts as a zygote: it imports pygame once and forks
+    each worker from that warm state. The Tk process itself is never forked.
+    """
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(PRELOAD_MODULES)
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _warm_up() -> None:
+    """Pay import and init costs before a game is requested."""
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    # SDL would turn SIGTERM into a quit event, leaving terminate() unable to stop a worker
+    os.environ.setdefault("SDL_NO_SIGNAL_HANDLERS", "1")
+    try:
+        from omnigames.core.pygame_runtime import pygame_runtime
+
+        pygame_runtime.start()
+    except ImportError:
+        pass
+    import omnigames.core.base_game  # noqa: F401
+
+
+def _run_job(job: Dict[str, Any], loaded=None) -> Dict[str, Any]:
+    """
+    Load a game's entry point, run one session and unload the game again.
+    loaded is the game's LoadedGame if it was already imported by a preload.
+    """
+    from omnigames.core import profiler, telemetry
+    from omnigames.core.assets import ASSET_DIR_NAME, asset_manager
+    from omnigames.core.base_game import BaseGame
+    from omnigames.core.modules import game_modules
+
+    result = {
+        "score": 0,
+        "playtime": 0.0,
+        "state": None,
+        "error": None,
+        "telemetry": None,
+        "memory": None,
+        "profile": None,
+    }
+    started = time.monotonic()
+    telemetry.begin_session(job.get("launched_at"))
+    profiler.request_capture(job.get("profile_frames", 0))
+    # Images and sounds decode on a thread while the game imports and opens its screen
+    asset_manager.preload(Path(job["game_path"]) / ASSET_DIR_NAME)
+    try:
+        if loaded is None:
+            loaded = game_modules.load(job["game_path"], job["game_name"], job.get("trace_memory", False))
+        if not hasattr(loaded.module, "main"):
+            result["error"] = "Game has no 'main' function"
+            return result
+
+        result["score"] = loaded.module.main(job["user_id"], job["language"])
+        if BaseGame.active_game is not None:
+            result["state"] = BaseGame.active_game.get_game_state()
+            result["profile"] = BaseGame.active_game.profiler.summary()
+    except SystemExit:
+        pass
+    except Exception:
+        result["error"] = traceback.format_exc()
+    finally:
+        result["playtime"] = time.monotonic() - started
+        result["telemetry"] = telemetry.end_session()
+        profiler.request_capture(0)
+        if loaded is not None:
+            result["memory"] = game_modules.unload(loaded)
+    return result
+
+
+def _make_job(
+    game_path: Path,
+    game_name: str,
+    user_id: int,
+    language: str,
+    launched_at: Optional[float],
+    trace_memory: bool = False,
+    embed: bool = False,
+    profile_frames: int = 0,
+) -> Dict[str, Any]:
+    """Describe one game session for _run_job."""
+    return {
+        "game_path": str(game_path),
+        "game_name": game_name,
+        "user_id": user_id,
+        "language": language,
+        "launched_at": launched_at if launched_at is not None else time.time(),
+        "trace_memory": trace_memory,
+        "embed": embed,
+        "profile_frames": profile_frames,
+    }
+
+
+def _worker_main(conn) -> None:
+    """
+    Worker process entry point: warm up, then run sessions and report back.
+    While idle, "preload" messages import the game most likely to be launched next.
+    After a clean windowed session pygame is reset and the worker waits for
+    the next job, so later launches skip SDL init and window creation. Embedded
+    or failed sessions end the worker.
+    """
+    try:
+        _warm_up()
+        conn.send({"type": "ready"})
+        preloaded = None
+        while True:
+            job = conn.recv()
+            if job is None:
+                return
+            if job.get("type") == "preload":
+                from omnigames.core.modules import game_modules
+
+                if preloaded is not None:
+                    game_modules.unload(preloaded)
+                try:
+                    preloaded = game_modules.load(job["game_path"], job["game_name"])
+                except Exception:
+                    preloaded = None
+                if preloaded is not None:
+                    from omnigames.core.assets import ASSET_DIR_NAME, asset_manager
+
+                    asset_manager.preload(Path(job["game_path"]) / ASSET_DIR_NAME)
+                continue
+            # A preload is only reused when no memory baseline is needed before the import
+            if preloaded is not None and (str(preloaded.game_path) != job["game_path"] or job.get("trace_memory")):
+                from omnigames.core.modules import game_modules
+
+                game_modules.unload(preloaded)
+                preloaded = None
+            if job.get("embed"):
+                from omnigames.core.framebuffer import embedded_display
+
+                embedded_display.enable(conn)
+            result = _run_job(job, preloaded)
+            preloaded = None  # _run_job unloaded it
+            result["type"] = "result"
+            # The embedded input thread keeps reading conn, and a failed game may
+            # have left anything behind, so neither kind of worker is reused
+            result["reusable"] = not job.get("embed") and result["error"] is None
+            if job.get("embed"):
+                embedded_display.close()
+            elif result["reusable"]:
+                # BaseGame already did this; covers games that drive pygame themselves
+                try:
+                    from omnigames.core.pygame_runtime import pygame_runtime
+
+                    pygame_runtime.reset()
+                except ImportError:
+                    pass
+            conn.send(result)
+            if not result["reusable"]:
+                return
+    except (EOFError, BrokenPipeError):
+        pass
+    finally:
+        conn.close()
+
+
+class GameSession:
+    """Handle to a game running in a worker process."""
+
+    def __init__(self, process, conn, job: Dict[str, Any], release: Optional[Callable[[Any, Any], None]] = None):
+        """
+        Initialize session handle. release(process, conn) takes the worker back
+        once the session ended cleanly; without it the worker is stopped.
+        """
+        self.process = process
+        self.conn = conn
+        self.job = job
+        self._release = release
+        self.started_at = time.monotonic()
+        self.result: Optional[Dict[str, Any]] = None
+        # Set once an embedded game has created its screen
+        self.framebuffer = None
+
+    @property
+    def game_name(self) -> str:
+        """Name of the running game."""
+        return self.job["game_name"]
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Get the session result without blocking, or None while the game runs."""
+        if self.result is not None:
+            return self.result
+        try:
+            while self.conn.poll():
+                message = self.conn.recv()
+                if message.get("type") == "framebuffer":
+                    self._attach_framebuffer(message)
+                elif message.get("type") == "result":
+                    self.result = message
+                    break
+        except (EOFError, OSError):
+            pass
+
+        if self.result is None and not self.process.is_alive():
+            self.result = {
+                "type": "result",
+                "score": 0,
+                "playtime": time.monotonic() - self.started_at,
+                "state": None,
+                "telemetry": None,
+                "memory": None,
+                "profile": None,
+                "error": f"Game process exited unexpectedly (code {self.process.exitcode})",
+            }
+        if self.result is not None:
+            if self.result.pop("reusable", False) and self._release is not None and self.process.is_alive():
+                self._release(self.process, self.conn)
+            else:
+                self.process.join(timeout=1)
+                self.conn.close()
+            if self.framebuffer is not None:
+                self.framebuffer.close()
+                self.framebuffer = None
+        return self.result
+
+    def _attach_framebuffer(self, message: Dict[str, Any]) -> None:
+        """Map the frame buffers an embedded game announced."""
+        from omnigames.core.framebuffer import SharedFramebuffer
+
+        if self.framebuffer is not None:
+            self.framebuffer.close()
+        self.framebuffer = SharedFramebuffer(message["width"], message["height"], message["name"])
+
+    def send_input(self, event: Dict[str, Any]) -> None:
+        """
+        Forward an input event to an embedded game, e.g.
+        {"kind": "key_down", "key": "space"} or {"kind": "mouse_down", "pos": (x, y)}.
+        """
+        if self.result is not None:
+            return
+        try:
+            self.conn.send({"type": "input", "event": event})
+        except OSError:
+            pass
+
+    def wait(self, poll_interval: float = 0.05) -> Dict[str, Any]:
+        """Block until the session ends and get its result."""
+        while self.poll() is None:
+            time.sleep(poll_interval)
+        return self.result
+
+    def terminate(self) -> None:
+        """Kill the game process, unless the session already ended and handed it back."""
+        if self.result is None and self.process.is_alive():
+            self.process.terminate()
+
+
+class GameRunner:
+    """
+    Run game sessions in worker processes from a pre-warmed pool. A worker
+    whose session ended cleanly returns to the pool and runs a later session.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE):
+        """Initialize runner. No process is started until prewarm or launch."""
+        self.pool_size = pool_size
+        self._context = None
+        # Idle workers as [process, conn, path of the game preloaded into it or None]
+        self._idle: List[list] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn_worker(self) -> list:
+        """Start a worker process; it warms up while waiting for a job."""
+        if self._context is None:
+            self._context = _get_context()
+            # Registered after multiprocessing's own exit hook, so it runs first
+            # and idle workers are told to exit before they are joined
+            atexit.register(self.shutdown)
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        return [process, parent_conn, None]
+
+    def prewarm(self, background: bool = False) -> None:
+        """
+        Top up the pool of idle, warmed-up workers.
+        With background=True the (possibly slow) first fork server start does
+        not block the caller, e.g. the Tk thread.
+        """
+        if background:
+            threading.Thread(target=self.prewarm, name="runner-prewarm", daemon=True).start()
+            return
+        with self._lock:
+            if self._closed:
+                return
+            self._idle = [worker for worker in self._idle if worker[0].is_alive()]
+            while len(self._idle) < self.pool_size:
+                self._idle.append(self._spawn_worker())
+
+    def preload(self, game_path: Path, game_name: str) -> None:
+        """
+        Import a game into an idle worker ahead of time, so launching it skips
+        loading its module. The game's main() is not called.
+        """
+        game_path = str(game_path)
+        with self._lock:
+            if self._closed:
+                return
+            self._idle = [worker for worker in self._idle if worker[0].is_alive()]
+            if any(worker[2] == game_path for worker in self._idle):
+                return
+            if not self._idle:
+                self._idle.append(self._spawn_worker())
+            worker = next((idle for idle in self._idle if idle[2] is None), self._idle[0])
+            try:
+                worker[1].send({"type": "preload", "game_path": game_path, "game_name": game_name})
+                worker[2] = game_path
+            except OSError:
+                pass
+
+    def launch(
+        self,
+        game_path: Path,
+        game_name: str,
+        user_id: int,
+        language: str = "en",
+        launched_at: Optional[float] = None,
+        trace_memory: bool = False,
+        embed: bool = False,
+        profile_frames: int = 0,
+    ) -> GameSession:
+        """
+        Start a game session in a worker and return immediately.
+        launched_at is the time.time() of the user's request, for time-to-first-frame.
+        With trace_memory the result's "memory" reports what the session left allocated.
+        With embed the game opens no window: its frames appear in the session's
+        framebuffer and input is passed in with send_input().
+        With profile_frames the game's first frames are recorded with cProfile.
+        Raises RuntimeError after shutdown().
+        """
+        worker = None
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Game runner is shut down")
+            self._idle = [idle for idle in self._idle if idle[0].is_alive()]
+            # Prefer a worker that already imported this game
+            for idle in self._idle:
+                if idle[2] == str(game_path):
+                    worker = idle
+                    break
+            if worker is None and self._idle:
+                worker = self._idle[0]
+            if worker is not None:
+                self._idle.remove(worker)
+            else:
+                worker = self._spawn_worker()
+
+        job = _make_job(game_path, game_name, user_id, language, launched_at, trace_memory, embed, profile_frames)
+        process, conn, _ = worker
+        conn.send(job)
+        return GameSession(process, conn, job, release=self._reclaim)
+
+    def _reclaim(self, process, conn) -> None:
+        """
+        Take back the worker of a finished session. It goes first in the pool,
+        as it already holds pygame's window and caches; a spare beyond the
+        pool size is stopped instead.
+        """
+        retired = []
+        with self._lock:
+            if self._closed:
+                retired.append([process, conn, None])
+            else:
+                self._idle = [idle for idle in self._idle if idle[0].is_alive()]
+                self._idle.insert(0, [process, conn, None])
+                while len(self._idle) > self.pool_size:
+                    # Prefer stopping a spare with no game preloaded into it
+                    spare = next((idle for idle in reversed(self._idle[1:]) if idle[2] is None), self._idle[-1])
+                    self._idle.remove(spare)
+                    retired.append(spare)
+        for worker in retired:
+            self._stop_worker(worker)
+
+    @staticmethod
+    def _stop_worker(worker: list) -> None:
+        """Ask an idle worker to exit, and kill it if it does not."""
+        process, conn, _ = worker
+        try:
+            conn.send(None)
+            conn.close()
+        except OSError:
+            pass
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+
+    def run(self, game_path: Path, game_name: str, user_id: int, language: str = "en") -> Dict[str, Any]:
+        """Run a game session to completion and get its result."""
+        return self.launch(game_path, game_name, user_id, language).wait()
+
+    def run_in_process(
+        self,
+        game_path: Path,
+        game_name: str,
+        user_id: int,
+        language: str = "en",
+        launched_at: Optional[float] = None,
+        trace_memory: bool = False,
+        profile_frames: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Run a game session in the calling process, for games that must share its Tk root.
+        The game's modules and sys.path changes are undone afterwards.
+        """
+        return _run_job(
+            _make_job(game_path, game_name, user_id, language, launched_at, trace_memory, profile_frames=profile_frames)
+        )
+
+    def shutdown(self) -> None:
+        """Stop idle workers; no new ones are started afterwards."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._stop_worker(worker)
+
+
+# Global game runner instance
+game_runner = GameRunner()
@@ -0,0 +1,159 @@
+"""Timers and tweens on a game's own clock, so delays and animations never block the frame loop."""
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+
+def linear(t: float) -> float:
+    """No easing."""
+    return t
+
+
+def ease_in_out(t: float) -> float:
+    """Start and end slowly (smoothstep)."""
+    return t * t * (3.0 - 2.0 * t)
+
+
+class Timer:
+    """Handle to a scheduled callback."""
+
+    def __init__(self, due: float, interval: Optional[float], callback: Callable[[], None]):
+        """Initialize timer. interval is None for a one-shot timer."""
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop the timer; a cancelled timer never fires again."""
+        self.cancelled = True
+
+
+class Tween:
+    """Handle to a value animated from start to end over a duration."""
+
+    def __init__(
+        self,
+        duration: float,
+        on_update: Callable[[float], None],
+        start: float,
+        end: float,
+        easing: Callable[[float], float],
+        on_done: Optional[Callable[[], None]],
+    ):
+        """Initialize tween."""
+        self.duration = duration
+        self.on_update = on_update
+        self.start = start
+        self.end = end
+        self.easing = easing
+        self.on_done = on_done
+        self.elapsed = 0.0
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Stop the tween where it is; on_done is not called."""
+        self.cancelled = True
+
+    def _step(self, dt: float) -> bool:
+        """Advance and report the new value. Returns True once finished."""
+        self.elapsed = min(self.elapsed + dt, self.duration)
+        progress = self.elapsed / self.duration if self.duration > 0 else 1.0
+        self.on_update(self.start + (self.end - self.start) * self.easing(progress))
+        return self.elapsed >= self.duration
+
+
+class Scheduler:
+    """
+    One-shot timers, repeating timers and tweens for one game.
+
+    Time only moves when advance() is called. BaseGame calls it once per
+    simulation step and not while the game is paused, so timers and tweens
+    follow game time and pause with the game. Timers are kept in a heap:
+    advancing costs O(log n) per timer that fires, nothing for the others.
+    """
+
+    def __init__(self):
+        """Initialize scheduler at game time 0."""
+        self.time = 0.0
+        self._timers: List[Tuple[float, int, Timer]] = []
+        # Keeps timers due at the same time in the order they were scheduled
+        self._order = itertools.count()
+        self._tweens: List[Tween] = []
+
+    def after(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """Call callback once, delay seconds of game time from now."""
+        return self._push(Timer(self.time + delay, None, callback))
+
+    def every(self, interval: float, callback: Callable[[], None], delay: Optional[float] = None) -> Timer:
+        """Call callback every interval seconds, first after delay (default: one interval)."""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        return self._push(Timer(self.time + (interval if delay is None else delay), interval, callback))
+
+    def tween(
+        self,
+        duration: float,
+        on_update: Callable[[float], None],
+        start: float = 0.0,
+        end: float = 1.0,
+        easing: Callable[[float], float] = linear,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> Tween:
+        """
+        Animate a value from start to end over duration seconds: on_update
+        receives the eased value every step, on_done is called at the end.
+        """
+        tween = Tween(duration, on_update, start, end, easing, on_done)
+        self._tweens.append(tween)
+        return tween
+
+    def _push(self, timer: Timer) -> Timer:
+        """Add a timer to the heap."""
+        heapq.heappush(self._timers, (timer.due, next(self._order), timer))
+        return timer
+
+    def advance(self, dt: float) -> None:
+        """Move game time forward, stepping tweens and firing every timer now due, in order."""
+        self.time += dt
+        if self._tweens:
+            tweens, self._tweens = self._tweens, []
+            for tween in tweens:
+                if tween.cancelled:
+                    continue
+                if tween._step(dt):
+                    if tween.on_done is not None:
+                        tween.on_done()
+                else:
+                    self._tweens.append(tween)
+
+        while self._timers and self._timers[0][0] <= self.time:
+            _, _, timer = heapq.heappop(self._timers)
+            if timer.cancelled:
+                continue
+            if timer.interval is not None:
+                timer.due += timer.interval
+                self._push(timer)
+            timer.callback()
+
+    @property
+    def animating(self) -> bool:
+        """Check if a tween is running, i.e. the game changes every step."""
+        return any(not tween.cancelled for tween in self._tweens)
+
+    def time_until_next(self) -> Optional[float]:
+        """Game time until the next timer fires, or None if none is scheduled."""
+        while self._timers and self._timers[0][2].cancelled:
+            heapq.heappop(self._timers)
+        if not self._timers:
+            return None
+        return max(0.0, self._timers[0][0] - self.time)
+
+    def cancel_all(self) -> None:
+        """Cancel every timer and tween, e.g. when the game restarts."""
+        for _, _, timer in self._timers:
+            timer.cancel()
+        for tween in self._tweens:
+            tween.cancel()
+        self._timers = []
+        self._tweens = []
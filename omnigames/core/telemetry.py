@@ -0,0 +1,154 @@
+"""Session telemetry: load time, playtime and frame-time statistics."""
+import csv
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Frame times are kept in a fixed histogram: 0.25 ms buckets up to 250 ms
+BUCKET_MS = 0.25
+BUCKET_COUNT = 1000
+# A frame counts as dropped when it takes longer than this many target intervals
+DROPPED_FRAME_FACTOR = 1.5
+
+REPORT_FIELDS = [
+    "started_at",
+    "username",
+    "game_name",
+    "machine",
+    "duration_s",
+    "first_frame_ms",
+    "frames",
+    "avg_fps",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "dropped_frames",
+]
+
+
+class FrameStats:
+    """Constant-memory frame-time statistics."""
+
+    def __init__(self, target_fps: float = 60.0):
+        """Initialize empty statistics."""
+        self.target_fps = target_fps
+        self.buckets = [0] * (BUCKET_COUNT + 1)  # Last bucket holds everything slower
+        self.frames = 0
+        self.total_ms = 0.0
+        self.dropped = 0
+
+    def add(self, frame_ms: float) -> None:
+        """Record the duration of one frame."""
+        self.frames += 1
+        self.total_ms += frame_ms
+        self.buckets[min(int(frame_ms / BUCKET_MS), BUCKET_COUNT)] += 1
+        if self.target_fps and frame_ms > DROPPED_FRAME_FACTOR * 1000.0 / self.target_fps:
+            self.dropped += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Get a frame-time percentile in ms (upper edge of its bucket)."""
+        if not self.frames:
+            return 0.0
+        rank = fraction * self.frames
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return (index + 1) * BUCKET_MS
+        return (BUCKET_COUNT + 1) * BUCKET_MS
+
+
+class SessionTelemetry:
+    """Timestamps and frame statistics for one game session."""
+
+    def __init__(self, launched_at: Optional[float] = None):
+        """
+        Initialize session.
+        Timestamps use time.time() so the launcher and a game process can share them.
+        """
+        self.launched_at = launched_at if launched_at is not None else time.time()
+        self.first_frame_at: Optional[float] = None
+        self.exited_at: Optional[float] = None
+        self.frame_stats = FrameStats()
+        self._last_frame: Optional[float] = None
+        self._idle = False
+
+    def set_target_fps(self, target_fps: float) -> None:
+        """Set the frame rate the game aims for, used to count dropped frames."""
+        self.frame_stats.target_fps = target_fps
+
+    def frame(self) -> None:
+        """Mark the end of a rendered frame."""
+        now = time.perf_counter()
+        if self._last_frame is None:
+            self.first_frame_at = time.time()
+        elif not self._idle:
+            self.frame_stats.add((now - self._last_frame) * 1000.0)
+        self._last_frame = now
+        self._idle = False
+
+    def idle(self) -> None:
+        """Mark a pause in rendering, e.g. a turn-based game waiting for input; it is not a slow frame."""
+        self._idle = True
+
+    def finish(self) -> None:
+        """Mark the end of the session."""
+        if self.exited_at is None:
+            self.exited_at = time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the compact per-session record."""
+        import platform
+
+        self.finish()
+        stats = self.frame_stats
+        frames_s = stats.total_ms / 1000.0
+        return {
+            "machine": platform.node(),
+            "duration_s": round(self.exited_at - self.launched_at, 3),
+            "first_frame_ms": (
+                round((self.first_frame_at - self.launched_at) * 1000.0, 1) if self.first_frame_at else None
+            ),
+            "frames": stats.frames,
+            "avg_fps": round(stats.frames / frames_s, 1) if frames_s else 0.0,
+            "p50_ms": stats.percentile(0.50),
+            "p95_ms": stats.percentile(0.95),
+            "p99_ms": stats.percentile(0.99),
+            "dropped_frames": stats.dropped,
+        }
+
+
+_current_session: Optional[SessionTelemetry] = None
+
+
+def begin_session(launched_at: Optional[float] = None) -> SessionTelemetry:
+    """Start recording a new session; games report their frames into it."""
+    global _current_session
+    _current_session = SessionTelemetry(launched_at)
+    return _current_session
+
+
+def get_session() -> SessionTelemetry:
+    """Get the session being recorded, starting one for standalone runs."""
+    if _current_session is None:
+        return begin_session()
+    return _current_session
+
+
+def end_session() -> Optional[Dict[str, Any]]:
+    """Stop recording and get the session summary, or None if nothing was recorded."""
+    global _current_session
+    session, _current_session = _current_session, None
+    return session.summary() if session else None
+
+
+def export_report(path: Path, sessions: Iterable[Dict[str, Any]]) -> int:
+    """Write session rows to a CSV report. Returns the number of rows written."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for session in sessions:
+            writer.writerow({field: session[field] for field in REPORT_FIELDS})
+            count += 1
+    return count
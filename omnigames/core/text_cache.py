@@ -0,0 +1,74 @@
+"""Shared cache of rendered text surfaces, so unchanged text is rasterized only once."""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .assets import asset_manager
+
+# Most rendered texts kept; a HUD needs a few dozen, card games a few hundred
+MAX_TEXT_SURFACES = 512
+
+
+class TextCache:
+    """
+    Bounded LRU of text surfaces keyed by (font, size, text, color, antialias).
+    Fonts come from the asset manager. Surfaces stay cached across sessions
+    while the pygame runtime keeps pygame initialized. After a game's
+    cleanup(), BaseGame calls clear() only if the game quit pygame itself,
+    since that invalidates every font and surface here.
+    """
+
+    def __init__(self, max_entries: int = MAX_TEXT_SURFACES):
+        """Initialize empty cache."""
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(
+        self, text: str, size: int, color: Tuple[int, ...], font: Optional[str] = None, antialias: bool = True
+    ) -> Any:
+        """Get text rendered as a surface in the display's pixel format. Do not draw onto it; it is shared."""
+        import pygame
+
+        key = (font, size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = asset_manager.font(size, font).render(text, antialias, color)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and the hit rate since the last reset_stats()."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        """Start counting hits and misses from zero, e.g. for a new game session."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        """Drop all surfaces; the statistics are kept."""
+        self._surfaces.clear()
+
+
+# Global text cache instance
+text_cache = TextCache()
@@ -0,0 +1,149 @@
+"""Thumbnail cache for game icons."""
+import io
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from .config import CACHE_PATH
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+THUMBNAIL_SIZES = (48, 96, 192)
+THUMBNAIL_CACHE_PATH = CACHE_PATH / "thumbnails"
+THUMBNAIL_BACKGROUND = (42, 42, 42)  # Same as the menu's game row (#2a2a2a)
+
+
+def _load_pil_image():
+    """Import Pillow's Image module on first use, or None if unavailable."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+class ThumbnailCache:
+    """Pre-generate downscaled thumbnails and decode them off the UI thread."""
+
+    def __init__(self, cache_path: Path = THUMBNAIL_CACHE_PATH, max_workers: int = 2):
+        """Initialize thumbnail cache."""
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self._executor: Optional["ThreadPoolExecutor"] = None
+        self._pending: Dict[Tuple[str, int], "Future"] = {}
+        self._lock = threading.Lock()
+
+    def thumbnail_path(self, game_name: str, size: int) -> Path:
+        """Get path of the cached thumbnail for a game and size."""
+        return self.cache_path / game_name / f"{size}.png"
+
+    def is_stale(self, game_name: str, source: Path) -> bool:
+        """Check if the cached thumbnails are missing or older than the source image."""
+        try:
+            source_mtime = source.stat().st_mtime
+        except OSError:
+            return False
+        for size in THUMBNAIL_SIZES:
+            cached = self.thumbnail_path(game_name, size)
+            if not cached.exists() or cached.stat().st_mtime < source_mtime:
+                return True
+        return False
+
+    def generate(self, game_name: str, source: Path) -> bool:
+        """
+        Render every thumbnail size for a game from its source image.
+        Called at install time. Returns True if thumbnails were written.
+        """
+        Image = _load_pil_image()
+        if Image is None or not source.exists():
+            return False
+
+        target_dir = self.cache_path / game_name
+        target_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            with Image.open(source) as image:
+                image = image.convert("RGBA")
+                for size in THUMBNAIL_SIZES:
+                    thumb = image.copy()
+                    thumb.thumbnail((size, size), Image.LANCZOS)
+                    # Flatten onto the menu background so Tk needs no alpha
+                    background = Image.new("RGBA", thumb.size, THUMBNAIL_BACKGROUND + (255,))
+                    flat = Image.alpha_composite(background, thumb).convert("RGB")
+                    target = self.thumbnail_path(game_name, size)
+                    temp = target.with_suffix(".tmp")
+                    flat.save(temp, "PNG", optimize=True)
+                    os.replace(temp, target)
+        except Exception as e:
+            print(f"Error generating thumbnails for {game_name}: {e}")
+            return False
+        return True
+
+    def remove(self, game_name: str) -> None:
+        """Remove cached thumbnails for a game."""
+        for size in THUMBNAIL_SIZES:
+            try:
+                self.thumbnail_path(game_name, size).unlink()
+            except OSError:
+                pass
+
+    def best_size(self, size: int) -> int:
+        """Get the smallest cached size that is at least the requested size."""
+        for candidate in THUMBNAIL_SIZES:
+            if candidate >= size:
+                return candidate
+        return THUMBNAIL_SIZES[-1]
+
+    def load_async(self, game_name: str, source: Path, size: int) -> "Future":
+        """
+        Decode a thumbnail in the worker pool.
+        The future resolves to PPM bytes ready for tk.PhotoImage(data=...),
+        or None if the game has no usable thumbnail.
+        """
+        size = self.best_size(size)
+        key = (game_name, size)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="thumbnail")
+            future = self._executor.submit(self._decode, game_name, source, size)
+            self._pending[key] = future
+        future.add_done_callback(lambda f, key=key: self._forget(key))
+        return future
+
+    def _forget(self, key: Tuple[str, int]) -> None:
+        """Drop a finished request from the pending table."""
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def _decode(self, game_name: str, source: Path, size: int) -> Optional[bytes]:
+        """Load a cached thumbnail as PPM bytes, generating it first if needed."""
+        Image = _load_pil_image()
+        if Image is None:
+            return None
+        if self.is_stale(game_name, source) and not self.generate(game_name, source):
+            return None
+
+        cached = self.thumbnail_path(game_name, size)
+        if not cached.exists():
+            return None
+        with Image.open(cached) as image:
+            buffer = io.BytesIO()
+            image.convert("RGB").save(buffer, "PPM")
+        return buffer.getvalue()
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global thumbnail cache instance
+thumbnail_cache = ThumbnailCache()
@@ -0,0 +1,128 @@
+"""Show an embedded pygame game inside the launcher window."""
+
+import time
+import tkinter as tk
+
+FRAME_INTERVAL_MS = 1000 / 60  # Repaint pacing: one frame per display refresh at 60 Hz
+
+# Tk key names that differ from pygame's once lower-cased
+TK_KEY_NAMES = {
+    "Prior": "page up",
+    "Next": "page down",
+    "Shift_L": "left shift",
+    "Shift_R": "right shift",
+    "Control_L": "left ctrl",
+    "Control_R": "right ctrl",
+    "Alt_L": "left alt",
+    "Alt_R": "right alt",
+    "KP_Enter": "enter",
+}
+
+
+class GameView:
+    """Canvas that paints an embedded game's shared framebuffer and forwards input to the game."""
+
+    def __init__(self, parent):
+        """Initialize game view with an empty canvas."""
+        self.canvas = tk.Canvas(parent, bg="black", highlightthickness=0, takefocus=1)
+        self.image_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self.photo = None
+        self.size = None
+        self.game = None
+        self._next_paint = 0.0
+        self._after_id = None
+
+        self.canvas.bind("<KeyPress>", lambda e: self._forward_key("key_down", e))
+        self.canvas.bind("<KeyRelease>", lambda e: self._forward_key("key_up", e))
+        self.canvas.bind("<ButtonPress>", lambda e: self._forward_mouse("mouse_down", e))
+        self.canvas.bind("<ButtonRelease>", lambda e: self._forward_mouse("mouse_up", e))
+        self.canvas.bind("<Motion>", lambda e: self._forward_mouse("mouse_motion", e))
+
+    def pack(self):
+        """Pack the canvas."""
+        self.canvas.pack(expand=True)
+
+    def attach(self, game) -> None:
+        """Start showing a LaunchedGame started with embed=True."""
+        self.detach()
+        self.game = game
+        self.canvas.focus_set()
+        self._next_paint = time.monotonic()
+        self._paint()
+
+    def detach(self) -> None:
+        """Stop showing the game; the last frame stays on the canvas until the next attach."""
+        self.game = None
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+
+    def close_game(self) -> None:
+        """Ask the game to quit, as closing its window would."""
+        if self.game is not None:
+            self.game.send_input({"kind": "quit"})
+
+    def _paint(self) -> None:
+        """Show the game's newest frame, then wait for the next refresh slot."""
+        self._after_id = None
+        if self.game is None:
+            return
+        framebuffer = self.game.framebuffer
+        if framebuffer is None:
+            # Picks up the game's framebuffer announcement without waiting for the menu's slower poll
+            self.game.poll()
+        else:
+            frame = framebuffer.read()
+            if frame is not None:
+                number, pixels = frame
+                self._show_pixels(framebuffer.width, framebuffer.height, pixels)
+                pixels.release()
+                # Lets the game write its next frame into the buffer shown before this one
+                framebuffer.shown(number)
+
+        # Fixed cadence rather than a fixed delay, so paint time does not slow the frame rate
+        now = time.monotonic()
+        self._next_paint = max(self._next_paint + FRAME_INTERVAL_MS / 1000, now)
+        self._after_id = self.canvas.after(int((self._next_paint - now) * 1000), self._paint)
+
+    def _show_pixels(self, width: int, height: int, pixels: memoryview) -> None:
+        """Copy one RGB frame into the canvas image, resizing it on the first frame."""
+        if self.size != (width, height):
+            self.size = (width, height)
+            self.photo = None
+            self.canvas.configure(width=width, height=height)
+            # Let the window grow to fit the game
+            self.canvas.winfo_toplevel().geometry("")
+
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            # Tk reads binary PPM directly; slower, but needs no Pillow
+            data = b"P6 %d %d 255\n" % (width, height) + pixels.tobytes()
+            if self.photo is None:
+                self.photo = tk.PhotoImage(width=width, height=height)
+                self.canvas.itemconfigure(self.image_item, image=self.photo)
+            self.photo.configure(data=data, format="PPM")
+            return
+
+        image = Image.frombuffer("RGB", (width, height), pixels, "raw", "RGB", 0, 1)
+        if self.photo is None:
+            self.photo = ImageTk.PhotoImage(image)
+            self.canvas.itemconfigure(self.image_item, image=self.photo)
+        else:
+            # Updates the existing Tk image in place instead of creating a new one per frame
+            self.photo.paste(image)
+
+    def _forward_key(self, kind: str, event) -> None:
+        """Send a key event to the game."""
+        if self.game is not None:
+            key = TK_KEY_NAMES.get(event.keysym, event.keysym.lower())
+            self.game.send_input({"kind": kind, "key": key, "unicode": event.char})
+
+    def _forward_mouse(self, kind: str, event) -> None:
+        """Send a mouse event to the game, in game screen coordinates."""
+        if self.game is not None:
+            message = {"kind": kind, "pos": (event.x, event.y)}
+            if kind != "mouse_motion":
+                message["button"] = event.num
+            self.game.send_input(message)
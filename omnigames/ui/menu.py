@@ -1,28 +1,45 @@
 """Main menu UI for omniGames."""
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import messagebox
 from pathlib import Path
-import json
-from typing import Optional, Callable
-import importlib.util
-import sys
+from typing import Callable, Dict, List, Optional
+from collections import OrderedDict
+import queue
 
-from omnigames.core import db, localization, game_manager
+from omnigames.core import localization, game_manager, thumbnail_cache, launcher
+from omnigames.ui.screens import ScreenManager
+from omnigames.ui.game_view import GameView
+
+THUMBNAIL_SIZE = 48
+ROW_HEIGHT = 90  # Fixed row pitch of the virtualized game list, in pixels
+MAX_CACHED_THUMBNAILS = 256
+METADATA_POLL_MS = 30
+INSTALL_POLL_MS = 100
+SESSION_POLL_MS = 100
+BACKGROUND_SERVICES_DELAY_MS = 500
+WINDOW_GEOMETRY = "700x600"
 
 
 class GameButton:
-    """Custom button widget for displaying games."""
+    """Recyclable row widget for displaying a game; rebound to another game while scrolling."""
+
+    _blank = None
 
-    def __init__(self, parent, game_data: dict, callback: Callable, current_language: str = "en"):
-        """Initialize game button."""
+    def __init__(self, parent, callback: Callable):
+        """Initialize game button with empty content."""
         self.frame = tk.Frame(parent, bg="#2a2a2a", relief=tk.RAISED, bd=1)
-        self.frame.pack(fill=tk.X, padx=5, pady=5)
 
-        self.game_data = game_data
+        self.game_data: Optional[dict] = None
+        self.index = -1
         self.callback = callback
-        self.current_language = current_language
-        self.game_locales = self._load_game_locales()
+        self.game_locales: Optional[dict] = None
+
+        # Thumbnail placeholder, filled in once the row becomes visible
+        self.thumbnail_label = tk.Label(
+            self.frame, bg="#2a2a2a", width=THUMBNAIL_SIZE, height=THUMBNAIL_SIZE, image=self._blank_image()
+        )
+        self.thumbnail_label.pack(side=tk.LEFT, padx=(10, 0), pady=10)
 
         # Game info
         info_frame = tk.Frame(self.frame, bg="#2a2a2a")
@@ -32,65 +49,247 @@ class GameButton:
         title_frame = tk.Frame(info_frame, bg="#2a2a2a")
         title_frame.pack(anchor=tk.W)
 
-        title = tk.Label(
-            title_frame, text=game_data.get("title", "Unknown"), font=("Arial", 14, "bold"), fg="white", bg="#2a2a2a"
-        )
-        title.pack(side=tk.LEFT)
+        self.title_label = tk.Label(title_frame, font=("Arial", 14, "bold"), fg="white", bg="#2a2a2a")
+        self.title_label.pack(side=tk.LEFT)
 
-        # Language warning icon
-        if not self._language_available():
-            warning = tk.Label(
-                title_frame, text="⚠", font=("Arial", 14, "bold"), fg="yellow", bg="#2a2a2a"
-            )
-            warning.pack(side=tk.LEFT, padx=5)
-
-        desc = tk.Label(
-            info_frame,
-            text=self.game_locales.get(self.current_language, {}).get("game_description", game_data.get("description", "")),
-            font=("Arial", 10),
-            fg="#cccccc",
-            bg="#2a2a2a",
-            wraplength=300,
+        # Language warning icon, shown once the game's locales are known
+        self.warning_label = tk.Label(title_frame, text="⚠", font=("Arial", 14, "bold"), fg="yellow", bg="#2a2a2a")
+
+        # Damaged files icon, set by the background integrity check
+        self.damaged_label = tk.Label(title_frame, text="✖", font=("Arial", 14, "bold"), fg="#ff4444", bg="#2a2a2a")
+
+        self.desc_label = tk.Label(
+            info_frame, font=("Arial", 10), fg="#cccccc", bg="#2a2a2a", wraplength=300, justify=tk.LEFT
         )
-        desc.pack(anchor=tk.W)
+        self.desc_label.pack(anchor=tk.W)
 
         # Play button
-        btn = tk.Button(
+        self.play_button = tk.Button(
             self.frame, text=localization.translate("menu_start_game"), command=self._play, font=("Arial", 12), bg="#0066cc", fg="white"
         )
-        btn.pack(side=tk.RIGHT, padx=10, pady=10)
-
-    def _load_game_locales(self) -> dict:
-        """Load locales for the game."""
-        game_path = Path(self.game_data["path"])
-        locales_path = game_path / "locales"
-        locales = {}
+        self.play_button.pack(side=tk.RIGHT, padx=10, pady=10)
+
+    @staticmethod
+    def _blank_image() -> tk.PhotoImage:
+        """Get a shared empty image so the placeholder is sized in pixels."""
+        if GameButton._blank is None:
+            GameButton._blank = tk.PhotoImage(width=THUMBNAIL_SIZE, height=THUMBNAIL_SIZE)
+        return GameButton._blank
+
+    def show_game(self, index: int, game_data: dict, game_locales: Optional[dict], thumbnail: Optional[tk.PhotoImage]):
+        """Show a game in this row, reusing its widgets."""
+        self.index = index
+        self.game_data = game_data
+        self.title_label.configure(text=game_data.get("title", "Unknown"))
+        self.set_locales(game_locales)
+        self.set_thumbnail(thumbnail)
 
-        if locales_path.exists():
-            for lang_file in locales_path.glob("*.json"):
-                lang = lang_file.stem
-                try:
-                    with open(lang_file, "r", encoding="utf-8") as f:
-                        locales[lang] = json.load(f)
-                except Exception:
-                    pass
+        if game_data.get("problems"):
+            self.damaged_label.pack(side=tk.LEFT, padx=5)
+        else:
+            self.damaged_label.pack_forget()
+
+    def set_locales(self, game_locales: Optional[dict]) -> None:
+        """Show the localized description and language warning once locales are loaded."""
+        self.game_locales = game_locales
+        description = self.game_data.get("description", "")
+        if game_locales is not None:
+            description = game_locales.get(localization.language, {}).get("game_description", description)
+        self.desc_label.configure(text=description)
+
+        if game_locales is not None and not self._language_available():
+            self.warning_label.pack(side=tk.LEFT, padx=5)
+        else:
+            self.warning_label.pack_forget()
 
-        return locales
+    def set_thumbnail(self, thumbnail: Optional[tk.PhotoImage]) -> None:
+        """Show a decoded thumbnail, or the blank placeholder."""
+        self.thumbnail_label.configure(image=thumbnail or self._blank_image())
 
     def _language_available(self) -> bool:
         """Check if current language is available for this game."""
-        return self.current_language in self.game_locales
+        return localization.language in self.game_locales
 
     def _play(self):
         """Callback when play button is clicked."""
+        problems = self.game_data.get("problems")
+        if problems:
+            msg = localization.translate("game_damaged") + "\n\n" + "\n".join(problems[:5])
+            if not messagebox.askyesno(localization.translate("error"), msg):
+                return
+        if self.game_locales is None:
+            self.game_locales = game_manager.get_game_locales(Path(self.game_data["path"]))
         if not self._language_available():
-            msg = f"Warning: This game does not support '{self.current_language}' language. It will use English instead."
+            msg = f"Warning: This game does not support '{localization.language}' language. It will use English instead."
             if messagebox.askyesno("Language Warning", msg):
                 self.callback(self.game_data)
         else:
             self.callback(self.game_data)
 
 
+class GameList:
+    """
+    Virtualized game list on a Canvas.
+
+    Only enough GameButton rows to fill the viewport exist; they are moved and
+    rebound as the list scrolls. Locales and thumbnails load in the background
+    and are cached per game, so opening the menu costs the same for any
+    catalog size.
+    """
+
+    def __init__(self, parent, callback: Callable):
+        """Initialize game list."""
+        from tkinter import ttk
+
+        self.callback = callback
+        self.games: List[dict] = []
+        self.rows: List[GameButton] = []
+        self.windows: List[int] = []
+        self.locales: Dict[str, dict] = {}
+        self.thumbnails: "OrderedDict[str, Optional[tk.PhotoImage]]" = OrderedDict()
+        self.requested: set = set()
+        self.results: queue.Queue = queue.Queue()
+        self.pending = 0
+        self._executor = None
+
+        self.canvas = tk.Canvas(parent, bg="#1a1a1a", highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.canvas.yview)
+
+        def on_scroll(first, last):
+            self.scrollbar.set(first, last)
+            self.update_view()
+
+        self.canvas.configure(yscrollcommand=on_scroll)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Destroy>", lambda e: self._shutdown() if e.widget is self.canvas else None)
+
+    def pack(self):
+        """Pack the canvas and its scrollbar."""
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=10)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def set_games(self, games: List[dict]):
+        """Replace the listed games and scroll back to the top."""
+        self.games = games
+        for row in self.rows:
+            row.index = -1  # Force a rebind
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), len(games) * ROW_HEIGHT))
+        self.canvas.yview_moveto(0)
+        self.update_view()
+
+    def _on_resize(self, event):
+        """Stretch rows to the canvas width and fill newly exposed space."""
+        for window in self.windows:
+            self.canvas.itemconfigure(window, width=event.width - 10)
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self.games) * ROW_HEIGHT))
+        self.update_view()
+
+    def update_view(self):
+        """Place and bind rows for the games currently in the viewport."""
+        height = max(self.canvas.winfo_height(), ROW_HEIGHT)
+        first = max(0, int(self.canvas.canvasy(0) // ROW_HEIGHT))
+        visible = height // ROW_HEIGHT + 2
+
+        # Rows are only ever added when the viewport grows, never per game
+        while len(self.rows) < visible:
+            row = GameButton(self.canvas, self.callback)
+            self.rows.append(row)
+            self.windows.append(
+                self.canvas.create_window(
+                    5, 0, window=row.frame, anchor="nw", width=max(self.canvas.winfo_width() - 10, 1),
+                    height=ROW_HEIGHT - 10,
+                )
+            )
+
+        # Each row owns the indices congruent to its slot, so rows still in view keep their game
+        for index in range(first, first + len(self.rows)):
+            row = self.rows[index % len(self.rows)]
+            window = self.windows[index % len(self.rows)]
+            if index >= len(self.games):
+                self.canvas.itemconfigure(window, state="hidden")
+                row.index = -1
+                continue
+            self.canvas.itemconfigure(window, state="normal")
+            if row.index != index:
+                self.canvas.coords(window, 5, index * ROW_HEIGHT + 5)
+                game_data = self.games[index]
+                name = game_data["name"]
+                row.show_game(index, game_data, self.locales.get(name), self._cached_thumbnail(name))
+                self._request_metadata(game_data)
+
+    def _cached_thumbnail(self, game_name: str) -> Optional[tk.PhotoImage]:
+        """Get a decoded thumbnail and mark it recently used."""
+        if game_name in self.thumbnails:
+            self.thumbnails.move_to_end(game_name)
+            return self.thumbnails[game_name]
+        return None
+
+    def _request_metadata(self, game_data: dict):
+        """Load a game's locales and thumbnail in the background, once."""
+        name = game_data["name"]
+        if name in self.requested:
+            return
+        self.requested.add(name)
+        was_idle = self.pending == 0
+
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="game-metadata")
+        future = self._executor.submit(game_manager.get_game_locales, Path(game_data["path"]))
+        future.add_done_callback(lambda f: self.results.put(("locales", name, f)))
+        self.pending += 1
+
+        source = Path(game_data["path"]) / game_data.get("icon", "assets/thumbnail.png")
+        if source.exists():
+            future = thumbnail_cache.load_async(name, source, THUMBNAIL_SIZE)
+            future.add_done_callback(lambda f: self.results.put(("thumbnail", name, f)))
+            self.pending += 1
+
+        if was_idle and self.pending:
+            self.canvas.after(METADATA_POLL_MS, self._poll_metadata)
+
+    def _poll_metadata(self):
+        """Hand loaded metadata to Tk; PhotoImages may only be created on this thread."""
+        if not self.canvas.winfo_exists():
+            return
+        while True:
+            try:
+                kind, name, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            try:
+                data = future.result()
+            except Exception:
+                data = None
+
+            if kind == "locales":
+                self.locales[name] = data or {}
+                for row in self._rows_showing(name):
+                    row.set_locales(self.locales[name])
+            elif data:
+                self.thumbnails[name] = tk.PhotoImage(data=data, format="PPM")
+                while len(self.thumbnails) > MAX_CACHED_THUMBNAILS:
+                    evicted, _ = self.thumbnails.popitem(last=False)
+                    self.requested.discard(evicted)
+                for row in self._rows_showing(name):
+                    row.set_thumbnail(self.thumbnails[name])
+
+        if self.pending:
+            self.canvas.after(METADATA_POLL_MS, self._poll_metadata)
+
+    def _rows_showing(self, game_name: str) -> List[GameButton]:
+        """Get the rows currently bound to a game."""
+        return [row for row in self.rows if row.index >= 0 and row.game_data["name"] == game_name]
+
+    def _shutdown(self):
+        """Stop the metadata worker when the list is destroyed."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
 class MainMenu:
     """Main menu for omniGames."""
 
@@ -98,57 +297,70 @@ class MainMenu:
         """Initialize main menu."""
         self.root = root
         self.root.title("omniGames")
-        self.root.geometry("700x600")
+        self.root.geometry(WINDOW_GEOMETRY)
         self.root.configure(bg="#1a1a1a")
 
-        self.current_user = None
-        self.current_frame = None
+        self.screens = ScreenManager(self.root)
+        self.screens.register(
+            "users", self._build_user_selection, self._refresh_user_selection, lambda: launcher.get_revision("users")
+        )
+        self.screens.register(
+            "games",
+            self._build_main_menu,
+            self._refresh_main_menu,
+            lambda: (self.current_user["id"], launcher.get_revision("games")),
+        )
+        self.screens.register("play", self._build_game_view)
+        self.user_buttons: List[tk.Button] = []
+        self.users_frame: Optional[tk.Frame] = None
+        self.user_info: Optional[tk.Label] = None
+        self.no_games: Optional[tk.Label] = None
+        self.search_frame: Optional[tk.Frame] = None
+        self.search_var: Optional[tk.StringVar] = None
+        self.game_list: Optional[GameList] = None
+        self.game_view: Optional[GameView] = None
+        self.running_game = None
+        self.install_task = None
 
         self.style_menu()
         self.show_user_selection()
 
+        # Start background services once the first window is on screen
+        self.root.after(BACKGROUND_SERVICES_DELAY_MS, launcher.start_background_services)
+
+    @property
+    def current_user(self):
+        """The user selected in the launcher service."""
+        return launcher.current_user
+
     def style_menu(self):
         """Configure window styling."""
         self.root.configure(bg="#1a1a1a")
 
-    def clear_frame(self):
-        """Clear current frame."""
-        if self.current_frame:
-            self.current_frame.destroy()
-        self.current_frame = None
-
     def show_user_selection(self):
         """Show user selection screen."""
-        self.clear_frame()
-        self.current_frame = tk.Frame(self.root, bg="#1a1a1a")
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.screens.show("users")
 
+    def _build_user_selection(self, frame: tk.Frame):
+        """Build the user selection screen's widgets."""
         # Title
-        title = tk.Label(self.current_frame, text="omniGames", font=("Arial", 28, "bold"), fg="#00ccff", bg="#1a1a1a")
+        title = tk.Label(frame, text="omniGames", font=("Arial", 28, "bold"), fg="#00ccff", bg="#1a1a1a")
         title.pack(pady=20)
 
         # User selection
         users_label = tk.Label(
-            self.current_frame, text=localization.translate("menu_select_user"), font=("Arial", 14), fg="white", bg="#1a1a1a"
+            frame, text=localization.translate("menu_select_user"), font=("Arial", 14), fg="white", bg="#1a1a1a"
         )
         users_label.pack(pady=10)
 
-        users = db.get_all_users()
-        for user in users:
-            btn = tk.Button(
-                self.current_frame,
-                text=user["username"],
-                command=lambda u=user: self.select_user(u["id"], u["username"]),
-                font=("Arial", 12),
-                width=20,
-                bg="#0066cc",
-                fg="white",
-            )
-            btn.pack(pady=5)
+        # Filled by _refresh_user_selection
+        self.users_frame = tk.Frame(frame, bg="#1a1a1a")
+        self.users_frame.pack()
+        self.user_buttons = []
 
         # New user
         new_btn = tk.Button(
-            self.current_frame,
+            frame,
             text=localization.translate("menu_new_user"),
             command=self.create_new_user,
             font=("Arial", 12),
@@ -159,7 +371,7 @@ class MainMenu:
         new_btn.pack(pady=5)
 
         # Settings
-        settings_frame = tk.Frame(self.current_frame, bg="#1a1a1a")
+        settings_frame = tk.Frame(frame, bg="#1a1a1a")
         settings_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
 
         lang_label = tk.Label(settings_frame, text=localization.translate("language") + ":", fg="white", bg="#1a1a1a")
@@ -168,17 +380,35 @@ class MainMenu:
         lang_var = tk.StringVar(value=localization.language)
 
         def change_language(lang):
-            localization.set_language(lang)
+            launcher.set_language(lang)
+            # Every retained screen holds translated text
+            self.screens.invalidate()
             self.show_user_selection()
 
+        from tkinter import ttk
+
         lang_menu = ttk.Combobox(settings_frame, textvariable=lang_var, values=["en", "es"], state="readonly", width=5)
         lang_menu.pack(side=tk.LEFT, padx=5)
         lang_menu.bind("<<ComboboxSelected>>", lambda e: change_language(lang_var.get()))
 
-    def select_user(self, user_id: int, username: str):
+    def _refresh_user_selection(self):
+        """Show one button per user, reusing the existing buttons."""
+        users = launcher.get_users()
+        while len(self.user_buttons) < len(users):
+            btn = tk.Button(self.users_frame, font=("Arial", 12), width=20, bg="#0066cc", fg="white")
+            btn.pack(pady=5)
+            self.user_buttons.append(btn)
+        while len(self.user_buttons) > len(users):
+            self.user_buttons.pop().destroy()
+        for btn, user in zip(self.user_buttons, users):
+            btn.configure(text=user["username"], command=lambda u=user: self.select_user(u["username"]))
+
+    def select_user(self, username: str):
         """Select a user and show main menu."""
-        self.current_user = {"id": user_id, "username": username}
-        self.show_main_menu()
+        if launcher.select_user(username):
+            self.show_main_menu()
+            # Warm the user's usual game while they browse
+            launcher.preload_next_game()
 
     def create_new_user(self):
         """Create a new user."""
@@ -195,18 +425,12 @@ class MainMenu:
         entry.focus()
 
         def create():
-            username = entry.get().strip()
-            if not username:
-                messagebox.showerror(localization.translate("error"), localization.translate("enter_username"))
-                return
-            if db.user_exists(username):
-                messagebox.showerror(localization.translate("error"), f"User '{username}' already exists")
+            success, message = launcher.create_user(entry.get())
+            if not success:
+                messagebox.showerror(localization.translate("error"), message)
                 return
 
-            user_id = db.create_user(username)
-            messagebox.showinfo(
-                localization.translate("success"), f"{localization.translate('user_created')}: {username}"
-            )
+            messagebox.showinfo(localization.translate("success"), message)
             dialog.destroy()
             self.show_user_selection()
 
@@ -215,57 +439,45 @@ class MainMenu:
 
     def show_main_menu(self):
         """Show main game menu."""
-        self.clear_frame()
-        self.current_frame = tk.Frame(self.root, bg="#1a1a1a")
-        self.current_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        # User info
-        user_info = tk.Label(
-            self.current_frame,
-            text=f"{localization.translate('username')}: {self.current_user['username']}",
-            font=("Arial", 12),
-            fg="#00ccff",
-            bg="#1a1a1a",
-        )
-        user_info.pack(pady=10)
+        self.screens.show("games")
+
+    def _build_main_menu(self, frame: tk.Frame):
+        """Build the main game menu's widgets."""
+        # User info, set by _refresh_main_menu
+        self.user_info = tk.Label(frame, font=("Arial", 12), fg="#00ccff", bg="#1a1a1a")
+        self.user_info.pack(pady=10)
 
         # Games list
         games_label = tk.Label(
-            self.current_frame, text=localization.translate("menu_start_game"), font=("Arial", 14, "bold"), fg="white", bg="#1a1a1a"
+            frame, text=localization.translate("menu_start_game"), font=("Arial", 14, "bold"), fg="white", bg="#1a1a1a"
         )
         games_label.pack(pady=10)
 
-        games = game_manager.get_installed_games()
-        if not games:
-            no_games = tk.Label(
-                self.current_frame,
-                text=localization.translate("no_games"),
-                font=("Arial", 12),
-                fg="yellow",
-                bg="#1a1a1a",
-            )
-            no_games.pack(pady=20)
-
-        # Create scrollable frame for games
-        canvas = tk.Canvas(self.current_frame, bg="#1a1a1a", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.current_frame, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#1a1a1a")
-
-        scrollable_frame.bind(
-            "<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Shown only while no game is installed
+        self.no_games = tk.Label(
+            frame,
+            text=localization.translate("no_games"),
+            font=("Arial", 12),
+            fg="yellow",
+            bg="#1a1a1a",
         )
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Search box, filters the list on every keystroke
+        self.search_frame = tk.Frame(frame, bg="#1a1a1a")
+        self.search_frame.pack(fill=tk.X, padx=5)
+        search_label = tk.Label(self.search_frame, text=localization.translate("search") + ":", fg="white", bg="#1a1a1a")
+        search_label.pack(side=tk.LEFT, padx=5)
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(self.search_frame, textvariable=self.search_var, font=("Arial", 12))
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.search_var.trace_add("write", lambda *args: self._filter_games(self.search_var.get()))
 
-        for game in games:
-            GameButton(scrollable_frame, game, self.launch_game, localization.language)
-
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=10)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Virtualized list: only the visible rows are built
+        self.game_list = GameList(frame, self.launch_game)
+        self.game_list.pack()
 
         # Bottom buttons
-        button_frame = tk.Frame(self.current_frame, bg="#1a1a1a")
+        button_frame = tk.Frame(frame, bg="#1a1a1a")
         button_frame.pack(fill=tk.X, pady=10)
 
         install_btn = tk.Button(
@@ -301,44 +513,75 @@ class MainMenu:
         )
         back_btn.pack(side=tk.BOTTOM, pady=5)
 
-    def launch_game(self, game_data: dict):
-        """Launch a game."""
-        game_name = game_data["name"]
-        game_path = Path(game_data["path"])
-
-        try:
-            # Import game module - always use main.py as entry point
-            module_path = game_path / "main.py"
-
-            if not module_path.exists():
-                messagebox.showerror(localization.translate("error"), f"Game entry point not found: {module_path}")
-                return
+    def _refresh_main_menu(self):
+        """Update the user name and game list after the user or the installed games changed."""
+        self.user_info.configure(text=f"{localization.translate('username')}: {self.current_user['username']}")
+        games = launcher.get_games(self.search_var.get())
+        if not games and not self.search_var.get().strip():
+            self.no_games.pack(pady=20, before=self.search_frame)
+        else:
+            self.no_games.pack_forget()
+        self.game_list.set_games(games)
 
-            # Load and execute game
-            spec = importlib.util.spec_from_file_location(game_name, module_path)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[game_name] = module
-            spec.loader.exec_module(module)
+    def _filter_games(self, query: str):
+        """Show only the games matching the search query, in catalog order."""
+        if self.game_list:
+            self.game_list.set_games(launcher.get_games(query))
 
-            # Run game with current language
-            if hasattr(module, "main"):
-                score = module.main(self.current_user["id"], localization.language)
+    def launch_game(self, game_data: dict):
+        """Launch a game."""
+        if self.running_game is not None:
+            messagebox.showinfo(localization.translate("menu_start_game"), localization.translate("game_running"))
+            return
 
-                # Update statistics
-                db.update_game_stats(self.current_user["id"], game_name, score, 0)
+        # pygame games render into the launcher window instead of opening their own
+        embed = game_data.get("runner") != "inprocess"
+        self.running_game = launcher.start_game(game_data["name"], embed=embed)
+        if embed and self.running_game.result is None:
+            self.screens.show("play")
+            self.game_view.attach(self.running_game)
+        self._poll_game_session()
+
+    def _build_game_view(self, frame: tk.Frame):
+        """Build the screen embedded games are shown on."""
+        self.game_view = GameView(frame)
+        self.game_view.pack()
+        quit_btn = tk.Button(
+            frame,
+            text=localization.translate("quit_game"),
+            command=self.game_view.close_game,
+            font=("Arial", 11),
+            bg="#666666",
+            fg="white",
+            width=15,
+        )
+        quit_btn.pack(pady=5)
 
-                messagebox.showinfo(localization.translate("success"), f"Final Score: {score}")
-            else:
-                messagebox.showerror(localization.translate("error"), f"Game has no 'main' function")
+    def _poll_game_session(self):
+        """Check the running game without blocking the Tk loop."""
+        result = self.running_game.poll()
+        if result is None:
+            self.root.after(SESSION_POLL_MS, self._poll_game_session)
+            return
 
-            # Refresh menu
+        self.running_game = None
+        if self.screens.current == "play":
+            self.game_view.detach()
+            self.root.geometry(WINDOW_GEOMETRY)
             self.show_main_menu()
+        if result.get("error"):
+            messagebox.showerror(localization.translate("error"), f"Error launching game:\n{result['error']}")
+            return
+
+        messagebox.showinfo(localization.translate("success"), f"Final Score: {result['score']}")
 
-        except Exception as e:
-            messagebox.showerror(localization.translate("error"), f"Error launching game:\n{str(e)}")
+        # Refresh menu
+        self.show_main_menu()
 
     def install_game(self):
         """Install a game from ZIP."""
+        from tkinter import filedialog
+
         zip_path = filedialog.askopenfilename(
             title=localization.translate("select_zip"), filetypes=[("ZIP files", "*.zip"), ("All files", "*.*")]
         )
@@ -346,16 +589,68 @@ class MainMenu:
         if not zip_path:
             return
 
-        success, message = game_manager.install_game_from_zip(zip_path)
-        if success:
-            messagebox.showinfo(localization.translate("success"), message)
-            self.show_main_menu()
-        else:
-            messagebox.showerror(localization.translate("error"), message)
+        if self.install_task is not None:
+            messagebox.showinfo(localization.translate("menu_install_game"), localization.translate("installing"))
+            return
+
+        from tkinter import ttk
+
+        # Progress dialog; the install itself runs on a worker thread
+        dialog = tk.Toplevel(self.root)
+        dialog.title(localization.translate("menu_install_game"))
+        dialog.geometry("360x160")
+        dialog.configure(bg="#1a1a1a")
+
+        phase_label = tk.Label(dialog, text=localization.translate("installing"), fg="white", bg="#1a1a1a")
+        phase_label.pack(pady=(15, 5))
+        progress_bar = ttk.Progressbar(dialog, orient=tk.HORIZONTAL, length=300, mode="determinate")
+        progress_bar.pack(pady=5)
+        detail_label = tk.Label(dialog, text="", fg="#cccccc", bg="#1a1a1a")
+        detail_label.pack(pady=5)
+
+        self.install_task = launcher.start_install(zip_path)
+        task = self.install_task
+        cancel_btn = tk.Button(
+            dialog, text=localization.translate("cancel"), command=task.cancel, bg="#666666", fg="white"
+        )
+        cancel_btn.pack(pady=5)
+        dialog.protocol("WM_DELETE_WINDOW", task.cancel)
+
+        def poll():
+            progress = task.poll()
+            if progress:
+                phase_label.configure(text=localization.translate(f"install_{progress['phase']}"))
+                if progress["bytes_total"]:
+                    progress_bar.configure(maximum=progress["bytes_total"], value=progress["bytes_done"])
+                    detail_label.configure(
+                        text=f"{progress['files_done']}/{progress['files_total']} · "
+                        f"{progress['bytes_done'] / 1048576:.1f}/{progress['bytes_total'] / 1048576:.1f} MB"
+                    )
+                if progress["phase"] in ("activating", "thumbnails"):
+                    # Past the point of no return
+                    cancel_btn.configure(state=tk.DISABLED)
+            if not task.is_done():
+                self.root.after(INSTALL_POLL_MS, poll)
+                return
+
+            self.install_task = None
+            dialog.destroy()
+            success, message = task.result
+            if success:
+                messagebox.showinfo(localization.translate("success"), message)
+            elif task.cancel_event.is_set():
+                messagebox.showinfo(localization.translate("menu_install_game"), localization.translate("install_cancelled"))
+            else:
+                messagebox.showerror(localization.translate("error"), message)
+            # Picks up the new game through the catalog revision
+            if self.screens.current == "games":
+                self.show_main_menu()
+
+        self.root.after(INSTALL_POLL_MS, poll)
 
     def show_stats(self):
         """Show user statistics."""
-        stats = db.get_user_game_stats(self.current_user["id"])
+        stats = launcher.get_report()
 
         if not stats:
             messagebox.showinfo(localization.translate("menu_user_stats"), "No statistics available yet")
@@ -365,10 +660,55 @@ class MainMenu:
         for stat in stats:
             stats_text += f"{stat['game_name'].upper()}\n"
             stats_text += f"  {localization.translate('high_score')}: {stat['high_score']}\n"
-            stats_text += f"  {localization.translate('times_played')}: {stat['times_played']}\n\n"
+            stats_text += f"  {localization.translate('times_played')}: {stat['times_played']}\n"
+            minutes, seconds = divmod(stat["total_playtime"] or 0, 60)
+            stats_text += f"  {localization.translate('total_playtime')}: {minutes}m {seconds:02d}s\n"
+            session = stat["sessions"]
+            if session and session["avg_first_frame_ms"] is not None:
+                stats_text += f"  {localization.translate('load_time')}: {session['avg_first_frame_ms']:.0f} ms\n"
+                stats_text += (
+                    f"  {localization.translate('frame_time')}: p95 {session['avg_p95_ms']:.1f} ms, "
+                    f"{session['avg_fps']:.0f} FPS, {session['dropped_frames']} {localization.translate('dropped_frames')}\n"
+                )
+            stats_text += "\n"
 
-        messagebox.showinfo(localization.translate("menu_user_stats"), stats_text)
+        dialog = tk.Toplevel(self.root)
+        dialog.title(localization.translate("menu_user_stats"))
+        dialog.configure(bg="#1a1a1a")
+
+        label = tk.Label(dialog, text=stats_text, justify=tk.LEFT, font=("Arial", 11), fg="white", bg="#1a1a1a")
+        label.pack(padx=20, pady=10)
+
+        button_frame = tk.Frame(dialog, bg="#1a1a1a")
+        button_frame.pack(pady=10)
+        export_btn = tk.Button(
+            button_frame, text=localization.translate("export_report"), command=self.export_report, bg="#ff9900", fg="white"
+        )
+        export_btn.pack(side=tk.LEFT, padx=5)
+        close_btn = tk.Button(
+            button_frame, text=localization.translate("close"), command=dialog.destroy, bg="#666666", fg="white"
+        )
+        close_btn.pack(side=tk.LEFT, padx=5)
 
+    def export_report(self):
+        """Export every recorded session of the current user to a CSV file."""
+        from tkinter import filedialog
+
+        path = filedialog.asksaveasfilename(
+            title=localization.translate("export_report"),
+            defaultextension=".csv",
+            initialfile=f"omnigames_sessions_{self.current_user['username']}.csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+
+        try:
+            count = launcher.export_report(Path(path), self.current_user["id"])
+        except OSError as e:
+            messagebox.showerror(localization.translate("error"), str(e))
+            return
+        messagebox.showinfo(localization.translate("success"), f"{localization.translate('report_exported')}: {count}")
 
 def main():
     """Main entry point for the menu."""
@@ -0,0 +1,79 @@
+"""Retained screens for the omniGames window."""
+
+import tkinter as tk
+from typing import Callable, Dict, Hashable, Optional
+
+
+class Screen:
+    """A widget tree that is built once and kept alive while hidden."""
+
+    def __init__(
+        self,
+        build: Callable[[tk.Frame], None],
+        refresh: Optional[Callable[[], None]] = None,
+        revision: Optional[Callable[[], Hashable]] = None,
+    ):
+        """
+        Initialize screen.
+        build fills a new frame with widgets; refresh updates the data-bound
+        widgets and runs only when revision() differs from the last refresh.
+        """
+        self.build = build
+        self.refresh = refresh
+        self.revision = revision
+        self.frame: Optional[tk.Frame] = None
+        self.rendered_revision: Hashable = None
+
+
+class ScreenManager:
+    """Switch between retained screens instead of destroying and rebuilding them."""
+
+    def __init__(self, root, bg: str = "#1a1a1a"):
+        """Initialize screen manager."""
+        self.root = root
+        self.bg = bg
+        self.screens: Dict[str, Screen] = {}
+        self.current: Optional[str] = None
+
+    def register(
+        self,
+        name: str,
+        build: Callable[[tk.Frame], None],
+        refresh: Optional[Callable[[], None]] = None,
+        revision: Optional[Callable[[], Hashable]] = None,
+    ) -> None:
+        """Register a screen; it is built the first time it is shown."""
+        self.screens[name] = Screen(build, refresh, revision)
+
+    def show(self, name: str) -> None:
+        """Show a screen, building it on first use and refreshing it if its data changed."""
+        screen = self.screens[name]
+        if screen.frame is None:
+            screen.frame = tk.Frame(self.root, bg=self.bg)
+            screen.build(screen.frame)
+            screen.rendered_revision = None
+        self.update(name)
+
+        if self.current != name:
+            if self.current is not None and self.screens[self.current].frame is not None:
+                self.screens[self.current].frame.pack_forget()
+            screen.frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            self.current = name
+
+    def update(self, name: str, force: bool = False) -> None:
+        """Refresh a built screen's data-bound widgets if its data changed."""
+        screen = self.screens[name]
+        if screen.frame is None or screen.refresh is None:
+            return
+        revision = screen.revision() if screen.revision else object()
+        if force or revision != screen.rendered_revision:
+            screen.refresh()
+            screen.rendered_revision = revision
+
+    def invalidate(self) -> None:
+        """Destroy every screen, e.g. after a language change; they are rebuilt when next shown."""
+        for screen in self.screens.values():
+            if screen.frame is not None:
+                screen.frame.destroy()
+                screen.frame = None
+        self.current = None
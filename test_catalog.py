@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Test the game catalog search index."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from omnigames.core.catalog import CatalogIndex
+
+
+def _catalog() -> CatalogIndex:
+    """Build a small catalog."""
+    catalog = CatalogIndex()
+    catalog.add(
+        {"name": "snake", "title": "Snake", "description": "Eat the food and grow", "author": "omni", "version": "1.2"},
+        {"es": {"game_description": "Come la comida y crece"}},
+    )
+    catalog.add({"name": "pong", "title": "Pong", "description": "Classic paddle game", "author": "atari fan"})
+    catalog.add(
+        {"name": "memory", "title": "Memory", "description": "Match pairs of cards", "author": "omni"},
+        {"fr": {"game_title": "Mémoire"}},
+    )
+    return catalog
+
+
+def test_prefix_search_sorted_by_title():
+    """Partially typed words match as prefixes; results are sorted by title."""
+    catalog = _catalog()
+    assert catalog.search("sna") == ["snake"]
+    assert catalog.search("omni") == ["memory", "snake"]
+    assert catalog.search("") == ["memory", "pong", "snake"]
+
+
+def test_every_word_must_match():
+    """Words are combined with AND."""
+    catalog = _catalog()
+    assert catalog.search("omni pairs") == ["memory"]
+    assert catalog.search("omni paddle") == []
+
+
+def test_field_and_language_qualifiers():
+    """field:value and lang:xx restrict matches."""
+    catalog = _catalog()
+    assert catalog.search("author:omni") == ["memory", "snake"]
+    assert catalog.search("version:1.2") == ["snake"]
+    assert catalog.search("lang:es") == ["snake"]
+
+
+def test_locales_and_accents_are_indexed():
+    """Locale descriptions are searchable, and accents are ignored."""
+    catalog = _catalog()
+    assert catalog.search("comida") == ["snake"]
+    assert catalog.search("memoire") == ["memory"]
+
+
+def test_reindex_and_remove():
+    """Re-adding a game replaces its terms; removed games no longer match."""
+    catalog = _catalog()
+    catalog.add({"name": "pong", "title": "Pong", "description": "Tennis for two"})
+    assert catalog.search("paddle") == []
+    assert catalog.search("tennis") == ["pong"]
+    catalog.remove("pong")
+    assert catalog.search("tennis") == []
+    assert "pong" not in catalog
+    assert len(catalog) == 2
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Test the frame profiler's rolling histogram."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from omnigames.core.profiler import RollingHistogram
+from omnigames.core.telemetry import BUCKET_MS
+
+MS = 1_000_000
+
+
+def test_mean_and_percentiles():
+    """Mean is exact; percentiles report the upper edge of their bucket."""
+    histogram = RollingHistogram(window=100)
+    for _ in range(99):
+        histogram.add(2 * MS)
+    histogram.add(20 * MS)
+    assert abs(histogram.mean_ms() - 2.18) < 1e-9
+    assert histogram.percentile(0.5) == 2 + BUCKET_MS
+    assert histogram.percentile(0.99) == 2 + BUCKET_MS
+    assert histogram.percentile(1.0) == 20 + BUCKET_MS
+
+
+def test_window_forgets_oldest_samples():
+    """Once the window is full, each new sample replaces the oldest one."""
+    histogram = RollingHistogram(window=4)
+    for _ in range(4):
+        histogram.add(10 * MS)
+    for _ in range(4):
+        histogram.add(1 * MS)
+    assert histogram.count == 4
+    assert abs(histogram.mean_ms() - 1.0) < 1e-9
+    assert histogram.percentile(1.0) == 1 + BUCKET_MS
+    assert sum(histogram.buckets) == 4
+
+
+def test_empty_histogram():
+    """An empty histogram reports zeros."""
+    histogram = RollingHistogram(window=8)
+    assert histogram.mean_ms() == 0.0
+    assert histogram.percentile(0.99) == 0.0
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
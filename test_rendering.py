@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Test cached static layers and dirty-rectangle rendering."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from omnigames.core.rendering import DirtyRenderer, LayerStack, StaticLayer
+
+BACKGROUND = (0, 0, 0)
+WHITE = (255, 255, 255)
+
+
+def _renderer(size=(200, 200)) -> DirtyRenderer:
+    """Renderer over a fresh screen, after its first (full) flush."""
+    pygame.display.init()
+    screen = pygame.display.set_mode(size)
+    renderer = DirtyRenderer(screen, BACKGROUND)
+    renderer.draw_rect("box", WHITE, (10, 10, 20, 20))
+    assert renderer.flush() is None
+    return renderer
+
+
+def test_unchanged_frame_has_no_dirty_rects():
+    """Declaring the same items again changes nothing."""
+    renderer = _renderer()
+    renderer.draw_rect("box", WHITE, (10, 10, 20, 20))
+    assert renderer.flush() == []
+
+
+def test_moved_item_dirties_old_and_new_area():
+    """A moved item restores its old area and draws its new one."""
+    renderer = _renderer()
+    renderer.draw_rect("box", WHITE, (50, 50, 20, 20))
+    dirty = renderer.flush()
+    assert sorted(tuple(rect) for rect in dirty) == [(10, 10, 20, 20), (50, 50, 20, 20)]
+    screen = renderer.screen
+    assert screen.get_at((15, 15))[:3] == BACKGROUND
+    assert screen.get_at((55, 55))[:3] == WHITE
+
+
+def test_overlapping_rects_are_merged():
+    """A small move dirties one merged rectangle."""
+    renderer = _renderer()
+    renderer.draw_rect("box", WHITE, (15, 10, 20, 20))
+    assert [tuple(rect) for rect in renderer.flush()] == [(10, 10, 25, 20)]
+
+
+def test_removed_item_and_invalidate():
+    """Items no longer declared are erased; invalidate() adds an area."""
+    renderer = _renderer()
+    renderer.invalidate((100, 100, 5, 5))
+    dirty = renderer.flush()
+    assert sorted(tuple(rect) for rect in dirty) == [(10, 10, 20, 20), (100, 100, 5, 5)]
+    assert renderer.screen.get_at((15, 15))[:3] == BACKGROUND
+
+
+def test_large_change_falls_back_to_full_redraw():
+    """Changing more than the threshold redraws the whole screen."""
+    renderer = _renderer()
+    renderer.draw_rect("box", WHITE, (0, 0, 200, 150))
+    assert renderer.flush() is None
+    renderer.draw_rect("box", WHITE, (0, 0, 200, 150))
+    renderer.invalidate()
+    assert renderer.flush() is None
+
+
+def _counting_layer(color, opaque=False):
+    """A layer that fills itself with color and counts how often it was drawn."""
+    calls = []
+
+    def draw(surface, theme):
+        calls.append(theme)
+        surface.fill(color)
+
+    return StaticLayer(draw, opaque), calls
+
+
+def test_static_layer_redraws_only_on_size_or_theme_change():
+    """A layer keeps its surface until it is requested with another size or theme."""
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    layer, calls = _counting_layer(WHITE, opaque=True)
+    first = layer.get((50, 50), "light")
+    assert layer.get((50, 50), "light") is first
+    assert calls == ["light"]
+    layer.get((50, 50), "dark")
+    layer.get((60, 60), "dark")
+    assert calls == ["light", "dark", "dark"]
+    assert layer.version == 3
+
+
+def test_layer_stack_recomposes_only_when_a_layer_changed():
+    """The flattened surface is reused until a layer is drawn again."""
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    bottom, _ = _counting_layer(BACKGROUND, opaque=True)
+    top, _ = _counting_layer((255, 0, 0, 255))
+    stack = LayerStack(bottom, top)
+    composed = stack.compose((40, 40))
+    assert composed.get_at((5, 5))[:3] == (255, 0, 0)
+    assert stack.compose((40, 40)) is composed
+    assert stack.compose((40, 40), "dark") is not composed
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
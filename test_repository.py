@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Test the package repository client against the local repository server."""
+
+import json
+import sys
+import tempfile
+import time
+import urllib.request
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from omnigames.core.game_manager import GameManager
+from omnigames.core.repository import (
+    REPOSITORY_INDEX,
+    PackageRepository,
+    RepositoryServer,
+    build_repository_index,
+    file_sha256,
+)
+
+
+def _write_package(directory: Path, name: str, version: str, padding: int = 0) -> Path:
+    """Write a game ZIP; padding adds incompressible bytes so downloads can be split."""
+    zip_path = directory / f"{name}.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zip_ref:
+        zip_ref.writestr(f"{name}/game.json", json.dumps({"name": name, "title": name.title(), "version": version}))
+        zip_ref.writestr(f"{name}/data.bin", bytes(range(256)) * (padding // 256))
+    return zip_path
+
+
+def _package(catalog: dict, name: str) -> dict:
+    """Find a package entry in a catalog."""
+    return next(package for package in catalog["packages"] if package["name"] == name)
+
+
+def test_download_verifies_checksum():
+    """A download matching the index hash is kept; a mismatch is discarded."""
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache:
+        source, cache = Path(source), Path(cache)
+        _write_package(source, "snake", "1.0")
+        build_repository_index(source)
+        with RepositoryServer(source) as server:
+            repository = PackageRepository(server.url, cache_path=cache)
+            catalog, changed = repository.fetch_catalog()
+            assert changed
+            package = _package(catalog, "snake")
+
+            success, path = repository.download(package)
+            assert success
+            assert file_sha256(Path(path)) == package["sha256"]
+
+            Path(path).unlink()
+            success, message = repository.download(dict(package, sha256="0" * 64))
+            assert not success
+            assert "Checksum mismatch" in message
+            assert not (cache / "downloads" / "snake.zip.part").exists()
+
+            # The catalog is revalidated with its ETag and not downloaded again
+            assert repository.fetch_catalog()[1] is False
+
+
+def test_download_resumes_partial_file():
+    """A partial download continues from its .part file with a Range request."""
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache:
+        source, cache = Path(source), Path(cache)
+        zip_path = _write_package(source, "pong", "1.0", padding=256 * 1024)
+        build_repository_index(source)
+        data = zip_path.read_bytes()
+        with RepositoryServer(source) as server:
+            repository = PackageRepository(server.url, cache_path=cache)
+            package = _package(repository.fetch_catalog()[0], "pong")
+
+            downloads = cache / "downloads"
+            downloads.mkdir(parents=True)
+            half = len(data) // 2
+            (downloads / "pong.zip.part").write_bytes(data[:half])
+
+            responses = []
+            urlopen = urllib.request.urlopen
+
+            def recording_urlopen(request, *args, **kwargs):
+                response = urlopen(request, *args, **kwargs)
+                responses.append((request.get_header("Range"), response.status, response.headers["Content-Length"]))
+                return response
+
+            urllib.request.urlopen = recording_urlopen
+            try:
+                success, path = repository.download(package)
+            finally:
+                urllib.request.urlopen = urlopen
+            assert success
+            assert responses == [(f"bytes={half}-", 206, str(len(data) - half))]
+            assert Path(path).read_bytes() == data
+            assert not (downloads / "pong.zip.part").exists()
+
+
+def test_download_restarts_when_package_changed():
+    """If-Range makes a stale partial file restart instead of mixing two versions."""
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache:
+        source, cache = Path(source), Path(cache)
+        zip_path = _write_package(source, "memory", "1.0", padding=64 * 1024)
+        build_repository_index(source)
+        with RepositoryServer(source) as server:
+            repository = PackageRepository(server.url, cache_path=cache)
+            package = _package(repository.fetch_catalog()[0], "memory")
+            downloads = cache / "downloads"
+            downloads.mkdir(parents=True)
+            (downloads / "memory.zip.part").write_bytes(b"x" * 1000)
+            (downloads / "memory.zip.etag").write_text('"stale"', encoding="utf-8")
+
+            success, path = repository.download(package)
+            assert success
+            assert Path(path).read_bytes() == zip_path.read_bytes()
+
+
+def test_unsafe_file_names_are_rejected():
+    """Package file names from the index must be plain base names."""
+    with tempfile.TemporaryDirectory() as cache:
+        repository = PackageRepository("http://127.0.0.1:9/", cache_path=Path(cache))
+        for name in ["../x.zip", "../../x.zip", "/tmp/x.zip", "sub/x.zip", "..", ""]:
+            success, message = repository.download({"name": "x", "file": name})
+            assert not success, name
+            assert "Invalid package file name" in message
+
+
+def test_index_rebuild_sees_new_and_replaced_zips():
+    """Rebuilding an index kept outside the source folder picks up new and replaced ZIPs."""
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as cache:
+        source, cache = Path(source), Path(cache)
+        index_path = cache / REPOSITORY_INDEX
+        _write_package(source, "snake", "1.0")
+        first = build_repository_index(source, index_path)
+        assert not (source / REPOSITORY_INDEX).exists()
+
+        time.sleep(0.01)
+        replaced = _write_package(source, "snake", "2.0")
+        _write_package(source, "pong", "1.0")
+        second = build_repository_index(source, index_path)
+        assert sorted(package["name"] for package in second["packages"]) == ["pong", "snake"]
+        snake = _package(second, "snake")
+        assert snake["version"] == "2.0"
+        assert snake["sha256"] == file_sha256(replaced) != _package(first, "snake")["sha256"]
+
+
+class _RecordingManager:
+    """Stands in for the game manager and records what it was asked to install."""
+
+    def __init__(self):
+        """Initialize with nothing installed."""
+        self.installed = []
+
+    def is_game_installed(self, game_name: str) -> bool:
+        """Nothing is installed yet."""
+        return False
+
+    def install_game_from_zip(self, zip_path: str):
+        """Record the install."""
+        self.installed.append(zip_path)
+        return True, "installed"
+
+
+def test_traversal_game_names_are_rejected():
+    """A manifest name that is a path is refused by sync and by the installer."""
+    with tempfile.TemporaryDirectory() as source, tempfile.TemporaryDirectory() as work:
+        source, work = Path(source), Path(work)
+        for name in ["../escape", "/tmp/escape"]:
+            zip_path = source / "evil.zip"
+            with zipfile.ZipFile(zip_path, "w") as zip_ref:
+                zip_ref.writestr("evil/game.json", json.dumps({"name": name, "version": "1.0"}))
+            build_repository_index(source)
+            with RepositoryServer(source) as server:
+                manager = _RecordingManager()
+                repository = PackageRepository(server.url, cache_path=work / "cache")
+                assert repository.sync(manager) == [(name, False, f"Invalid game name in index: {name!r}")]
+                assert manager.installed == []
+
+            game_manager = GameManager()
+            game_manager.games_path = work / "games"
+            game_manager.games_path.mkdir(exist_ok=True)
+            success, message = game_manager.install_game_from_zip(str(zip_path))
+            assert not success
+            assert "Invalid game name" in message
+            assert sorted(path.name for path in work.iterdir()) == ["cache", "games"]
+            assert list(game_manager.games_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
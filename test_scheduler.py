@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test the game-time timer and tween scheduler."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from omnigames.core.scheduler import Scheduler, ease_in_out
+
+STEP = 1.0 / 60
+
+
+def test_timers_fire_in_due_order():
+    """Timers fire by due time; timers due together fire in scheduling order."""
+    scheduler = Scheduler()
+    fired = []
+    scheduler.after(0.5, lambda: fired.append("late"))
+    scheduler.after(0.1, lambda: fired.append("early"))
+    scheduler.after(0.1, lambda: fired.append("early-second"))
+    scheduler.advance(0.05)
+    assert fired == []
+    scheduler.advance(1.0)
+    assert fired == ["early", "early-second", "late"]
+
+
+def test_repeating_timer_catches_up_and_cancels():
+    """every() fires once per interval, also across one large advance, until cancelled."""
+    scheduler = Scheduler()
+    ticks = []
+    timer = scheduler.every(0.25, lambda: ticks.append(scheduler.time))
+    scheduler.advance(1.0)
+    assert len(ticks) == 4
+    timer.cancel()
+    scheduler.advance(1.0)
+    assert len(ticks) == 4
+    assert scheduler.time_until_next() is None
+
+
+def test_cancelled_timer_never_fires():
+    """A cancelled one-shot timer is skipped."""
+    scheduler = Scheduler()
+    fired = []
+    timer = scheduler.after(0.2, lambda: fired.append(True))
+    timer.cancel()
+    scheduler.advance(1.0)
+    assert fired == []
+
+
+def test_time_until_next():
+    """time_until_next() reports the earliest live timer, ignoring cancelled ones."""
+    scheduler = Scheduler()
+    assert scheduler.time_until_next() is None
+    first = scheduler.after(0.3, lambda: None)
+    scheduler.after(0.8, lambda: None)
+    assert abs(scheduler.time_until_next() - 0.3) < 1e-9
+    scheduler.advance(0.1)
+    assert abs(scheduler.time_until_next() - 0.2) < 1e-9
+    first.cancel()
+    assert abs(scheduler.time_until_next() - 0.7) < 1e-9
+
+
+def test_tween_reaches_end_and_calls_on_done():
+    """A tween reports eased values, ends exactly on its end value and stops animating."""
+    scheduler = Scheduler()
+    values = []
+    done = []
+    scheduler.tween(0.1, values.append, 0.0, 10.0, ease_in_out, on_done=lambda: done.append(True))
+    assert scheduler.animating
+    for _ in range(12):
+        scheduler.advance(STEP)
+    assert values == sorted(values)
+    assert values[-1] == 10.0
+    assert done == [True]
+    assert not scheduler.animating
+
+
+def test_cancel_all():
+    """cancel_all() stops timers and tweens."""
+    scheduler = Scheduler()
+    fired = []
+    scheduler.after(0.1, lambda: fired.append("timer"))
+    scheduler.tween(0.1, lambda value: fired.append("tween"))
+    scheduler.cancel_all()
+    scheduler.advance(1.0)
+    assert fired == []
+    assert not scheduler.animating
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"[OK] {name}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Run every pygame game headless and check the simulation is clean and deterministic."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from omnigames.core.game_manager import game_manager
+from omnigames.core.launcher import launcher
+
+DURATION = 5.0
+SEED = 1234
+
+
+def _headless_games():
+    """Installed games that can run headless."""
+    return sorted(game["name"] for game in game_manager.get_installed_games() if game.get("runner") != "inprocess")
+
+
+def _simulate(game_name: str) -> dict:
+    """Simulate a game and check the run itself went well."""
+    result = launcher.simulate_game(game_name, duration=DURATION, seed=SEED)
+    assert result.get("error") is None, f"{game_name}: {result.get('error')}"
+    assert result["steps"] > 0, game_name
+    assert abs(result["game_seconds"] - DURATION) < 0.5, f"{game_name}: {result['game_seconds']}"
+    return result
+
+
+def test_headless_runs_are_clean_and_deterministic():
+    """Each game simulates without error, for the requested game time, and repeats exactly."""
+    games = _headless_games()
+    assert games
+    for game_name in games:
+        first = _simulate(game_name)
+        second = _simulate(game_name)
+        assert first["score"] == second["score"], game_name
+        assert first["steps"] == second["steps"], game_name
+
+
+if __name__ == "__main__":
+    for game_name in _headless_games():
+        result = _simulate(game_name)
+        print(
+            f"[OK] {game_name}: score={result['score']} steps={result['steps']} "
+            f"game_seconds={result['game_seconds']:.2f}"
+        )